@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures: random scenarios spanning the sidebar ranges in every analysis mode
+"""
+
+import numpy as np
+import pytest
+
+from fovi import ANALYSIS_MODES, PARAMETERS, Scenario
+
+
+def random_parameters(rng):
+    """One parameter dict drawn from the slider ranges (stepped parameters on their steps)"""
+    params = {}
+    for name, (_, min_val, max_val, step) in PARAMETERS.items():
+        if step:
+            params[name] = min_val + step * int(rng.integers(0, (max_val - min_val) // step + 1))
+        else:
+            params[name] = float(rng.uniform(min_val, max_val))
+    params['analysis_mode'] = ANALYSIS_MODES[int(rng.integers(len(ANALYSIS_MODES)))]
+    return params
+
+
+@pytest.fixture(scope='session')
+def scenarios():
+    """300 random Scenarios plus every mode at the defaults and at the range corners"""
+    rng = np.random.default_rng(2032)
+    params = [random_parameters(rng) for _ in range(300)]
+    for mode in ANALYSIS_MODES:
+        params.append({'analysis_mode': mode})
+        for corner in (1, 2):
+            params.append({**{name: spec[corner] for name, spec in PARAMETERS.items()}, 'analysis_mode': mode})
+    return [Scenario.from_dict(values) for values in params]
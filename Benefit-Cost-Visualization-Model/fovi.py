@@ -0,0 +1,530 @@
+"""
+FOVI Engine
+Headless scenario evaluation for the Florida Olympic Viability Index - the same
+calculations as the Streamlit dashboard without importing Streamlit, pandas or Plotly
+"""
+
+import math
+from dataclasses import asdict, dataclass, fields
+
+from fovi_discount import annuity_pv, linear_annuity_pv
+
+# Fixed model inputs used by the dashboard pipeline
+CURRENT_YEAR = 2024
+MEDIAN_HOME_VALUE = 306000
+TOTAL_PROPERTIES = 10_000_000
+PROPERTY_TAX_RATE = 0.015
+CONSTRUCTION_SALES_TAX_RATE = 0.06
+CORPORATE_CONSTRUCTION_TAX = 150
+BENEFIT_YEARS = 20
+DEFAULT_INFLATION_RATE = 0.03
+DEFAULT_TOURISM_GROWTH_RATE = 0.025
+
+ANALYSIS_MODES = ["Basic Tourism Model", "Comprehensive Benefits Model", "Full Economic Impact"]
+
+# Sidebar parameters in sidebar units: (label, min, max, integer step or None)
+PARAMETERS = {
+    'olympic_year': ("Olympic Games Year", 2032, 2048, 2),
+    'inflation_rate': ("Inflation Rate (%)", 0.01, 0.05, None),
+    'tourism_growth_rate': ("Tourism Growth Rate (%)", 0.0, 0.05, None),
+    'baseline_visitors': ("Baseline Annual Visitors (millions)", 50.0, 200.0, None),
+    'uplift_pct': ("Visitor Uplift (%)", 0.0, 0.30, None),
+    'crowd_out_pct': ("Crowd-out Effect (%)", 0.0, 0.80, None),
+    'spend_per_visitor': ("Spend per Visitor ($)", 500, 5000, None),
+    'tax_rate': ("Effective Tax Rate (%)", 0.03, 0.12, None),
+    'legacy_uplift': ("Legacy Tourism Uplift (%)", 0.0, 0.30, None),
+    'legacy_years': ("Legacy Duration (years)", 3, 10, 1),
+    'property_appreciation': ("Property Appreciation (%)", 0.0, 0.30, None),
+    'affected_properties_pct': ("Properties Affected (%)", 0.01, 0.20, None),
+    'num_companies': ("Companies Relocated", 0, 1000, None),
+    'avg_corp_tax': ("Avg Tax per Company ($K/year)", 500, 5000, None),
+    'events_per_year': ("Major Events per Year", 0.0, 5.0, None),
+    'avg_event_tax': ("Avg Tax per Event ($M)", 10, 100, None),
+    'convention_baseline': ("Baseline Convention Revenue ($M/year)", 1000, 10000, None),
+    'convention_increase': ("Convention Increase (%)", 0.0, 1.0, None),
+    'public_spending': ("Public Spending ($M)", 5000, 20000, None),
+    'private_share': ("Private Investment Share (%)", 0.0, 0.70, None),
+    'gdp_multiplier': ("GDP Multiplier", 1.0, 3.0, None),
+    'employment_multiplier': ("Jobs per $1M", 5, 20, None),
+    'transit_benefits': ("Transit Benefits ($M/year)", 100, 1000, None),
+    'resilience_benefits': ("Resilience Benefits ($M/year)", 50, 500, None),
+    'incremental_costs': ("Incremental Costs ($M)", 1000, 8000, None),
+    'infrastructure_years': ("Infrastructure Horizon (years)", 10, 30, 1),
+    'net_migrants_annual': ("Net Migrants per Year", 1000, 50000, None),
+    'fiscal_contribution': ("Fiscal Contribution per Resident ($)", 500, 5000, None),
+    'migration_years': ("Migration Duration (years)", 5, 15, 1),
+    'discount_rate': ("Discount Rate (%)", 0.02, 0.08, None),
+}
+
+# Parameters only used by some analysis modes, and those that only feed GDP/jobs reporting
+TIMELINE_PARAMETERS = ['olympic_year', 'inflation_rate', 'tourism_growth_rate']
+COMPREHENSIVE_PARAMETERS = ['property_appreciation', 'affected_properties_pct', 'num_companies',
+                            'avg_corp_tax', 'events_per_year', 'avg_event_tax',
+                            'convention_baseline', 'convention_increase']
+REPORTING_PARAMETERS = ['gdp_multiplier', 'employment_multiplier']
+
+COMPONENTS = ['tourism', 'property', 'corporate', 'construction_tax',
+              'events', 'convention', 'infrastructure', 'migration']
+COMPREHENSIVE_COMPONENTS = ['property', 'corporate', 'construction_tax', 'events', 'convention']
+
+# Parameter -> component dependency graph: the Scenario fields each calculator reads.
+# Timeline fields only count in Full Economic Impact mode (see timeline())
+COMPONENT_INPUTS = {
+    'tourism': ['baseline_visitors', 'uplift_pct', 'crowd_out_pct', 'spend_per_visitor', 'tax_rate',
+                'legacy_years', 'legacy_uplift', 'discount_rate', 'olympic_year', 'inflation_rate',
+                'tourism_growth_rate'],
+    'property': ['property_appreciation', 'affected_properties_pct', 'discount_rate', 'olympic_year'],
+    'corporate': ['num_companies', 'avg_corp_tax', 'discount_rate', 'olympic_year'],
+    'construction_tax': ['public_spending', 'discount_rate', 'olympic_year'],
+    'events': ['events_per_year', 'avg_event_tax', 'discount_rate', 'olympic_year'],
+    'convention': ['convention_baseline', 'convention_increase', 'tax_rate', 'discount_rate', 'olympic_year'],
+    'infrastructure': ['transit_benefits', 'resilience_benefits', 'incremental_costs', 'infrastructure_years',
+                       'discount_rate', 'olympic_year'],
+    'migration': ['net_migrants_annual', 'fiscal_contribution', 'migration_years', 'discount_rate',
+                  'olympic_year'],
+}
+# Fields summarize() reads besides the component results
+SUMMARY_INPUTS = ['public_spending', 'private_share', 'gdp_multiplier', 'employment_multiplier', 'analysis_mode']
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    One set of sidebar inputs, in sidebar units (visitors in millions, corporate tax in $K)
+    Defaults are the dashboard defaults
+    """
+    analysis_mode: str = "Full Economic Impact"
+    olympic_year: int = 2036
+    inflation_rate: float = 0.03
+    tourism_growth_rate: float = 0.025
+    baseline_visitors: float = 140.0
+    uplift_pct: float = 0.10
+    crowd_out_pct: float = 0.50
+    spend_per_visitor: float = 1200
+    tax_rate: float = 0.065
+    legacy_uplift: float = 0.15
+    legacy_years: int = 5
+    property_appreciation: float = 0.10
+    affected_properties_pct: float = 0.05
+    num_companies: float = 200
+    avg_corp_tax: float = 2000
+    events_per_year: float = 0.5
+    avg_event_tax: float = 35
+    convention_baseline: float = 3000
+    convention_increase: float = 0.30
+    public_spending: float = 10000
+    private_share: float = 0.30
+    gdp_multiplier: float = 1.8
+    employment_multiplier: float = 12
+    transit_benefits: float = 350
+    resilience_benefits: float = 150
+    incremental_costs: float = 3000
+    infrastructure_years: int = 20
+    net_migrants_annual: float = 8000
+    fiscal_contribution: float = 1500
+    migration_years: int = 10
+    discount_rate: float = 0.045
+
+    def __post_init__(self):
+        if self.analysis_mode not in ANALYSIS_MODES:
+            raise ValueError(f"Unknown analysis mode: {self.analysis_mode!r}")
+
+    @property
+    def include_comprehensive(self):
+        return self.analysis_mode in ["Comprehensive Benefits Model", "Full Economic Impact"]
+
+    @property
+    def include_timeline(self):
+        return self.analysis_mode == "Full Economic Impact"
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a scenario from a mapping, coercing integer fields and rejecting unknown keys"""
+        known = {f.name: f for f in fields(cls)}
+        unknown = set(data) - set(known)
+        if unknown:
+            raise ValueError(f"Unknown scenario parameter(s): {sorted(unknown)}")
+        values = {}
+        for name, value in data.items():
+            if known[name].type in (int, float):
+                value = known[name].type(value)
+            values[name] = value
+        return cls(**values)
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def bcr_parameters(analysis_mode):
+    """Parameters that influence the BCR under the given analysis mode"""
+    excluded = set(REPORTING_PARAMETERS)
+    if analysis_mode != "Full Economic Impact":
+        excluded.update(TIMELINE_PARAMETERS)
+    if analysis_mode == "Basic Tourism Model":
+        excluded.update(COMPREHENSIVE_PARAMETERS)
+    return [name for name in PARAMETERS if name not in excluded]
+
+
+def default_parameters():
+    """Dashboard default values keyed by parameter name"""
+    return Scenario().to_dict()
+
+
+def calculate_comprehensive_tourism(baseline_visitors, uplift_pct, crowd_out_pct, spend_per_visitor,
+                                   tax_rate, legacy_years, legacy_uplift, discount_rate,
+                                   olympic_year, current_year, inflation_rate, tourism_growth_rate):
+    """
+    Enhanced tourism calculation with timeline and growth adjustments
+    """
+    years_until_games = olympic_year - current_year
+    
+    # Project baseline to Olympic year
+    future_baseline = baseline_visitors * ((1 + tourism_growth_rate) ** years_until_games)
+    future_spend = spend_per_visitor * ((1 + inflation_rate) ** years_until_games)
+    
+    # Games year calculation
+    games_uplift = future_baseline * uplift_pct
+    net_visitors = games_uplift * (1 - crowd_out_pct)
+    incremental_spending = net_visitors * future_spend
+    games_year_tax_nominal = (incremental_spending * tax_rate) / 1_000_000
+    
+    # Discount back to present
+    games_year_tax_pv = games_year_tax_nominal / ((1 + discount_rate) ** years_until_games)
+    
+    # Legacy visitors decay by exp(-0.2) a year while spend inflates - a geometric series
+    decay = math.exp(-0.2)
+    first_legacy_visitors = net_visitors * legacy_uplift * decay
+    first_legacy_tax = first_legacy_visitors * future_spend * (1 + inflation_rate) * tax_rate / 1_000_000
+    legacy_pv = annuity_pv(first_legacy_tax, discount_rate, years_until_games + 1, legacy_years,
+                           log_growth=-0.2 + math.log1p(inflation_rate))
+
+    # Per-year rows are the terms of the same series: term k is the first times ratio ** (k - 1)
+    first_legacy_pv = first_legacy_tax / (1 + discount_rate) ** (years_until_games + 1)
+    pv_ratio = decay * (1 + inflation_rate) / (1 + discount_rate)
+    legacy_breakdown = [{'Year': f'+{year}',
+                         'Visitors': first_legacy_visitors * decay ** (year - 1),
+                         'Tax_PV': first_legacy_pv * pv_ratio ** (year - 1)}
+                        for year in range(1, legacy_years + 1)]
+
+    return {
+        'games_year_tax_pv': games_year_tax_pv,
+        'games_year_tax_nominal': games_year_tax_nominal,
+        'legacy_pv': legacy_pv,
+        'total_tax_pv': games_year_tax_pv + legacy_pv,
+        'future_baseline': future_baseline,
+        'legacy_breakdown': legacy_breakdown
+    }
+
+def calculate_property_tax_benefits(median_home_value, total_properties, appreciation_pct,
+                                   affected_pct, property_tax_rate, olympic_year, current_year,
+                                   discount_rate, benefit_years):
+    """
+    Calculate property value appreciation and resulting tax revenue
+    Source: Barcelona (150% in Olympic zones), Atlanta (20-30% citywide), London (40% in Olympic boroughs)
+    """
+    years_until_games = olympic_year - current_year
+    
+    value_increase = (total_properties * affected_pct * median_home_value * appreciation_pct)
+    annual_tax_increase = (value_increase * property_tax_rate) / 1_000_000
+    
+    # Benefits start in Olympic year and continue
+    total_pv = annuity_pv(annual_tax_increase, discount_rate, years_until_games, benefit_years)
+    
+    return {
+        'annual_tax': annual_tax_increase,
+        'total_pv': total_pv,
+        'value_increase': value_increase / 1_000_000
+    }
+
+def calculate_corporate_relocation_benefits(num_companies, avg_tax_per_company, olympic_year,
+                                           current_year, discount_rate, benefit_years,
+                                           construction_tax_one_time):
+    """
+    Corporate relocations and business development
+    Source: Barcelona (500+ companies), Atlanta (300+ HQs), London (major financial services growth)
+    """
+    years_until_games = olympic_year - current_year
+    annual_corporate_tax = (num_companies * avg_tax_per_company) / 1_000_000
+    
+    # One-time construction phase tax (in Olympic year)
+    construction_pv = construction_tax_one_time / ((1 + discount_rate) ** years_until_games)
+    
+    # Ongoing annual tax, starting the year after the Olympics
+    ongoing_pv = annuity_pv(annual_corporate_tax, discount_rate, years_until_games + 1, benefit_years)
+    
+    return {
+        'annual_tax': annual_corporate_tax,
+        'total_pv': construction_pv + ongoing_pv,
+        'construction_pv': construction_pv,
+        'ongoing_pv': ongoing_pv
+    }
+
+def calculate_construction_sales_tax(public_spending, sales_tax_rate, olympic_year, current_year, discount_rate):
+    """
+    Sales tax revenue from construction spending - offsets public cost
+    This is REAL revenue Florida receives during construction
+    """
+    years_until_games = olympic_year - current_year
+    
+    # Spread construction over 6 years before Olympics
+    construction_start = max(0, years_until_games - 6)
+    annual_spending = public_spending / 6
+    annual_sales_tax = annual_spending * sales_tax_rate
+    
+    total_pv = annuity_pv(annual_sales_tax, discount_rate, construction_start, 6)
+    
+    return {
+        'total_tax': public_spending * sales_tax_rate,
+        'total_pv': total_pv
+    }
+
+def calculate_major_events_pipeline(events_per_year, avg_tax_per_event, olympic_year, current_year,
+                                   discount_rate, benefit_years):
+    """
+    Super Bowls, World Cups, NCAA championships enabled by Olympic venues
+    Source: Miami Super Bowl $572M impact, Tampa $407M impact, ~$35M tax revenue per event
+    """
+    years_until_games = olympic_year - current_year
+    
+    annual_revenue = (events_per_year * avg_tax_per_event)
+    total_pv = annuity_pv(annual_revenue, discount_rate, years_until_games + 1, benefit_years)
+    
+    return {
+        'annual_revenue': events_per_year * avg_tax_per_event,
+        'total_pv': total_pv,
+        'total_events': events_per_year * benefit_years
+    }
+
+def calculate_convention_business(baseline_convention_revenue, increase_pct, tax_rate, olympic_year,
+                                 current_year, discount_rate, benefit_years):
+    """
+    Convention and conference business growth
+    Source: Barcelona convention attendees 100K→2.5M (25x growth), Atlanta $1B+ annual impact
+    """
+    years_until_games = olympic_year - current_year
+    additional_revenue = baseline_convention_revenue * increase_pct
+    annual_tax = additional_revenue * tax_rate
+    
+    total_pv = annuity_pv(annual_tax, discount_rate, years_until_games + 1, benefit_years)
+    
+    return {
+        'annual_tax': annual_tax,
+        'total_pv': total_pv,
+        'additional_revenue': additional_revenue
+    }
+
+def calculate_economic_roi(public_spending, tax_benefit_pv, gdp_multiplier, employment_multiplier):
+    """Standard ROI calculation"""
+    roi = tax_benefit_pv / public_spending if public_spending > 0 else 0
+    gdp_impact = public_spending * gdp_multiplier
+    jobs_created = public_spending * employment_multiplier
+    
+    return {
+        'roi': roi,
+        'gdp_impact': gdp_impact,
+        'jobs_created': jobs_created
+    }
+
+def calculate_infrastructure_npv(transit_benefits, resilience_benefits, incremental_costs,
+                                years, discount_rate, olympic_year, current_year):
+    """Infrastructure NPV with proper timeline"""
+    years_until_games = olympic_year - current_year
+    annual_benefits = transit_benefits + resilience_benefits
+    
+    # Utilization ramps 0.3 + 0.035 * year for years 0-19 and stays at 1.0 afterwards
+    ramp_years = min(years + 1, 20)
+    benefits_pv = (linear_annuity_pv(0.3 * annual_benefits, 0.035 * annual_benefits, discount_rate,
+                                     years_until_games, ramp_years) +
+                   annuity_pv(annual_benefits, discount_rate, years_until_games + 20,
+                              max(0, years - 19)))
+    
+    # Costs: 30% for years 0-2, 10% for years 3-5, 2% from year 6
+    costs_pv = (annuity_pv(incremental_costs * 0.3, discount_rate, years_until_games, min(years + 1, 3)) +
+                annuity_pv(incremental_costs * 0.1, discount_rate, years_until_games + 3,
+                           min(max(0, years - 2), 3)) +
+                annuity_pv(incremental_costs * 0.02, discount_rate, years_until_games + 6,
+                           max(0, years - 5)))
+    
+    return {'npv': benefits_pv - costs_pv}
+
+def calculate_migration_value(net_migrants_annual, fiscal_contribution, years, discount_rate,
+                             olympic_year, current_year):
+    """Migration value with proper timeline"""
+    years_until_games = olympic_year - current_year
+    
+    # Cumulative migrants grow linearly, so contributions form an arithmetic series
+    annual_contribution = (net_migrants_annual * 1.05 * fiscal_contribution) / 1_000_000
+    total_pv = linear_annuity_pv(annual_contribution, annual_contribution, discount_rate,
+                                 years_until_games + 1, years)
+    
+    return {'total_pv': total_pv}
+
+def normalize_score(value, min_val, max_val):
+    """Normalize to [0,1]"""
+    if max_val == min_val:
+        return 0.5
+    normalized = (value - min_val) / (max_val - min_val)
+    return max(0, min(1, normalized))
+
+def calculate_bcr(total_benefits, total_costs):
+    """
+    Calculate Benefit-Cost Ratio (BCR)
+    BCR = Total Benefits / Total Costs
+    
+    Interpretation:
+    - BCR < 1.0: Not viable (costs exceed benefits)
+    - BCR = 1.0: Break-even
+    - BCR > 1.0: Viable (benefits exceed costs)
+    """
+    if total_costs <= 0:
+        return 0.0
+    return total_benefits / total_costs
+
+
+def timeline(scenario):
+    """(olympic_year, inflation_rate, tourism_growth_rate) - Games this year at default rates without the timeline"""
+    if scenario.include_timeline:
+        return scenario.olympic_year, scenario.inflation_rate, scenario.tourism_growth_rate
+    return CURRENT_YEAR, DEFAULT_INFLATION_RATE, DEFAULT_TOURISM_GROWTH_RATE
+
+
+def component_inputs(scenario, name):
+    """
+    Everything one component's calculator reads, as a tuple of values - equal tuples give
+    equal results, so a rerun can reuse the component when its tuple is unchanged
+    """
+    effective = dict(zip(TIMELINE_PARAMETERS, timeline(scenario)))
+    enabled = name not in COMPREHENSIVE_COMPONENTS or scenario.include_comprehensive
+    return (enabled,) + tuple(effective.get(field, getattr(scenario, field)) for field in COMPONENT_INPUTS[name])
+
+
+def dependent_components(names):
+    """Components whose calculators read any of the given parameters"""
+    names = set(names)
+    return [component for component in COMPONENTS if names & set(COMPONENT_INPUTS[component])]
+
+
+def calculate_components(scenario):
+    """
+    Run every calculator for a scenario, returning their result dicts keyed by component
+    Mirrors the analysis-mode switches in the dashboard's main()
+    """
+    olympic_year, inflation_rate, tourism_growth_rate = timeline(scenario)
+    current_year = CURRENT_YEAR
+    discount_rate = scenario.discount_rate
+
+    components = {
+        'tourism': calculate_comprehensive_tourism(
+            scenario.baseline_visitors * 1_000_000, scenario.uplift_pct, scenario.crowd_out_pct,
+            scenario.spend_per_visitor, scenario.tax_rate, scenario.legacy_years, scenario.legacy_uplift,
+            discount_rate, olympic_year, current_year, inflation_rate, tourism_growth_rate
+        )
+    }
+
+    if scenario.include_comprehensive:
+        components['property'] = calculate_property_tax_benefits(
+            MEDIAN_HOME_VALUE, TOTAL_PROPERTIES, scenario.property_appreciation,
+            scenario.affected_properties_pct, PROPERTY_TAX_RATE, olympic_year, current_year,
+            discount_rate, BENEFIT_YEARS
+        )
+        components['corporate'] = calculate_corporate_relocation_benefits(
+            scenario.num_companies, scenario.avg_corp_tax * 1000, olympic_year, current_year,
+            discount_rate, BENEFIT_YEARS, CORPORATE_CONSTRUCTION_TAX
+        )
+        components['construction_tax'] = calculate_construction_sales_tax(
+            scenario.public_spending, CONSTRUCTION_SALES_TAX_RATE, olympic_year, current_year, discount_rate
+        )
+        components['events'] = calculate_major_events_pipeline(
+            scenario.events_per_year, scenario.avg_event_tax, olympic_year, current_year,
+            discount_rate, BENEFIT_YEARS
+        )
+        components['convention'] = calculate_convention_business(
+            scenario.convention_baseline, scenario.convention_increase, scenario.tax_rate,
+            olympic_year, current_year, discount_rate, BENEFIT_YEARS
+        )
+    else:
+        components['property'] = {'total_pv': 0, 'annual_tax': 0, 'value_increase': 0}
+        components['corporate'] = {'total_pv': 0, 'annual_tax': 0}
+        components['construction_tax'] = {'total_pv': 0}
+        components['events'] = {'total_pv': 0, 'annual_revenue': 0}
+        components['convention'] = {'total_pv': 0, 'annual_tax': 0}
+
+    components['infrastructure'] = calculate_infrastructure_npv(
+        scenario.transit_benefits, scenario.resilience_benefits, scenario.incremental_costs,
+        scenario.infrastructure_years, discount_rate, olympic_year, current_year
+    )
+    components['migration'] = calculate_migration_value(
+        scenario.net_migrants_annual, scenario.fiscal_contribution, scenario.migration_years,
+        discount_rate, olympic_year, current_year
+    )
+    return components
+
+
+def component_pv(components, name):
+    """Present value of one component result ('npv' for infrastructure, 'total_tax_pv' for tourism)"""
+    result = components[name]
+    if name == 'tourism':
+        return result['total_tax_pv']
+    if name == 'infrastructure':
+        return result['npv']
+    return result['total_pv']
+
+
+def summarize(scenario, components):
+    """Totals, BCR and FOVI score from calculator results, as computed in the dashboard"""
+    pv = {name: component_pv(components, name) for name in COMPONENTS}
+
+    total_tax_benefits = (pv['tourism'] + pv['property'] + pv['corporate'] +
+                          pv['events'] + pv['convention'])
+    economic_results = calculate_economic_roi(
+        scenario.public_spending, total_tax_benefits, scenario.gdp_multiplier, scenario.employment_multiplier
+    )
+
+    total_benefits = (pv['tourism'] + pv['property'] + pv['corporate'] + pv['construction_tax'] +
+                      pv['events'] + pv['convention'] + pv['infrastructure'] + pv['migration'])
+    net_public_cost = (scenario.public_spending * (1 - scenario.private_share)) - pv['construction_tax']
+    net_fiscal_gain = total_benefits - net_public_cost
+    bcr = calculate_bcr(total_benefits, net_public_cost)
+
+    # Legacy FOVI calculation (for informational purposes only)
+    tourism_score = normalize_score(pv['tourism'], 0, 15000)
+    economic_score = normalize_score(economic_results['roi'], 0.5, 2.0)
+    infrastructure_score = normalize_score(pv['infrastructure'], 0, 10000)
+    migration_score = normalize_score(pv['migration'], 0, 5000)
+
+    if scenario.include_comprehensive:
+        enhanced_tourism_score = normalize_score(total_tax_benefits, 0, 20000)
+    else:
+        enhanced_tourism_score = tourism_score
+
+    fovi_score = (0.3 * enhanced_tourism_score +
+                  0.3 * economic_score +
+                  0.25 * infrastructure_score +
+                  0.15 * migration_score)
+
+    return {
+        'total_tax_benefits': total_tax_benefits,
+        'total_benefits': total_benefits,
+        'net_public_cost': net_public_cost,
+        'net_fiscal_gain': net_fiscal_gain,
+        'bcr': bcr,
+        'roi': economic_results['roi'],
+        'gdp_impact': economic_results['gdp_impact'],
+        'jobs_created': economic_results['jobs_created'],
+        'tourism_score': tourism_score,
+        'economic_score': economic_score,
+        'infrastructure_score': infrastructure_score,
+        'migration_score': migration_score,
+        'fovi_score': fovi_score
+    }
+
+
+def evaluate(scenario):
+    """
+    Evaluate one scenario - component present values plus the dashboard totals
+    (total_benefits, net_public_cost, net_fiscal_gain, bcr, fovi_score, ...)
+    """
+    components = calculate_components(scenario)
+    result = {name: component_pv(components, name) for name in COMPONENTS}
+    result.update(summarize(scenario, components))
+    return result
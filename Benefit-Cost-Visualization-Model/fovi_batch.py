@@ -0,0 +1,346 @@
+"""
+FOVI Batch Calculators
+Vectorized versions of the fovi calculate_* functions - every argument may be
+a scalar or an array with one element per scenario, and every result is an array.
+Complex inputs stay complex (fovi_gradients uses them for exact derivatives)
+"""
+
+import numpy as np
+
+from fovi import (ANALYSIS_MODES, BENEFIT_YEARS, CONSTRUCTION_SALES_TAX_RATE, CORPORATE_CONSTRUCTION_TAX,
+                  CURRENT_YEAR, DEFAULT_INFLATION_RATE, DEFAULT_TOURISM_GROWTH_RATE, MEDIAN_HOME_VALUE,
+                  PROPERTY_TAX_RATE, TOTAL_PROPERTIES, default_parameters)
+from fovi_discount import annuity_pv, linear_annuity_pv
+
+
+def _as_float(value):
+    """Float array (complex values are kept for complex-step derivatives)"""
+    value = np.asarray(value)
+    return value if value.dtype.kind == 'c' else value.astype(float)
+
+
+def _broadcast(*values):
+    """Broadcast scenario parameters to a common float shape"""
+    return np.broadcast_arrays(*[_as_float(v) for v in values])
+
+
+def batch_comprehensive_tourism(baseline_visitors, uplift_pct, crowd_out_pct, spend_per_visitor,
+                                tax_rate, legacy_years, legacy_uplift, discount_rate,
+                                olympic_year, current_year, inflation_rate, tourism_growth_rate):
+    """
+    Batch calculate_comprehensive_tourism (legacy_breakdown is not returned)
+    """
+    (baseline_visitors, uplift_pct, crowd_out_pct, spend_per_visitor, tax_rate, legacy_years,
+     legacy_uplift, discount_rate, olympic_year, current_year, inflation_rate,
+     tourism_growth_rate) = _broadcast(baseline_visitors, uplift_pct, crowd_out_pct, spend_per_visitor,
+                                       tax_rate, legacy_years, legacy_uplift, discount_rate,
+                                       olympic_year, current_year, inflation_rate, tourism_growth_rate)
+    years_until_games = olympic_year - current_year
+
+    future_baseline = baseline_visitors * ((1 + tourism_growth_rate) ** years_until_games)
+    future_spend = spend_per_visitor * ((1 + inflation_rate) ** years_until_games)
+
+    games_uplift = future_baseline * uplift_pct
+    net_visitors = games_uplift * (1 - crowd_out_pct)
+    incremental_spending = net_visitors * future_spend
+    games_year_tax_nominal = (incremental_spending * tax_rate) / 1_000_000
+    games_year_tax_pv = games_year_tax_nominal / ((1 + discount_rate) ** years_until_games)
+
+    # Legacy visitors decay by exp(-0.2) a year while spend inflates - a geometric series
+    first_legacy_tax = (net_visitors * legacy_uplift * np.exp(-0.2) * future_spend *
+                        (1 + inflation_rate) * tax_rate) / 1_000_000
+    legacy_pv = annuity_pv(first_legacy_tax, discount_rate, years_until_games + 1, legacy_years,
+                           log_growth=-0.2 + np.log1p(inflation_rate))
+
+    return {
+        'games_year_tax_pv': games_year_tax_pv,
+        'games_year_tax_nominal': games_year_tax_nominal,
+        'legacy_pv': legacy_pv,
+        'total_tax_pv': games_year_tax_pv + legacy_pv,
+        'future_baseline': future_baseline
+    }
+
+
+def batch_property_tax_benefits(median_home_value, total_properties, appreciation_pct,
+                                affected_pct, property_tax_rate, olympic_year, current_year,
+                                discount_rate, benefit_years):
+    """Batch calculate_property_tax_benefits"""
+    (median_home_value, total_properties, appreciation_pct, affected_pct, property_tax_rate,
+     olympic_year, current_year, discount_rate, benefit_years) = _broadcast(
+        median_home_value, total_properties, appreciation_pct, affected_pct, property_tax_rate,
+        olympic_year, current_year, discount_rate, benefit_years)
+    years_until_games = olympic_year - current_year
+
+    value_increase = (total_properties * affected_pct * median_home_value * appreciation_pct)
+    annual_tax_increase = (value_increase * property_tax_rate) / 1_000_000
+
+    # Benefits start in Olympic year and continue
+    total_pv = annuity_pv(annual_tax_increase, discount_rate, years_until_games, benefit_years)
+
+    return {
+        'annual_tax': annual_tax_increase,
+        'total_pv': total_pv,
+        'value_increase': value_increase / 1_000_000
+    }
+
+
+def batch_corporate_relocation_benefits(num_companies, avg_tax_per_company, olympic_year,
+                                        current_year, discount_rate, benefit_years,
+                                        construction_tax_one_time):
+    """Batch calculate_corporate_relocation_benefits"""
+    (num_companies, avg_tax_per_company, olympic_year, current_year, discount_rate, benefit_years,
+     construction_tax_one_time) = _broadcast(num_companies, avg_tax_per_company, olympic_year,
+                                             current_year, discount_rate, benefit_years,
+                                             construction_tax_one_time)
+    years_until_games = olympic_year - current_year
+    annual_corporate_tax = (num_companies * avg_tax_per_company) / 1_000_000
+
+    construction_pv = construction_tax_one_time / ((1 + discount_rate) ** years_until_games)
+
+    # Ongoing annual tax starts the year after the Olympics
+    ongoing_pv = annuity_pv(annual_corporate_tax, discount_rate, years_until_games + 1, benefit_years)
+
+    return {
+        'annual_tax': annual_corporate_tax,
+        'total_pv': construction_pv + ongoing_pv,
+        'construction_pv': construction_pv,
+        'ongoing_pv': ongoing_pv
+    }
+
+
+def batch_construction_sales_tax(public_spending, sales_tax_rate, olympic_year, current_year, discount_rate):
+    """Batch calculate_construction_sales_tax"""
+    public_spending, sales_tax_rate, olympic_year, current_year, discount_rate = _broadcast(
+        public_spending, sales_tax_rate, olympic_year, current_year, discount_rate)
+    years_until_games = olympic_year - current_year
+
+    # Spread construction over 6 years before Olympics
+    construction_start = np.maximum(0, years_until_games - 6)
+    annual_spending = public_spending / 6
+    annual_sales_tax = annual_spending * sales_tax_rate
+
+    total_pv = annuity_pv(annual_sales_tax, discount_rate, construction_start, 6)
+
+    return {
+        'total_tax': public_spending * sales_tax_rate,
+        'total_pv': total_pv
+    }
+
+
+def batch_major_events_pipeline(events_per_year, avg_tax_per_event, olympic_year, current_year,
+                                discount_rate, benefit_years):
+    """Batch calculate_major_events_pipeline"""
+    (events_per_year, avg_tax_per_event, olympic_year, current_year, discount_rate,
+     benefit_years) = _broadcast(events_per_year, avg_tax_per_event, olympic_year, current_year,
+                                 discount_rate, benefit_years)
+    years_until_games = olympic_year - current_year
+    annual_revenue = (events_per_year * avg_tax_per_event)
+
+    total_pv = annuity_pv(annual_revenue, discount_rate, years_until_games + 1, benefit_years)
+
+    return {
+        'annual_revenue': annual_revenue,
+        'total_pv': total_pv,
+        'total_events': events_per_year * benefit_years
+    }
+
+
+def batch_convention_business(baseline_convention_revenue, increase_pct, tax_rate, olympic_year,
+                              current_year, discount_rate, benefit_years):
+    """Batch calculate_convention_business"""
+    (baseline_convention_revenue, increase_pct, tax_rate, olympic_year, current_year, discount_rate,
+     benefit_years) = _broadcast(baseline_convention_revenue, increase_pct, tax_rate, olympic_year,
+                                 current_year, discount_rate, benefit_years)
+    years_until_games = olympic_year - current_year
+    additional_revenue = baseline_convention_revenue * increase_pct
+    annual_tax = additional_revenue * tax_rate
+
+    total_pv = annuity_pv(annual_tax, discount_rate, years_until_games + 1, benefit_years)
+
+    return {
+        'annual_tax': annual_tax,
+        'total_pv': total_pv,
+        'additional_revenue': additional_revenue
+    }
+
+
+def batch_economic_roi(public_spending, tax_benefit_pv, gdp_multiplier, employment_multiplier):
+    """Batch calculate_economic_roi"""
+    public_spending, tax_benefit_pv, gdp_multiplier, employment_multiplier = _broadcast(
+        public_spending, tax_benefit_pv, gdp_multiplier, employment_multiplier)
+    positive = public_spending > 0
+    roi = np.where(positive, tax_benefit_pv / np.where(positive, public_spending, 1.0), 0.0)
+
+    return {
+        'roi': roi,
+        'gdp_impact': public_spending * gdp_multiplier,
+        'jobs_created': public_spending * employment_multiplier
+    }
+
+
+def batch_infrastructure_npv(transit_benefits, resilience_benefits, incremental_costs,
+                             years, discount_rate, olympic_year, current_year):
+    """Batch calculate_infrastructure_npv"""
+    (transit_benefits, resilience_benefits, incremental_costs, years, discount_rate,
+     olympic_year, current_year) = _broadcast(transit_benefits, resilience_benefits, incremental_costs,
+                                              years, discount_rate, olympic_year, current_year)
+    years_until_games = olympic_year - current_year
+
+    annual_benefits = transit_benefits + resilience_benefits
+
+    # Utilization ramps 0.3 + 0.035 * year for years 0-19 and stays at 1.0 afterwards
+    ramp_years = np.minimum(years + 1, 20)
+    benefits_pv = (linear_annuity_pv(0.3 * annual_benefits, 0.035 * annual_benefits, discount_rate,
+                                     years_until_games, ramp_years) +
+                   annuity_pv(annual_benefits, discount_rate, years_until_games + 20,
+                              np.maximum(0, years - 19)))
+
+    # Costs: 30% for years 0-2, 10% for years 3-5, 2% from year 6
+    costs_pv = (annuity_pv(incremental_costs * 0.3, discount_rate, years_until_games,
+                           np.minimum(years + 1, 3)) +
+                annuity_pv(incremental_costs * 0.1, discount_rate, years_until_games + 3,
+                           np.clip(years - 2, 0, 3)) +
+                annuity_pv(incremental_costs * 0.02, discount_rate, years_until_games + 6,
+                           np.maximum(0, years - 5)))
+
+    return {'npv': benefits_pv - costs_pv}
+
+
+def batch_migration_value(net_migrants_annual, fiscal_contribution, years, discount_rate,
+                          olympic_year, current_year):
+    """Batch calculate_migration_value"""
+    (net_migrants_annual, fiscal_contribution, years, discount_rate, olympic_year,
+     current_year) = _broadcast(net_migrants_annual, fiscal_contribution, years, discount_rate,
+                                olympic_year, current_year)
+    years_until_games = olympic_year - current_year
+
+    # Cumulative migrants grow linearly, so contributions form an arithmetic series
+    annual_contribution = (net_migrants_annual * 1.05 * fiscal_contribution) / 1_000_000
+    total_pv = linear_annuity_pv(annual_contribution, annual_contribution, discount_rate,
+                                 years_until_games + 1, years)
+
+    return {'total_pv': total_pv}
+
+
+def batch_normalize_score(value, min_val, max_val):
+    """Batch normalize_score"""
+    value = _as_float(value)
+    if max_val == min_val:
+        return np.full(value.shape, 0.5)
+    return np.clip((value - min_val) / (max_val - min_val), 0, 1)
+
+
+def batch_bcr(total_benefits, total_costs):
+    """Batch calculate_bcr - scenarios with no net cost get a BCR of 0.0"""
+    total_benefits, total_costs = _broadcast(total_benefits, total_costs)
+    positive = total_costs > 0
+    return np.where(positive, total_benefits / np.where(positive, total_costs, 1.0), 0.0)
+
+
+def mode_flags(analysis_mode):
+    """(include_comprehensive, include_timeline) boolean arrays for mode names or indices"""
+    mode = np.asarray(analysis_mode)
+    if mode.dtype.kind in 'USO':
+        codes = np.full(mode.shape, -1)
+        for code, name in enumerate(ANALYSIS_MODES):
+            codes = np.where(mode == name, code, codes)
+        if (codes < 0).any():
+            unknown = sorted(set(np.atleast_1d(mode[codes < 0]).tolist()))
+            raise ValueError(f"Unknown analysis mode(s): {unknown}")
+        mode = codes
+    return mode >= 1, mode == 2
+
+
+def evaluate_batch(params):
+    """
+    Vectorized fovi.evaluate
+    params maps Scenario field names to scalars or arrays (one element per scenario);
+    missing entries fall back to the Scenario defaults
+    """
+    p = default_parameters()
+    p.update(params)
+    include_comprehensive, include_timeline = mode_flags(p['analysis_mode'])
+
+    # Modes without the timeline evaluate the Games in the current year
+    olympic_year = np.where(include_timeline, p['olympic_year'], CURRENT_YEAR)
+    inflation_rate = np.where(include_timeline, p['inflation_rate'], DEFAULT_INFLATION_RATE)
+    tourism_growth_rate = np.where(include_timeline, p['tourism_growth_rate'], DEFAULT_TOURISM_GROWTH_RATE)
+    discount_rate = p['discount_rate']
+
+    tourism = batch_comprehensive_tourism(
+        _as_float(p['baseline_visitors']) * 1_000_000, p['uplift_pct'], p['crowd_out_pct'],
+        p['spend_per_visitor'], p['tax_rate'], p['legacy_years'], p['legacy_uplift'], discount_rate,
+        olympic_year, CURRENT_YEAR, inflation_rate, tourism_growth_rate
+    )['total_tax_pv']
+    prop = batch_property_tax_benefits(
+        MEDIAN_HOME_VALUE, TOTAL_PROPERTIES, p['property_appreciation'], p['affected_properties_pct'],
+        PROPERTY_TAX_RATE, olympic_year, CURRENT_YEAR, discount_rate, BENEFIT_YEARS
+    )['total_pv']
+    corporate = batch_corporate_relocation_benefits(
+        p['num_companies'], _as_float(p['avg_corp_tax']) * 1000, olympic_year, CURRENT_YEAR,
+        discount_rate, BENEFIT_YEARS, CORPORATE_CONSTRUCTION_TAX
+    )['total_pv']
+    construction_tax = batch_construction_sales_tax(
+        p['public_spending'], CONSTRUCTION_SALES_TAX_RATE, olympic_year, CURRENT_YEAR, discount_rate
+    )['total_pv']
+    events = batch_major_events_pipeline(
+        p['events_per_year'], p['avg_event_tax'], olympic_year, CURRENT_YEAR, discount_rate, BENEFIT_YEARS
+    )['total_pv']
+    convention = batch_convention_business(
+        p['convention_baseline'], p['convention_increase'], p['tax_rate'],
+        olympic_year, CURRENT_YEAR, discount_rate, BENEFIT_YEARS
+    )['total_pv']
+    infrastructure = batch_infrastructure_npv(
+        p['transit_benefits'], p['resilience_benefits'], p['incremental_costs'],
+        p['infrastructure_years'], discount_rate, olympic_year, CURRENT_YEAR
+    )['npv']
+    migration = batch_migration_value(
+        p['net_migrants_annual'], p['fiscal_contribution'], p['migration_years'],
+        discount_rate, olympic_year, CURRENT_YEAR
+    )['total_pv']
+
+    # Comprehensive components are zero in the Basic Tourism Model
+    prop = np.where(include_comprehensive, prop, 0.0)
+    corporate = np.where(include_comprehensive, corporate, 0.0)
+    construction_tax = np.where(include_comprehensive, construction_tax, 0.0)
+    events = np.where(include_comprehensive, events, 0.0)
+    convention = np.where(include_comprehensive, convention, 0.0)
+
+    total_tax_benefits = tourism + prop + corporate + events + convention
+    economic = batch_economic_roi(p['public_spending'], total_tax_benefits,
+                                  p['gdp_multiplier'], p['employment_multiplier'])
+
+    total_benefits = total_tax_benefits + construction_tax + infrastructure + migration
+    net_public_cost = (_as_float(p['public_spending']) * (1 - _as_float(p['private_share']))
+                       - construction_tax)
+    net_fiscal_gain = total_benefits - net_public_cost
+    bcr = batch_bcr(total_benefits, net_public_cost)
+
+    # Legacy FOVI score
+    tourism_score = batch_normalize_score(tourism, 0, 15000)
+    enhanced_tourism_score = np.where(include_comprehensive,
+                                      batch_normalize_score(total_tax_benefits, 0, 20000), tourism_score)
+    fovi_score = (0.3 * enhanced_tourism_score +
+                  0.3 * batch_normalize_score(economic['roi'], 0.5, 2.0) +
+                  0.25 * batch_normalize_score(infrastructure, 0, 10000) +
+                  0.15 * batch_normalize_score(migration, 0, 5000))
+
+    return {
+        'tourism': tourism,
+        'property': prop,
+        'corporate': corporate,
+        'construction_tax': construction_tax,
+        'events': events,
+        'convention': convention,
+        'infrastructure': infrastructure,
+        'migration': migration,
+        'total_tax_benefits': total_tax_benefits,
+        'total_benefits': total_benefits,
+        'net_public_cost': net_public_cost,
+        'net_fiscal_gain': net_fiscal_gain,
+        'bcr': bcr,
+        'roi': economic['roi'],
+        'gdp_impact': economic['gdp_impact'],
+        'jobs_created': economic['jobs_created'],
+        'fovi_score': fovi_score
+    }
@@ -0,0 +1,171 @@
+"""
+FOVI Batch Runner
+Evaluates every row of a CSV or Parquet scenario file and writes component PVs,
+BCR and FOVI score to Parquet. Rows are read, evaluated and written chunk by chunk,
+so memory stays constant however long the file is.
+
+Usage:
+    python fovi_batch_runner.py scenarios.csv results.parquet [--chunk-size 100000] [--workers 4]
+
+One column per sidebar parameter (see fovi.PARAMETERS) plus an optional
+analysis_mode column; missing parameters and blank cells take the dashboard defaults. Values
+must lie within the slider ranges; an invalid cell stops the run with its row and column.
+Other columns (scenario names, notes) are copied to the output unchanged.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from dataclasses import fields
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from fovi import COMPONENTS, PARAMETERS, Scenario, default_parameters
+from fovi_batch import evaluate_batch
+
+# Integer Scenario fields (Games year, durations) are written back as integers
+INTEGER_PARAMETERS = [field.name for field in fields(Scenario) if field.type is int]
+DEFAULTS = default_parameters()
+DEFAULT_MODE = DEFAULTS['analysis_mode']
+
+OUTPUT_COLUMNS = COMPONENTS + ['total_benefits', 'net_public_cost', 'net_fiscal_gain', 'bcr', 'fovi_score']
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def read_scenarios(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the scenario file as DataFrames of at most chunk_size rows"""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == '.csv':
+        yield from pd.read_csv(path, chunksize=chunk_size)
+    elif suffix in ('.parquet', '.pq'):
+        # Number rows through the whole file, as read_csv does, so errors can name them
+        start = 0
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            frame = batch.to_pandas()
+            frame.index = pd.RangeIndex(start, start + len(frame))
+            start += len(frame)
+            yield frame
+    else:
+        raise ValueError(f"Unsupported scenario file type '{suffix}' (expected .csv or .parquet)")
+
+
+def parameter_column(frame, name):
+    """
+    One parameter column as floats, blank cells filled with the default
+    Raises ValueError naming the first row (1-based, header excluded) whose value is not a
+    number within the slider range, or off the step for stepped parameters
+    """
+    column = frame[name]
+    values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float, copy=True)
+    blank = column.isna().to_numpy()
+    values[blank] = DEFAULTS[name]
+
+    _, min_val, max_val, step = PARAMETERS[name]
+    with np.errstate(invalid='ignore'):
+        problems = [(~np.isfinite(values), "must be a finite number"),
+                    ((values < min_val) | (values > max_val), f"must be between {min_val} and {max_val}")]
+        if step:
+            steps = (values - min_val) / step
+            problems.append((~np.isclose(steps, np.round(steps), rtol=0, atol=1e-9),
+                             f"must be {min_val} plus a multiple of {step}"))
+    for invalid, message in problems:
+        if invalid.any():
+            row = np.flatnonzero(invalid)[0]
+            raise ValueError(f"Row {frame.index[row] + 1}, column '{name}': {message}, got {column.tolist()[row]!r}")
+    return values
+
+
+def evaluate_chunk(frame):
+    """Input columns of one chunk followed by the evaluated OUTPUT_COLUMNS"""
+    params = {name: parameter_column(frame, name) for name in PARAMETERS if name in frame}
+    if 'analysis_mode' in frame:
+        # Blank cells take the default mode rather than becoming the string 'nan'
+        params['analysis_mode'] = frame['analysis_mode'].fillna(DEFAULT_MODE).to_numpy(dtype=str)
+    results = evaluate_batch(params)
+
+    output = frame.copy()
+    for name in params:
+        output[name] = params[name].astype(np.int64) if name in INTEGER_PARAMETERS else params[name]
+    for column in OUTPUT_COLUMNS:
+        output[column] = np.broadcast_to(results[column], (len(frame),))
+    return output
+
+
+def _evaluated_chunks(chunks, workers):
+    """Evaluate chunks in order, keeping at most 2 * workers chunks in flight"""
+    if workers <= 1:
+        yield from map(evaluate_chunk, chunks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(evaluate_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_batch(input_path, output_path, chunk_size=DEFAULT_CHUNK_SIZE, workers=None, progress=None):
+    """
+    Evaluate every scenario in input_path and stream the results to output_path
+    progress, if given, is called with the number of rows written after each chunk.
+    Returns the total number of rows
+    """
+    workers = workers or os.cpu_count() or 1
+    rows = 0
+    writer = None
+    try:
+        for frame in _evaluated_chunks(read_scenarios(input_path, chunk_size), workers):
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output_path, table.schema)
+            writer.write_table(table.cast(writer.schema))
+            rows += len(frame)
+            if progress is not None:
+                progress(rows)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate a CSV/Parquet file of FOVI scenarios")
+    parser.add_argument('input', help="scenario file (.csv or .parquet), one row per scenario")
+    parser.add_argument('output', help="results file (.parquet)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"rows per chunk (default {DEFAULT_CHUNK_SIZE:,})")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+
+    def report(rows):
+        elapsed = time.perf_counter() - start
+        print(f"\r  {rows:,} scenarios ({rows / max(elapsed, 1e-9):,.0f}/s)", end='', file=sys.stderr)
+
+    try:
+        rows = run_batch(args.input, args.output, args.chunk_size, args.workers, report)
+    except (OSError, ValueError) as error:
+        print(f"\nError: {error}", file=sys.stderr)
+        return 1
+
+    print(f"\n✓ Wrote {rows:,} scenarios to {args.output} in {time.perf_counter() - start:.1f}s",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
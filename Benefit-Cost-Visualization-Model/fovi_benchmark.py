@@ -0,0 +1,235 @@
+"""
+FOVI Benchmarks
+Times the calculators (scalar and batch), the main() computation pipeline, the GDP
+data load, the dashboard chart builders and Monte Carlo runs. Results can be saved
+to a JSON history keyed by git commit and compared against the previous entry, so
+performance changes to the model are measurable.
+
+Usage:
+    python fovi_benchmark.py                          # run and print
+    python fovi_benchmark.py --save benchmarks.json   # append this run to the history
+    python fovi_benchmark.py --compare benchmarks.json --threshold 0.2
+    python fovi_benchmark.py --only batch --quick
+"""
+
+import argparse
+import functools
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+import fovi
+import fovi_batch
+from fovi_ledger import cash_flow_ledger, component_totals
+from fovi_montecarlo import run_monte_carlo
+
+MODEL_DIR = Path(__file__).resolve().parent
+
+BATCH_SIZES = [1_000, 100_000]
+MONTE_CARLO_SIZES = [100_000, 1_000_000]
+DEFAULT_THRESHOLD = 0.20
+
+
+def _calculator_args(scenario, discount_rate):
+    """Arguments main() passes to each calculator, keyed by calculator name"""
+    s = scenario
+    year, now = s.olympic_year, fovi.CURRENT_YEAR
+    return {
+        'comprehensive_tourism': (s.baseline_visitors * 1_000_000, s.uplift_pct, s.crowd_out_pct,
+                                  s.spend_per_visitor, s.tax_rate, s.legacy_years, s.legacy_uplift,
+                                  discount_rate, year, now, s.inflation_rate, s.tourism_growth_rate),
+        'property_tax_benefits': (fovi.MEDIAN_HOME_VALUE, fovi.TOTAL_PROPERTIES, s.property_appreciation,
+                                  s.affected_properties_pct, fovi.PROPERTY_TAX_RATE, year, now,
+                                  discount_rate, fovi.BENEFIT_YEARS),
+        'corporate_relocation_benefits': (s.num_companies, s.avg_corp_tax * 1000, year, now, discount_rate,
+                                          fovi.BENEFIT_YEARS, fovi.CORPORATE_CONSTRUCTION_TAX),
+        'construction_sales_tax': (s.public_spending, fovi.CONSTRUCTION_SALES_TAX_RATE, year, now, discount_rate),
+        'major_events_pipeline': (s.events_per_year, s.avg_event_tax, year, now, discount_rate,
+                                  fovi.BENEFIT_YEARS),
+        'convention_business': (s.convention_baseline, s.convention_increase, s.tax_rate, year, now,
+                                discount_rate, fovi.BENEFIT_YEARS),
+        'economic_roi': (s.public_spending, 5000.0, s.gdp_multiplier, s.employment_multiplier),
+        'infrastructure_npv': (s.transit_benefits, s.resilience_benefits, s.incremental_costs,
+                               s.infrastructure_years, discount_rate, year, now),
+        'migration_value': (s.net_migrants_annual, s.fiscal_contribution, s.migration_years,
+                            discount_rate, year, now)
+    }
+
+
+def _load_dashboard():
+    """Import the dashboard module (Streamlit logs bare-mode warnings to stderr)"""
+    import fovi_dashboard_enhanced
+    return fovi_dashboard_enhanced
+
+
+@functools.lru_cache(maxsize=1)
+def _chart_args():
+    """Arguments main() passes to the chart builders for the default scenario, read from the ledger"""
+    dashboard = _load_dashboard()
+    scenario = fovi.Scenario()
+    result = fovi.evaluate(scenario)
+    ledger_pv = component_totals(cash_flow_ledger(scenario))
+    total_benefits = result['total_benefits']
+    benefits = [(dashboard.LEDGER_LABELS[name], ledger_pv.get(name, 0.0)) for name in fovi.COMPONENTS]
+    benefits = [(label, amount) for label, amount in benefits if amount > 1.0]
+    return {
+        'benefit_components_chart': (
+            tuple(label for label, _ in benefits),
+            tuple(amount for _, amount in benefits),
+            tuple(amount / total_benefits * 100 if total_benefits > 1 else 0 for _, amount in benefits)
+        ),
+        'cost_waterfall_chart': (
+            -ledger_pv['public_investment'],
+            -ledger_pv['private_investment'],
+            -ledger_pv.get('construction_tax_credit', 0.0),
+            result['net_public_cost']
+        ),
+        'net_position_chart': (total_benefits, result['net_public_cost'], result['net_fiscal_gain'])
+    }
+
+
+def benchmark_cases(quick=False):
+    """(name, callable) pairs; cached dashboard functions are timed uncached via __wrapped__"""
+    scenario = fovi.Scenario()
+    cases = []
+
+    for name, args in _calculator_args(scenario, scenario.discount_rate).items():
+        cases.append((f"scalar/{name}", lambda f=getattr(fovi, f"calculate_{name}"), a=args: f(*a)))
+    cases.append(("pipeline/evaluate", lambda: fovi.evaluate(scenario)))
+
+    for size in BATCH_SIZES[:1] if quick else BATCH_SIZES:
+        rates = np.linspace(0.02, 0.08, size)
+        for name, args in _calculator_args(scenario, rates).items():
+            if name == 'economic_roi':
+                args = (args[0], rates * 1e5) + args[2:]
+            cases.append((f"batch/{name}[{size:,}]",
+                          lambda f=getattr(fovi_batch, f"batch_{name}"), a=args: f(*a)))
+        params = dict(fovi.default_parameters(), discount_rate=rates)
+        cases.append((f"batch/evaluate_batch[{size:,}]", lambda p=params: fovi_batch.evaluate_batch(p)))
+
+    baseline = fovi.default_parameters()
+    distributions = {'uplift_pct': ("Triangular", 0.05, 0.10, 0.20),
+                     'crowd_out_pct': ("Uniform", 0.3, 0.7),
+                     'discount_rate': ("Normal", 0.045, 0.01)}
+    for size in MONTE_CARLO_SIZES[:1] if quick else MONTE_CARLO_SIZES:
+        cases.append((f"montecarlo/run_monte_carlo[{size:,}]",
+                      lambda n=size: run_monte_carlo(baseline, distributions, n_draws=n, seed=1)))
+
+    # Dashboard cases import Streamlit only when they run, so engine-only --only runs skip it
+    cases.append(("data/load_gdp_data", lambda: _load_dashboard().load_gdp_data.__wrapped__()))
+    for name in ['benefit_components_chart', 'cost_waterfall_chart', 'net_position_chart']:
+        cases.append((f"figures/{name}",
+                      lambda n=name: getattr(_load_dashboard(), f"build_{n}").__wrapped__(*_chart_args()[n])))
+
+    # Full script run of the dashboard; caches are warm after the first run
+    def render():
+        from streamlit.testing.v1 import AppTest
+        AppTest.from_file(str(MODEL_DIR / 'fovi_dashboard_enhanced.py'), default_timeout=120).run()
+    cases.append(("render/dashboard_warm_cache", render))
+    return cases
+
+
+def time_case(func, rounds=7, min_round_time=0.05):
+    """Median and minimum seconds per call over `rounds` timed rounds"""
+    func()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_round_time or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < min_round_time / 10 else 2
+
+    timings = [elapsed / loops]
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        timings.append((time.perf_counter() - start) / loops)
+    return {'median': statistics.median(timings), 'min': min(timings), 'loops': loops, 'rounds': rounds}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=MODEL_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def compare_runs(results, previous, threshold):
+    """Names whose median slowed down by more than threshold against the previous run"""
+    regressions = []
+    for name, timing in results.items():
+        before = previous['results'].get(name)
+        if before and timing['median'] > before['median'] * (1 + threshold):
+            regressions.append((name, before['median'], timing['median']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the FOVI calculators and dashboard build path")
+    parser.add_argument('--only', help="run benchmarks whose name contains this text")
+    parser.add_argument('--quick', action='store_true', help="smallest batch/Monte Carlo sizes, 3 rounds")
+    parser.add_argument('--save', metavar='FILE', help="append this run to a JSON history file")
+    parser.add_argument('--compare', metavar='FILE', help="compare against the last run in a JSON history file")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown before a regression is reported (default {DEFAULT_THRESHOLD:.0%})")
+    args = parser.parse_args(argv)
+
+    # load_gdp_data reads a path relative to the model directory
+    os.chdir(MODEL_DIR)
+    rounds = 3 if args.quick else 7
+
+    results = {}
+    for name, func in benchmark_cases(args.quick):
+        if args.only and args.only not in name:
+            continue
+        results[name] = time_case(func, rounds=rounds)
+        print(f"  {name:<55} {format_seconds(results[name]['median']):>10}  "
+              f"(min {format_seconds(results[name]['min'])})")
+
+    status = 0
+    if args.compare and Path(args.compare).exists():
+        history = json.loads(Path(args.compare).read_text())
+        if history:
+            previous = history[-1]
+            regressions = compare_runs(results, previous, args.threshold)
+            print(f"\nCompared with {previous['commit']} ({previous['date']})")
+            for name, before, after in regressions:
+                print(f"  ✗ {name}: {format_seconds(before)} → {format_seconds(after)} "
+                      f"(+{after / before - 1:.0%})")
+            if regressions:
+                status = 1
+            else:
+                print(f"  ✓ No regressions above {args.threshold:.0%}")
+
+    if args.save:
+        path = Path(args.save)
+        history = json.loads(path.read_text()) if path.exists() else []
+        history.append({'commit': git_commit(), 'date': datetime.now().isoformat(timespec='seconds'),
+                        'python': sys.version.split()[0], 'results': results})
+        path.write_text(json.dumps(history, indent=2))
+        print(f"\n✓ Saved {len(results)} benchmarks to {path}")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+FOVI Break-even Solver
+Value of each sidebar parameter at which the BCR reaches the viability thresholds,
+holding every other parameter at its baseline value. All parameter/threshold pairs
+are solved together by vectorized bisection over evaluate_batch
+"""
+
+import math
+
+import numpy as np
+
+from fovi import PARAMETERS, bcr_parameters
+from fovi_batch import evaluate_batch
+
+# Viability thresholds used by the dashboard's BCR status
+THRESHOLDS = [1.0, 1.2, 1.5]
+
+
+def break_even_values(baseline, names=None, thresholds=THRESHOLDS, xtol=1e-12):
+    """
+    Solve BCR(parameter) = threshold for every parameter and threshold
+    Each root is bracketed by the parameter's slider range and bisected until the
+    bracket is below xtol of that range. Stepped parameters are snapped to the first
+    slider step that meets the threshold. Returns {name: {'current', 'bcr_at_min',
+    'bcr_at_max', 'direction', 'break_even': {threshold: value or None}}}, where
+    direction is +1 if the BCR rises with the parameter (0 if it has no effect) and
+    None means the threshold is not crossed inside the slider range
+    """
+    mode = baseline.get('analysis_mode', "Full Economic Impact")
+    names = list(names or bcr_parameters(mode))
+    rows = len(names) * len(thresholds)
+    owner = np.repeat(np.arange(len(names)), len(thresholds))
+    target = np.tile(np.asarray(thresholds, dtype=float), len(names))
+    lower = np.array([PARAMETERS[name][1] for name in names], dtype=float)[owner]
+    upper = np.array([PARAMETERS[name][2] for name in names], dtype=float)[owner]
+
+    params = {name: np.full(rows, float(baseline[name])) for name in PARAMETERS}
+    params['analysis_mode'] = mode
+    columns = [(params[name], owner == i) for i, name in enumerate(names)]
+
+    def excess(values):
+        for column, mask in columns:
+            column[mask] = values[mask]
+        return np.broadcast_to(evaluate_batch(params)['bcr'], (rows,)) - target
+
+    f_lower, f_upper = excess(lower), excess(upper)
+    bcr_at_min, bcr_at_max = f_lower + target, f_upper + target
+    bracketed = np.sign(f_lower) != np.sign(f_upper)
+
+    lo, hi = lower.copy(), upper.copy()
+    for _ in range(math.ceil(math.log2(1 / xtol))):
+        mid = (lo + hi) / 2
+        f_mid = excess(mid)
+        same_side = np.sign(f_mid) == np.sign(f_lower)
+        lo = np.where(same_side, mid, lo)
+        f_lower = np.where(same_side, f_mid, f_lower)
+        hi = np.where(same_side, hi, mid)
+    roots = (lo + hi) / 2
+
+    results = {}
+    for i, name in enumerate(names):
+        _, min_val, max_val, step = PARAMETERS[name]
+        first = i * len(thresholds)
+        rising = bcr_at_max[first] > bcr_at_min[first]
+        break_even = {}
+        for j, threshold in enumerate(thresholds):
+            if not bracketed[first + j]:
+                break_even[threshold] = None
+                continue
+            value = float(roots[first + j])
+            if step:
+                # Snap towards the side of the root where the threshold is met
+                position = (value - min_val) / step
+                steps = math.ceil(position - 1e-9) if rising else math.floor(position + 1e-9)
+                value = min(max(min_val + steps * step, min_val), max_val)
+            break_even[threshold] = value
+        results[name] = {
+            'current': float(baseline[name]),
+            'bcr_at_min': float(bcr_at_min[first]),
+            'bcr_at_max': float(bcr_at_max[first]),
+            'direction': int(np.sign(bcr_at_max[first] - bcr_at_min[first])),
+            'break_even': break_even
+        }
+    return results
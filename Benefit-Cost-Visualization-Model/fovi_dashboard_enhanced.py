@@ -9,7 +9,20 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from pathlib import Path
+import functools
+import threading
+import time
 import warnings
+import fovi
+from fovi import PARAMETERS, Scenario, bcr_parameters, calculate_bcr, normalize_score, summarize
+from fovi_breakeven import THRESHOLDS, break_even_values
+from fovi_gradients import elasticity_base, gradients
+from fovi_ledger import (LEDGER_COLUMNS, annual_matrix, component_flows, component_totals, cumulative_position,
+                         flow_inputs, ledger_components, ledger_from_flows, payback_year)
+from fovi_montecarlo import DISTRIBUTIONS, run_monte_carlo
+from fovi_optimize import COST_CAP, decision_variables, frontier, optimize
+from fovi_sensitivity import morris_effects, sobol_indices, tornado_swings
+from fovi_sweep import bcr_grid
 warnings.filterwarnings('ignore')
 
 # Page configuration
@@ -287,6 +300,42 @@ MCKINSEY_COLORS = {
     'palette': ['#003366', '#00A8B5', '#5F6062', '#FF6B35', '#FFB81C', '#7FCDCD']
 }
 
+@st.cache_resource
+def get_cache_stats():
+    """Hit/miss counters shared by all sessions"""
+    return {'lock': threading.Lock(), 'counters': {}}
+
+def cached(max_entries=256):
+    """
+    st.cache_data keyed on the call arguments, with hit/miss counters for the debug panel
+    The wrapped body only runs on a miss, so misses are counted inside it
+    """
+    def decorator(func):
+        name = func.__name__
+        
+        def record(field):
+            stats = get_cache_stats()
+            with stats['lock']:
+                counters = stats['counters'].setdefault(name, {'calls': 0, 'misses': 0})
+                counters[field] += 1
+        
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            record('misses')
+            return func(*args, **kwargs)
+        
+        cached_compute = st.cache_data(max_entries=max_entries, show_spinner=False)(compute)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            record('calls')
+            return cached_compute(*args, **kwargs)
+        
+        wrapper.clear = cached_compute.clear
+        return wrapper
+    return decorator
+
+@cached(max_entries=1)
 def load_gdp_data():
     """Load Florida GDP data"""
     try:
@@ -307,246 +356,29 @@ def load_gdp_data():
     except:
         return {2020: 105.677, 2021: 115.548, 2022: 122.768, 2023: 129.021, 2024: 133.247}, 0.0456
 
-def calculate_comprehensive_tourism(baseline_visitors, uplift_pct, crowd_out_pct, spend_per_visitor,
-                                   tax_rate, legacy_years, legacy_uplift, discount_rate,
-                                   olympic_year, current_year, inflation_rate, tourism_growth_rate):
-    """
-    Enhanced tourism calculation with timeline and growth adjustments
-    """
-    years_until_games = olympic_year - current_year
-    
-    # Project baseline to Olympic year
-    future_baseline = baseline_visitors * ((1 + tourism_growth_rate) ** years_until_games)
-    future_spend = spend_per_visitor * ((1 + inflation_rate) ** years_until_games)
-    
-    # Games year calculation
-    games_uplift = future_baseline * uplift_pct
-    net_visitors = games_uplift * (1 - crowd_out_pct)
-    incremental_spending = net_visitors * future_spend
-    games_year_tax_nominal = (incremental_spending * tax_rate) / 1_000_000
-    
-    # Discount back to present
-    games_year_tax_pv = games_year_tax_nominal / ((1 + discount_rate) ** years_until_games)
-    
-    # Legacy calculation
-    legacy_pv = 0
-    legacy_breakdown = []
-    
-    for year in range(1, legacy_years + 1):
-        decay_factor = np.exp(-0.2 * year)
-        legacy_visitors = net_visitors * legacy_uplift * decay_factor
-        legacy_spending = legacy_visitors * future_spend * ((1 + inflation_rate) ** year)
-        legacy_tax_nominal = (legacy_spending * tax_rate) / 1_000_000
-        
-        actual_year_from_now = years_until_games + year
-        pv_tax = legacy_tax_nominal / ((1 + discount_rate) ** actual_year_from_now)
-        legacy_pv += pv_tax
-        
-        legacy_breakdown.append({
-            'Year': f'+{year}',
-            'Visitors': legacy_visitors,
-            'Tax_PV': pv_tax
-        })
-    
-    return {
-        'games_year_tax_pv': games_year_tax_pv,
-        'games_year_tax_nominal': games_year_tax_nominal,
-        'legacy_pv': legacy_pv,
-        'total_tax_pv': games_year_tax_pv + legacy_pv,
-        'future_baseline': future_baseline,
-        'legacy_breakdown': legacy_breakdown
-    }
-
-def calculate_property_tax_benefits(median_home_value, total_properties, appreciation_pct,
-                                   affected_pct, property_tax_rate, olympic_year, current_year,
-                                   discount_rate, benefit_years):
-    """
-    Calculate property value appreciation and resulting tax revenue
-    Source: Barcelona (150% in Olympic zones), Atlanta (20-30% citywide), London (40% in Olympic boroughs)
-    """
-    years_until_games = olympic_year - current_year
-    
-    value_increase = (total_properties * affected_pct * median_home_value * appreciation_pct)
-    annual_tax_increase = (value_increase * property_tax_rate) / 1_000_000
-    
-    total_pv = 0
-    # Benefits start in Olympic year and continue
-    for year in range(benefit_years):
-        actual_year = years_until_games + year
-        year_benefit = annual_tax_increase / ((1 + discount_rate) ** actual_year)
-        total_pv += year_benefit
-    
-    return {
-        'annual_tax': annual_tax_increase,
-        'total_pv': total_pv,
-        'value_increase': value_increase / 1_000_000
-    }
-
-def calculate_corporate_relocation_benefits(num_companies, avg_tax_per_company, olympic_year,
-                                           current_year, discount_rate, benefit_years,
-                                           construction_tax_one_time):
-    """
-    Corporate relocations and business development
-    Source: Barcelona (500+ companies), Atlanta (300+ HQs), London (major financial services growth)
-    """
-    years_until_games = olympic_year - current_year
-    annual_corporate_tax = (num_companies * avg_tax_per_company) / 1_000_000
-    
-    # One-time construction phase tax (in Olympic year)
-    construction_pv = construction_tax_one_time / ((1 + discount_rate) ** years_until_games)
-    
-    # Ongoing annual tax
-    ongoing_pv = 0
-    for year in range(benefit_years):
-        actual_year = years_until_games + year + 1  # Starts year after Olympics
-        year_benefit = annual_corporate_tax / ((1 + discount_rate) ** actual_year)
-        ongoing_pv += year_benefit
-    
-    return {
-        'annual_tax': annual_corporate_tax,
-        'total_pv': construction_pv + ongoing_pv,
-        'construction_pv': construction_pv,
-        'ongoing_pv': ongoing_pv
-    }
-
-def calculate_construction_sales_tax(public_spending, sales_tax_rate, olympic_year, current_year, discount_rate):
-    """
-    Sales tax revenue from construction spending - offsets public cost
-    This is REAL revenue Florida receives during construction
-    """
-    years_until_games = olympic_year - current_year
-    
-    # Spread construction over 6 years before Olympics
-    construction_start = max(0, years_until_games - 6)
-    annual_spending = public_spending / 6
-    annual_sales_tax = annual_spending * sales_tax_rate
-    
-    total_pv = 0
-    for year in range(6):
-        actual_year = construction_start + year
-        if actual_year >= 0:
-            year_tax = annual_sales_tax / ((1 + discount_rate) ** actual_year)
-            total_pv += year_tax
-    
-    return {
-        'total_tax': public_spending * sales_tax_rate,
-        'total_pv': total_pv
-    }
-
-def calculate_major_events_pipeline(events_per_year, avg_tax_per_event, olympic_year, current_year,
-                                   discount_rate, benefit_years):
-    """
-    Super Bowls, World Cups, NCAA championships enabled by Olympic venues
-    Source: Miami Super Bowl $572M impact, Tampa $407M impact, ~$35M tax revenue per event
-    """
-    years_until_games = olympic_year - current_year
-    
-    total_pv = 0
-    for year in range(benefit_years):
-        actual_year = years_until_games + year + 1
-        annual_revenue = (events_per_year * avg_tax_per_event)
-        year_pv = annual_revenue / ((1 + discount_rate) ** actual_year)
-        total_pv += year_pv
-    
-    return {
-        'annual_revenue': events_per_year * avg_tax_per_event,
-        'total_pv': total_pv,
-        'total_events': events_per_year * benefit_years
-    }
-
-def calculate_convention_business(baseline_convention_revenue, increase_pct, tax_rate, olympic_year,
-                                 current_year, discount_rate, benefit_years):
-    """
-    Convention and conference business growth
-    Source: Barcelona convention attendees 100K→2.5M (25x growth), Atlanta $1B+ annual impact
-    """
-    years_until_games = olympic_year - current_year
-    additional_revenue = baseline_convention_revenue * increase_pct
-    annual_tax = additional_revenue * tax_rate
-    
-    total_pv = 0
-    for year in range(benefit_years):
-        actual_year = years_until_games + year + 1
-        year_tax = annual_tax / ((1 + discount_rate) ** actual_year)
-        total_pv += year_tax
-    
-    return {
-        'annual_tax': annual_tax,
-        'total_pv': total_pv,
-        'additional_revenue': additional_revenue
-    }
-
-def calculate_economic_roi(public_spending, tax_benefit_pv, gdp_multiplier, employment_multiplier):
-    """Standard ROI calculation"""
-    roi = tax_benefit_pv / public_spending if public_spending > 0 else 0
-    gdp_impact = public_spending * gdp_multiplier
-    jobs_created = public_spending * employment_multiplier
-    
-    return {
-        'roi': roi,
-        'gdp_impact': gdp_impact,
-        'jobs_created': jobs_created
-    }
-
-def calculate_infrastructure_npv(transit_benefits, resilience_benefits, incremental_costs,
-                                years, discount_rate, olympic_year, current_year):
-    """Infrastructure NPV with proper timeline"""
-    years_until_games = olympic_year - current_year
-    npv = 0
-    
-    for year in range(years + 1):
-        actual_year = years_until_games + year
-        utilization_factor = min(1.0, 0.3 + (year * 0.035))
-        
-        transit_benefit = transit_benefits * utilization_factor
-        resilience_benefit = resilience_benefits * utilization_factor
-        
-        if year <= 5:
-            cost = incremental_costs * (0.3 if year <= 2 else 0.1)
-        else:
-            cost = incremental_costs * 0.02
-        
-        net_benefit = transit_benefit + resilience_benefit - cost
-        pv_benefit = net_benefit / ((1 + discount_rate) ** actual_year)
-        npv += pv_benefit
-    
-    return {'npv': npv}
-
-def calculate_migration_value(net_migrants_annual, fiscal_contribution, years, discount_rate,
-                             olympic_year, current_year):
-    """Migration value with proper timeline"""
-    years_until_games = olympic_year - current_year
-    total_pv = 0
-    
-    for year in range(1, years + 1):
-        actual_year = years_until_games + year
-        cumulative_migrants = net_migrants_annual * year * 1.05
-        annual_contribution = (cumulative_migrants * fiscal_contribution) / 1_000_000
-        pv_contribution = annual_contribution / ((1 + discount_rate) ** actual_year)
-        total_pv += pv_contribution
-    
-    return {'total_pv': total_pv}
+# Engine calculators, cached on their arguments
+calculate_comprehensive_tourism = cached()(fovi.calculate_comprehensive_tourism)
+calculate_property_tax_benefits = cached()(fovi.calculate_property_tax_benefits)
+calculate_corporate_relocation_benefits = cached()(fovi.calculate_corporate_relocation_benefits)
+calculate_construction_sales_tax = cached()(fovi.calculate_construction_sales_tax)
+calculate_major_events_pipeline = cached()(fovi.calculate_major_events_pipeline)
+calculate_convention_business = cached()(fovi.calculate_convention_business)
+calculate_infrastructure_npv = cached()(fovi.calculate_infrastructure_npv)
+calculate_migration_value = cached()(fovi.calculate_migration_value)
 
-def normalize_score(value, min_val, max_val):
-    """Normalize to [0,1]"""
-    if max_val == min_val:
-        return 0.5
-    normalized = (value - min_val) / (max_val - min_val)
-    return max(0, min(1, normalized))
-
-def calculate_bcr(total_benefits, total_costs):
+def reuse_or_compute(node, inputs, compute):
     """
-    Calculate Benefit-Cost Ratio (BCR)
-    BCR = Total Benefits / Total Costs
-    
-    Interpretation:
-    - BCR < 1.0: Not viable (costs exceed benefits)
-    - BCR = 1.0: Break-even
-    - BCR > 1.0: Viable (benefits exceed costs)
+    One node of the rerun dependency graph (calculators, totals, ledger, charts)
+    Returns the previous rerun's value when the node's inputs are unchanged, otherwise
+    compute(); each node's reuse is recorded for the debug panel
     """
-    if total_costs <= 0:
-        return 0.0
-    return total_benefits / total_costs
+    nodes = st.session_state.setdefault('rerun_values', {})
+    previous = nodes.get(node)
+    reused = previous is not None and previous[0] == inputs
+    if not reused:
+        nodes[node] = (inputs, compute())
+    st.session_state.setdefault('rerun_reuse', {})[node] = reused
+    return nodes[node][1]
 
 def get_bcr_status(bcr):
     """Get viability status based on BCR"""
@@ -601,6 +433,675 @@ def create_mckinsey_chart(fig):
     
     return fig
 
+@cached(max_entries=64)
+def build_benefit_components_chart(categories, amounts, shares):
+    """Horizontal bar chart of benefit components ranked by value"""
+    fig = go.Figure()
+    
+    # Sort by amount for better readability
+    sorted_idx = sorted(range(len(amounts)), key=lambda i: amounts[i], reverse=True)
+    
+    sorted_categories = [categories[i] for i in sorted_idx]
+    sorted_amounts = [amounts[i] for i in sorted_idx]
+    sorted_shares = [shares[i] for i in sorted_idx]
+    
+    fig.add_trace(go.Bar(
+        y=sorted_categories,
+        x=sorted_amounts,
+        orientation='h',
+        text=[f"${val:,.0f}M ({share:.1f}%)" for val, share in zip(sorted_amounts, sorted_shares)],
+        textposition='outside',
+        marker=dict(
+            color=sorted_amounts,
+            colorscale=[[0, MCKINSEY_COLORS['secondary']], [1, MCKINSEY_COLORS['primary']]],
+            showscale=False
+        ),
+        hovertemplate='<b>%{y}</b><br>Amount: $%{x:,.0f}M<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title="Benefit Components (Ranked by Value)",
+        xaxis_title="$ Millions (Present Value)",
+        yaxis_title="",
+        height=400,
+        margin=dict(l=200)
+    )
+    return create_mckinsey_chart(fig)
+
+@cached(max_entries=64)
+def build_cost_waterfall_chart(gross_investment, private_offset, construction_offset, net_public_cost):
+    """Waterfall from gross public investment to net public cost"""
+    cost_data = {
+        'Component': ['Gross Public Investment', 'Private Investment Share', 'Construction Tax Credit', 'Net Public Cost'],
+        'Amount ($M)': [gross_investment, private_offset, construction_offset, net_public_cost],
+        'Type': ['cost', 'offset', 'offset', 'net']
+    }
+    
+    cost_df = pd.DataFrame(cost_data)
+    
+    fig = go.Figure(go.Waterfall(
+        name="Costs",
+        orientation="v",
+        measure=["relative", "relative", "relative", "total"],
+        x=cost_df['Component'],
+        y=cost_df['Amount ($M)'],
+        text=[f"${abs(val):,.0f}M" for val in cost_df['Amount ($M)']],
+        textposition="outside",
+        connector={"line": {"color": MCKINSEY_COLORS['light_gray']}},
+        decreasing={"marker": {"color": MCKINSEY_COLORS['success']}},
+        increasing={"marker": {"color": MCKINSEY_COLORS['accent']}},
+        totals={"marker": {"color": MCKINSEY_COLORS['primary']}}
+    ))
+    
+    fig.update_layout(
+        title="Cost Waterfall: From Gross to Net",
+        yaxis_title="$ Millions (Present Value)",
+        height=400
+    )
+    return create_mckinsey_chart(fig)
+
+@cached(max_entries=64)
+def build_cash_flow_chart(years, labels, amounts, cumulative, payback):
+    """Stacked annual present values by component with the cumulative net position and payback year"""
+    fig = go.Figure()
+    palette = MCKINSEY_COLORS['palette']
+    for i, (label, values) in enumerate(zip(labels, amounts)):
+        fig.add_trace(go.Bar(
+            x=years, y=values,
+            name=label,
+            marker=dict(color=palette[i % len(palette)]),
+            hovertemplate=f'<b>{label}</b><br>%{{x}}: $%{{y:,.0f}}M<extra></extra>'
+        ))
+    fig.add_trace(go.Scatter(
+        x=years, y=cumulative,
+        mode='lines',
+        line=dict(color=MCKINSEY_COLORS['primary'], width=3),
+        name='Cumulative net position',
+        hovertemplate='%{x}: $%{y:,.0f}M<extra></extra>'
+    ))
+    fig.add_hline(y=0, line_color=MCKINSEY_COLORS['tertiary'])
+    if payback is not None:
+        fig.add_vline(x=payback, line_dash='dash', line_color=MCKINSEY_COLORS['success'],
+                      annotation_text=f'Payback {payback}')
+    fig.update_layout(
+        title="Annual Cash Flows and Cumulative Net Position",
+        xaxis_title="Year",
+        yaxis_title="$ Millions (Present Value)",
+        barmode='relative',
+        height=500
+    )
+    return create_mckinsey_chart(fig)
+
+@cached(max_entries=64)
+def build_net_position_chart(total_benefits, net_public_cost, net_fiscal_gain):
+    """Bar chart of total benefits, net public cost and net fiscal gain"""
+    net_data = pd.DataFrame({
+        'Category': ['Total Benefits', 'Net Public Cost', 'Net Fiscal Gain'],
+        'Amount': [total_benefits, net_public_cost, net_fiscal_gain],
+        'Color': [MCKINSEY_COLORS['success'], MCKINSEY_COLORS['accent'], 
+                 MCKINSEY_COLORS['success'] if net_fiscal_gain > 0 else MCKINSEY_COLORS['accent']]
+    })
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            x=net_data['Category'],
+            y=net_data['Amount'],
+            text=[f"${val:,.0f}M" for val in net_data['Amount']],
+            textposition='outside',
+            marker=dict(color=net_data['Color']),
+            hovertemplate='<b>%{x}</b><br>$%{y:,.0f}M<extra></extra>'
+        )
+    ])
+    
+    fig.update_layout(
+        title="Net Fiscal Position",
+        yaxis_title="$ Millions (Present Value)",
+        height=400,
+        showlegend=False
+    )
+    return create_mckinsey_chart(fig)
+
+@cached(max_entries=16)
+def build_bcr_histogram_chart(centers, shares, bin_width, draws):
+    """Monte Carlo BCR histogram with the break-even line"""
+    colors = [MCKINSEY_COLORS['success'] if c >= 1.0 else MCKINSEY_COLORS['accent'] for c in centers]
+    
+    fig = go.Figure(go.Bar(
+        x=centers,
+        y=shares,
+        width=bin_width,
+        marker=dict(color=colors),
+        hovertemplate='BCR %{x:.2f}<br>%{y:.2%} of draws<extra></extra>'
+    ))
+    fig.add_vline(x=1.0, line_dash="dash", line_color=MCKINSEY_COLORS['primary'],
+                  annotation_text="Break-even")
+    fig.update_layout(
+        title=f"BCR Distribution ({draws:,} draws)",
+        xaxis_title="Benefit-Cost Ratio",
+        yaxis_title="Share of Draws",
+        height=400,
+        showlegend=False
+    )
+    return create_mckinsey_chart(fig)
+
+@cached(max_entries=64)
+def build_tornado_chart(labels, lows, highs, base_value, title):
+    """Tornado chart of output swings with each parameter at its range limits"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=labels,
+        x=[low - base_value for low in lows],
+        base=base_value,
+        orientation='h',
+        name='At minimum',
+        marker=dict(color=MCKINSEY_COLORS['accent']),
+        customdata=lows,
+        hovertemplate='<b>%{y}</b><br>At minimum: %{customdata:.2f}<extra></extra>'
+    ))
+    fig.add_trace(go.Bar(
+        y=labels,
+        x=[high - base_value for high in highs],
+        base=base_value,
+        orientation='h',
+        name='At maximum',
+        marker=dict(color=MCKINSEY_COLORS['secondary']),
+        customdata=highs,
+        hovertemplate='<b>%{y}</b><br>At maximum: %{customdata:.2f}<extra></extra>'
+    ))
+    fig.add_vline(x=base_value, line_color=MCKINSEY_COLORS['primary'])
+    fig.update_layout(
+        title=title,
+        barmode='overlay',
+        height=max(400, 28 * len(labels)),
+        margin=dict(l=250),
+        yaxis=dict(autorange='reversed')
+    )
+    return create_mckinsey_chart(fig)
+
+@cached(max_entries=64)
+def build_sensitivity_chart(labels, first_values, second_values, first_name, second_name, title):
+    """Grouped horizontal bars of two sensitivity measures per parameter"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(y=labels, x=first_values, orientation='h', name=first_name,
+                         marker=dict(color=MCKINSEY_COLORS['primary'])))
+    fig.add_trace(go.Bar(y=labels, x=second_values, orientation='h', name=second_name,
+                         marker=dict(color=MCKINSEY_COLORS['secondary'])))
+    fig.update_layout(
+        title=title,
+        barmode='group',
+        height=max(400, 28 * len(labels)),
+        margin=dict(l=250),
+        yaxis=dict(autorange='reversed')
+    )
+    return create_mckinsey_chart(fig)
+
+@cached(max_entries=16)
+def build_sweep_chart(x, y, z, x_label, y_label, base_x, base_y):
+    """BCR heatmap over two parameters with the break-even contour and the current scenario"""
+    fig = go.Figure()
+    fig.add_trace(go.Heatmap(
+        x=x, y=y, z=z,
+        colorscale='RdYlGn',
+        zmid=1.0,
+        colorbar=dict(title='BCR'),
+        hovertemplate=f'{x_label}: %{{x}}<br>{y_label}: %{{y}}<br>BCR: %{{z:.2f}}<extra></extra>'
+    ))
+    if np.nanmin(z) < 1.0 < np.nanmax(z):
+        fig.add_trace(go.Contour(
+            x=x, y=y, z=z,
+            contours=dict(start=1.0, end=1.0, size=1.0, coloring='lines', showlabels=True),
+            line=dict(color=MCKINSEY_COLORS['primary'], width=3),
+            showscale=False,
+            hoverinfo='skip',
+            name='Break-even (BCR = 1.0)'
+        ))
+    fig.add_trace(go.Scatter(
+        x=[base_x], y=[base_y],
+        mode='markers',
+        marker=dict(symbol='x', size=14, color=MCKINSEY_COLORS['primary']),
+        name='Current scenario'
+    ))
+    fig.update_layout(
+        title=f"BCR over {x_label} and {y_label}",
+        xaxis_title=x_label,
+        yaxis_title=y_label,
+        height=600,
+        showlegend=False
+    )
+    return create_mckinsey_chart(fig)
+
+@cached(max_entries=16)
+def build_frontier_chart(costs, objectives, objective_label, current, optimum, cap):
+    """Best objective against net public cost, with the current scenario and the optimum"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=costs, y=objectives,
+        mode='lines',
+        line=dict(color=MCKINSEY_COLORS['secondary'], width=3),
+        name='Best achievable',
+        hovertemplate=f'Net public cost: $%{{x:,.0f}}M<br>{objective_label}: %{{y:,.2f}}<extra></extra>'
+    ))
+    fig.add_trace(go.Scatter(
+        x=[current[0]], y=[current[1]],
+        mode='markers',
+        marker=dict(symbol='x', size=14, color=MCKINSEY_COLORS['primary']),
+        name='Current scenario'
+    ))
+    if optimum is not None:
+        fig.add_trace(go.Scatter(
+            x=[optimum[0]], y=[optimum[1]],
+            mode='markers',
+            marker=dict(symbol='star', size=18, color=MCKINSEY_COLORS['accent']),
+            name='Optimum'
+        ))
+    if cap is not None:
+        fig.add_vline(x=cap, line_dash='dash', line_color=MCKINSEY_COLORS['tertiary'],
+                      annotation_text='Cost cap')
+    fig.update_layout(
+        title=f"{objective_label} Frontier over Net Public Cost",
+        xaxis_title="Net Public Cost ($M)",
+        yaxis_title=objective_label,
+        height=500
+    )
+    return create_mckinsey_chart(fig)
+
+# Display names of the ledger components
+LEDGER_LABELS = {
+    'tourism': 'Core Tourism Revenue',
+    'property': 'Property Tax Growth',
+    'corporate': 'Corporate Relocations',
+    'construction_tax': 'Construction Tax Offset',
+    'events': 'Major Events Pipeline',
+    'convention': 'Convention Business',
+    'infrastructure': 'Infrastructure NPV',
+    'migration': 'Migration Value',
+    'public_investment': 'Gross Public Investment',
+    'private_investment': 'Private Investment Share',
+    'construction_tax_credit': 'Construction Tax Credit'
+}
+
+# Optimizer runs and frontiers, cached per parameter state and constraint set
+run_optimize = cached(max_entries=32)(optimize)
+run_frontier = cached(max_entries=16)(frontier)
+
+# BCR grids, cached per parameter pair, resolution and parameter state
+run_bcr_grid = cached(max_entries=16)(bcr_grid)
+
+# Break-even values, cached per parameter state
+run_break_even = cached(max_entries=32)(break_even_values)
+
+# Exact local derivatives, cached per parameter state
+run_gradients = cached(max_entries=32)(gradients)
+
+# Global sensitivity runs, cached per parameter state and settings
+run_sobol_indices = cached(max_entries=8)(sobol_indices)
+run_morris_effects = cached(max_entries=8)(morris_effects)
+
+def render_sensitivity(scenario_params):
+    """Tornado chart plus Sobol / Morris global sensitivity section"""
+    st.markdown('<div class="section-header">Sensitivity Analysis</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+    <b>Tornado:</b> BCR with each parameter moved to its slider minimum and maximum, all others at the sidebar values.<br>
+    <b>Elasticities:</b> % change in BCR and net public cost for a 1% change in each parameter at the sidebar values,
+    from exact derivatives of the model (year parameters use one slider step; the Games year counts years from today).<br>
+    <b>Global:</b> Sobol indices apportion output variance across all parameters varied together over their full ranges
+    (S1 = direct effect, ST = including interactions); Morris μ* ranks parameters by mean absolute elementary effect.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    names = bcr_parameters(scenario_params['analysis_mode'])
+    base_bcr = fovi.evaluate(Scenario.from_dict(scenario_params))['bcr']
+    swings = tornado_swings(scenario_params, names)
+    ranked = sorted(names, key=lambda name: abs(swings[name][1] - swings[name][0]), reverse=True)
+    fig = build_tornado_chart(
+        tuple(PARAMETERS[name][0] for name in ranked),
+        tuple(swings[name][0] for name in ranked),
+        tuple(swings[name][1] for name in ranked),
+        base_bcr,
+        "BCR Tornado: One-at-a-Time Parameter Swings"
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    local = run_gradients(scenario_params, names)
+    values, grads = local['values'], local['gradients']
+    rows = []
+    for name in names:
+        x = float(elasticity_base(name, scenario_params[name]))
+        row = {'Parameter': PARAMETERS[name][0], 'Current': format_parameter_value(name, scenario_params[name]),
+               'dBCR / d(param)': f"{float(grads['bcr'][name]):+.4g}"}
+        for output, column in [('bcr', 'BCR Elasticity'), ('net_public_cost', 'Net Cost Elasticity'),
+                               ('total_benefits', 'Benefits Elasticity')]:
+            value = float(values[output])
+            row[column] = f"{float(grads[output][name]) * x / value:+.3f}" if value else "—"
+        row['_sort'] = abs(float(grads['bcr'][name]) * x)
+        rows.append(row)
+    elasticity_df = pd.DataFrame(rows).sort_values('_sort', ascending=False).drop(columns='_sort')
+    st.dataframe(elasticity_df, use_container_width=True, hide_index=True)
+    st.caption(f"Derivatives for all {len(names)} parameters from one vectorized evaluation")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        method = st.selectbox("Method", ["Sobol", "Morris"], key="sa_method")
+    with col2:
+        output = st.selectbox("Output", ["bcr", "net_fiscal_gain"], key="sa_output",
+                              format_func=lambda o: "Benefit-Cost Ratio" if o == 'bcr' else "Net Fiscal Gain")
+    with col3:
+        if method == "Sobol":
+            base_samples = st.selectbox("Base Samples", [2**10, 2**12, 2**14, 2**16], index=1,
+                                        format_func=lambda n: f"2^{int(np.log2(n))} ({n:,})", key="sa_samples")
+        else:
+            trajectories = st.selectbox("Trajectories", [20, 50, 100, 200], index=1, key="sa_trajectories")
+    with col4:
+        seed = st.number_input("Random Seed", min_value=0, max_value=2**31 - 1, value=2036, step=1, key="sa_seed")
+    
+    if not st.button("Run Global Sensitivity Analysis"):
+        return
+    
+    labels = tuple(PARAMETERS[name][0] for name in names)
+    with st.spinner("Running sensitivity analysis..."):
+        if method == "Sobol":
+            results = run_sobol_indices(scenario_params, names, base_samples, seed=int(seed))
+            first, second = results[output]['S1'], results[output]['ST']
+            first_name, second_name = "First-order (S1)", "Total-order (ST)"
+        else:
+            results = run_morris_effects(scenario_params, names, trajectories, seed=int(seed))
+            first, second = results[output]['mu_star'], results[output]['sigma']
+            first_name, second_name = "μ*", "σ"
+    
+    order = sorted(range(len(names)), key=lambda i: second[names[i]], reverse=True)
+    fig = build_sensitivity_chart(
+        tuple(labels[i] for i in order),
+        tuple(first[names[i]] for i in order),
+        tuple(second[names[i]] for i in order),
+        first_name, second_name,
+        f"{method} Sensitivity of {'BCR' if output == 'bcr' else 'Net Fiscal Gain'}"
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"{results['evaluations']:,} model evaluations")
+
+def render_parameter_sweep(scenario_params):
+    """Two-parameter BCR heatmap section"""
+    st.markdown('<div class="section-header">Parameter Sweep</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+    <b>BCR Surface:</b> Two parameters are swept across their full slider ranges with all others at the sidebar values.
+    The dark line marks break-even (BCR = 1.0) and ✕ marks the current scenario.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    available = bcr_parameters(scenario_params['analysis_mode'])
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        x_name = st.selectbox("X-axis parameter", available, index=available.index('discount_rate'),
+                              format_func=lambda name: PARAMETERS[name][0], key="sweep_x")
+    with col2:
+        y_options = [name for name in available if name != x_name]
+        y_default = 'uplift_pct' if 'uplift_pct' in y_options else y_options[0]
+        y_name = st.selectbox("Y-axis parameter", y_options, index=y_options.index(y_default),
+                              format_func=lambda name: PARAMETERS[name][0], key="sweep_y")
+    with col3:
+        resolution = st.selectbox("Grid Resolution", [100, 250, 500], index=2,
+                                  format_func=lambda n: f"{n} × {n}", key="sweep_resolution")
+    
+    grid = run_bcr_grid(scenario_params, x_name, y_name, resolution)
+    fig = build_sweep_chart(grid['x'], grid['y'], grid['bcr'],
+                            PARAMETERS[x_name][0], PARAMETERS[y_name][0],
+                            scenario_params[x_name], scenario_params[y_name])
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"{grid['bcr'].size:,} scenarios evaluated · {grid['viable_share']:.1%} of the grid at or above break-even")
+
+def format_parameter_value(name, value):
+    """Format a parameter value in its sidebar units"""
+    label, _, _, step = PARAMETERS[name]
+    if '(%)' in label:
+        return f"{value:.1%}"
+    if step:
+        return f"{value:.0f}"
+    if abs(value) >= 100:
+        return f"{value:,.0f}"
+    return f"{value:,.2f}"
+
+def render_break_even(scenario_params):
+    """Break-even value and headroom table for every parameter"""
+    st.markdown('<div class="section-header">Break-even Analysis</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+    <b>Break-even Values:</b> The value each parameter would need, with all others at the sidebar values, for the BCR
+    to reach 1.0 (viable), 1.2 and 1.5 (highly viable). <b>Headroom</b> is the distance from the current value to BCR 1.0
+    as a share of the slider range; a negative headroom means the current scenario is below break-even.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    results = run_break_even(scenario_params)
+    base_bcr = fovi.evaluate(Scenario.from_dict(scenario_params))['bcr']
+    
+    rows = []
+    for name, result in results.items():
+        _, min_val, max_val, _ = PARAMETERS[name]
+        row = {'Parameter': PARAMETERS[name][0], 'Current': format_parameter_value(name, result['current'])}
+        for threshold in THRESHOLDS:
+            value = result['break_even'][threshold]
+            if value is not None:
+                row[f'BCR {threshold:.1f}'] = format_parameter_value(name, value)
+            elif min(result['bcr_at_min'], result['bcr_at_max']) >= threshold:
+                row[f'BCR {threshold:.1f}'] = "Always met"
+            else:
+                row[f'BCR {threshold:.1f}'] = "Not reachable"
+        
+        value = result['break_even'][THRESHOLDS[0]]
+        if value is None:
+            row['Headroom'] = "—"
+            row['_sort'] = np.inf
+        else:
+            # Distance the parameter can move in the unfavourable direction before BCR < 1.0
+            headroom = (result['current'] - value) * result['direction'] / (max_val - min_val)
+            row['Headroom'] = f"{headroom:+.0%} of range"
+            row['_sort'] = headroom
+        rows.append(row)
+    
+    headroom_df = pd.DataFrame(rows).sort_values('_sort').drop(columns='_sort')
+    st.dataframe(headroom_df, use_container_width=True, hide_index=True)
+    st.caption(f"Current BCR {base_bcr:.2f} · parameters sorted by headroom, tightest first")
+
+def render_optimizer(scenario_params):
+    """Constrained optimum of spending, private share and Games year"""
+    st.markdown('<div class="section-header">Spending Optimizer</div>', unsafe_allow_html=True)
+    
+    variables = decision_variables(scenario_params['analysis_mode'])
+    st.markdown(f"""
+    <div class="info-box">
+    <b>Optimum:</b> The {', '.join(PARAMETERS[name][0] for name in variables)} that maximize the chosen objective
+    within their slider ranges and the constraints below, all other parameters at the sidebar values.
+    The frontier shows the best objective reachable at each net public cost. <b>Shadow prices</b> give the change
+    in the optimum per unit of a binding constraint.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        objective = st.selectbox("Objective", ["net_fiscal_gain", "bcr"], key="opt_objective",
+                                 format_func=lambda o: "Net Fiscal Gain" if o == 'net_fiscal_gain' else "Benefit-Cost Ratio")
+    with col2:
+        cap = st.number_input("Net Public Cost Cap ($M, 0 = none)", min_value=0, max_value=20000,
+                              value=0, step=250, key="opt_cap")
+    with col3:
+        min_jobs = st.number_input("Minimum Jobs (0 = none)", min_value=0, max_value=400000,
+                                   value=0, step=5000, key="opt_jobs")
+    with col4:
+        min_bcr = st.number_input("Minimum BCR (0 = none)", min_value=0.0, max_value=10.0,
+                                  value=0.0, step=0.1, key="opt_bcr")
+    
+    constraints = {}
+    if cap:
+        constraints[COST_CAP] = float(cap)
+    if min_jobs:
+        constraints['min_jobs'] = float(min_jobs)
+    if min_bcr:
+        constraints['min_bcr'] = float(min_bcr)
+    
+    result = run_optimize(scenario_params, objective, constraints)
+    front = run_frontier(scenario_params, objective, constraints)
+    current = fovi.evaluate(Scenario.from_dict(scenario_params))
+    objective_label = "Net Fiscal Gain ($M)" if objective == 'net_fiscal_gain' else "BCR"
+    
+    if not result['feasible']:
+        st.warning("No combination within the slider ranges meets these constraints.")
+    else:
+        metric_cols = st.columns(len(variables) + 1)
+        for col, name in zip(metric_cols, variables):
+            with col:
+                st.metric(PARAMETERS[name][0], format_parameter_value(name, result['values'][name]),
+                          delta=None if result['values'][name] == scenario_params[name] else
+                          f"from {format_parameter_value(name, scenario_params[name])}", delta_color="off")
+        with metric_cols[-1]:
+            value = result['objective']
+            st.metric(objective_label,
+                      f"${value:,.0f}M" if objective == 'net_fiscal_gain' else f"{value:.2f}",
+                      delta=f"{value - current[objective]:+,.2f} vs current")
+        
+        if result['active']:
+            prices = [f"{name.replace('_', ' ')}: {result['shadow_prices'][name]:+.4g} per unit"
+                      for name in result['active']]
+            st.caption("Binding constraints · " + " · ".join(prices))
+    
+    optimum = (result['results']['net_public_cost'], result['objective']) if result['feasible'] else None
+    fig = build_frontier_chart(tuple(front['net_public_cost']), tuple(front['objective']), objective_label,
+                               (current['net_public_cost'], current[objective]), optimum,
+                               constraints.get(COST_CAP))
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"{result['evaluations']:,} scenarios evaluated in {result['seconds'] * 1000:.0f} ms "
+               "(the frontier is reused while only the cost cap changes)")
+
+def render_cache_debug_panel():
+    """Sidebar panel with cache hit/miss counters"""
+    with st.sidebar.expander("🔧 Cache Statistics", expanded=False):
+        reuse = st.session_state.get('rerun_reuse', {})
+        if reuse:
+            reused = sum(reuse.values())
+            st.caption(f"Last rerun reused {reused} of {len(reuse)} calculators, totals, ledger rows and charts "
+                       f"({reused / len(reuse):.0%}); calculations took "
+                       f"{st.session_state['rerun_seconds'] * 1000:.1f} ms")
+            recomputed = [node for node, was_reused in reuse.items() if not was_reused]
+            st.caption("Recomputed: " + (", ".join(recomputed) if recomputed else "nothing"))
+        
+        stats = get_cache_stats()
+        with stats['lock']:
+            rows = [(name, c['calls'] - c['misses'], c['misses'], c['calls'])
+                    for name, c in sorted(stats['counters'].items())]
+        
+        if not rows:
+            st.caption("No cached calls yet")
+            return
+        
+        debug_df = pd.DataFrame(rows, columns=['Function', 'Hits', 'Misses', 'Calls'])
+        debug_df['Hit Rate'] = (debug_df['Hits'] / debug_df['Calls']).map(lambda x: f"{x:.0%}")
+        st.dataframe(debug_df, use_container_width=True, hide_index=True)
+        
+        total_calls = int(debug_df['Calls'].sum())
+        total_hits = int(debug_df['Hits'].sum())
+        st.caption(f"{total_hits:,} of {total_calls:,} calls served from cache")
+        
+        if st.button("Clear Caches", key="clear_caches"):
+            st.cache_data.clear()
+            st.session_state.pop('rerun_values', None)
+            with stats['lock']:
+                stats['counters'].clear()
+
+def render_monte_carlo(scenario_params):
+    """Monte Carlo BCR simulation section"""
+    st.markdown('<div class="section-header">Monte Carlo Risk Analysis</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="info-box">
+    <b>Probabilistic BCR:</b> Selected parameters are drawn from distributions around the sidebar values;
+    all other parameters stay at their point estimates. Draws are processed in chunks so memory stays bounded.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Parameters that actually affect the BCR in the current analysis mode
+    available = bcr_parameters(scenario_params['analysis_mode'])
+    default_selection = [name for name in ['uplift_pct', 'crowd_out_pct', 'discount_rate', 'property_appreciation']
+                         if name in available]
+    
+    selected = st.multiselect(
+        "Uncertain parameters",
+        available,
+        default=default_selection,
+        format_func=lambda name: PARAMETERS[name][0]
+    )
+    
+    distributions = {}
+    for name in selected:
+        label, min_val, max_val, step = PARAMETERS[name]
+        point = float(scenario_params[name])
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            kind = st.selectbox(label, DISTRIBUTIONS, key=f"mc_dist_{name}")
+        with col2:
+            low, high = st.slider(
+                f"{label} range",
+                min_value=float(min_val), max_value=float(max_val),
+                value=(float(min_val), float(max_val)),
+                step=float(step) if step else None,
+                key=f"mc_range_{name}"
+            )
+        if kind == "Triangular":
+            distributions[name] = ("Triangular", low, point, high)
+        elif kind == "Uniform":
+            distributions[name] = ("Uniform", low, high)
+        else:
+            distributions[name] = ("Normal", point, (high - low) / 4)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        n_draws = st.selectbox("Draws", [100_000, 1_000_000, 5_000_000], index=1,
+                               format_func=lambda n: f"{n:,}")
+    with col2:
+        seed = st.number_input("Random Seed", min_value=0, max_value=2**31 - 1, value=2036, step=1)
+    with col3:
+        st.markdown("<br>", unsafe_allow_html=True)
+        run = st.button("Run Simulation", disabled=not distributions)
+    
+    if not run:
+        return
+    
+    progress_bar = st.progress(0.0)
+    results = run_monte_carlo(scenario_params, distributions, n_draws=n_draws, seed=int(seed),
+                              progress=progress_bar.progress)
+    progress_bar.empty()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("P(BCR ≥ 1.0)", f"{results['p_viable']:.1%}")
+    with col2:
+        st.metric("Median BCR", f"{results['percentiles'][50]:.2f}")
+    with col3:
+        st.metric("90% Interval", f"{results['percentiles'][5]:.2f} – {results['percentiles'][95]:.2f}")
+    with col4:
+        st.metric("Mean Net Fiscal Gain", f"${results['mean_net_fiscal_gain']:,.0f}M")
+    
+    # Coarsen the fine accumulation histogram for display
+    counts = results['histogram'].reshape(-1, 20).sum(axis=1)
+    edges = results['edges'][::20]
+    centers = (edges[:-1] + edges[1:]) / 2
+    fig = build_bcr_histogram_chart(tuple(centers), tuple(counts / results['draws']),
+                                    edges[1] - edges[0], results['draws'])
+    st.plotly_chart(fig, use_container_width=True)
+    
+    percentile_df = pd.DataFrame({
+        'Percentile': [f"P{q}" for q in results['percentiles']],
+        'BCR': [f"{v:.2f}" for v in results['percentiles'].values()]
+    })
+    st.dataframe(percentile_df, use_container_width=True, hide_index=True)
+    
+    if results['above_range'] or results['below_range']:
+        st.caption(f"{results['above_range'] + results['below_range']:,} draws fell outside the "
+                   f"histogram range (min {results['min_bcr']:.2f}, max {results['max_bcr']:.2f})")
+
 # Main application
 def main():
     # Header
@@ -835,45 +1336,118 @@ def main():
         format="%.1f%%"
     )
     
+    # Monte Carlo
+    st.sidebar.markdown("### Risk Analysis")
+    monte_carlo_enabled = st.sidebar.checkbox(
+        "Enable Monte Carlo Simulation",
+        value=False,
+        help="Treat selected parameters as distributions and simulate the BCR"
+    )
+    
+    sensitivity_enabled = st.sidebar.checkbox(
+        "Enable Sensitivity Analysis",
+        value=False,
+        help="Tornado chart and Sobol / Morris global sensitivity of the BCR"
+    )
+    
+    break_even_enabled = st.sidebar.checkbox(
+        "Enable Break-even Analysis",
+        value=False,
+        help="Value of each parameter at which the BCR reaches 1.0, 1.2 and 1.5"
+    )
+    
+    sweep_enabled = st.sidebar.checkbox(
+        "Enable Parameter Sweep",
+        value=False,
+        help="BCR heatmap over any two parameters with the break-even contour"
+    )
+    
+    optimizer_enabled = st.sidebar.checkbox(
+        "Enable Spending Optimizer",
+        value=False,
+        help="Spending, private share and Games year that maximize net fiscal gain or BCR under constraints"
+    )
+    
+    # Sidebar values as an engine scenario (sidebar units)
+    scenario = Scenario(
+        analysis_mode=analysis_mode,
+        olympic_year=olympic_year,
+        inflation_rate=inflation_rate,
+        tourism_growth_rate=tourism_growth_rate,
+        baseline_visitors=baseline_visitors,
+        uplift_pct=uplift_pct,
+        crowd_out_pct=crowd_out_pct,
+        spend_per_visitor=spend_per_visitor,
+        tax_rate=tax_rate,
+        legacy_uplift=legacy_uplift,
+        legacy_years=legacy_years,
+        property_appreciation=property_appreciation,
+        affected_properties_pct=affected_properties_pct,
+        num_companies=num_companies,
+        avg_corp_tax=avg_corp_tax / 1000,
+        events_per_year=events_per_year,
+        avg_event_tax=avg_event_tax,
+        convention_baseline=convention_baseline,
+        convention_increase=convention_increase,
+        public_spending=public_spending,
+        private_share=private_share,
+        gdp_multiplier=gdp_multiplier,
+        employment_multiplier=employment_multiplier,
+        transit_benefits=transit_benefits,
+        resilience_benefits=resilience_benefits,
+        incremental_costs=incremental_costs,
+        infrastructure_years=infrastructure_years,
+        net_migrants_annual=net_migrants_annual,
+        fiscal_contribution=fiscal_contribution,
+        migration_years=migration_years,
+        discount_rate=discount_rate
+    )
+    
     # ==================== CALCULATIONS ====================
     
+    # Only the calculators whose inputs changed since the last rerun run again
+    # (fovi.COMPONENT_INPUTS); totals, ledger and charts follow their inputs the same way
+    st.session_state['rerun_reuse'] = {}
+    calculation_start = time.perf_counter()
+    inputs = {name: fovi.component_inputs(scenario, name) for name in fovi.COMPONENTS}
+    
     # Tourism
-    tourism_results = calculate_comprehensive_tourism(
+    tourism_results = reuse_or_compute('tourism', inputs['tourism'], lambda: calculate_comprehensive_tourism(
         baseline_visitors * 1_000_000, uplift_pct, crowd_out_pct, spend_per_visitor,
         tax_rate, legacy_years, legacy_uplift, discount_rate,
         olympic_year, current_year, inflation_rate, tourism_growth_rate
-    )
+    ))
     
     # Comprehensive benefits
     if include_comprehensive:
         # Property tax
-        property_results = calculate_property_tax_benefits(
-            306000, 10_000_000, property_appreciation, affected_properties_pct,
-            0.015, olympic_year, current_year, discount_rate, 20
-        )
+        property_results = reuse_or_compute('property', inputs['property'], lambda: calculate_property_tax_benefits(
+            fovi.MEDIAN_HOME_VALUE, fovi.TOTAL_PROPERTIES, property_appreciation, affected_properties_pct,
+            fovi.PROPERTY_TAX_RATE, olympic_year, current_year, discount_rate, fovi.BENEFIT_YEARS
+        ))
         
         # Corporate relocations
-        corporate_results = calculate_corporate_relocation_benefits(
+        corporate_results = reuse_or_compute('corporate', inputs['corporate'], lambda: calculate_corporate_relocation_benefits(
             num_companies, avg_corp_tax, olympic_year, current_year,
-            discount_rate, 20, 150
-        )
+            discount_rate, fovi.BENEFIT_YEARS, fovi.CORPORATE_CONSTRUCTION_TAX
+        ))
         
         # Construction sales tax
-        construction_tax_results = calculate_construction_sales_tax(
-            public_spending, 0.06, olympic_year, current_year, discount_rate
-        )
+        construction_tax_results = reuse_or_compute('construction_tax', inputs['construction_tax'], lambda: calculate_construction_sales_tax(
+            public_spending, fovi.CONSTRUCTION_SALES_TAX_RATE, olympic_year, current_year, discount_rate
+        ))
         
         # Major events
-        events_results = calculate_major_events_pipeline(
+        events_results = reuse_or_compute('events', inputs['events'], lambda: calculate_major_events_pipeline(
             events_per_year, avg_event_tax, olympic_year, current_year,
-            discount_rate, 20
-        )
+            discount_rate, fovi.BENEFIT_YEARS
+        ))
         
         # Convention business
-        convention_results = calculate_convention_business(
+        convention_results = reuse_or_compute('convention', inputs['convention'], lambda: calculate_convention_business(
             convention_baseline, convention_increase, tax_rate,
-            olympic_year, current_year, discount_rate, 20
-        )
+            olympic_year, current_year, discount_rate, fovi.BENEFIT_YEARS
+        ))
     else:
         property_results = {'total_pv': 0, 'annual_tax': 0, 'value_increase': 0}
         corporate_results = {'total_pv': 0, 'annual_tax': 0}
@@ -882,43 +1456,47 @@ def main():
         convention_results = {'total_pv': 0, 'annual_tax': 0}
     
     # Infrastructure
-    infrastructure_results = calculate_infrastructure_npv(
+    infrastructure_results = reuse_or_compute('infrastructure', inputs['infrastructure'], lambda: calculate_infrastructure_npv(
         transit_benefits, resilience_benefits, incremental_costs,
         infrastructure_years, discount_rate, olympic_year, current_year
-    )
+    ))
     
     # Migration
-    migration_results = calculate_migration_value(
+    migration_results = reuse_or_compute('migration', inputs['migration'], lambda: calculate_migration_value(
         net_migrants_annual, fiscal_contribution, migration_years,
         discount_rate, olympic_year, current_year
-    )
-    
-    # Economic ROI
-    total_tax_benefits = (tourism_results['total_tax_pv'] + 
-                          property_results['total_pv'] + 
-                          corporate_results['total_pv'] +
-                          events_results['total_pv'] +
-                          convention_results['total_pv'])
-    
-    economic_results = calculate_economic_roi(
-        public_spending, total_tax_benefits, gdp_multiplier, employment_multiplier
-    )
-    
-    # Calculate net fiscal gain
-    total_benefits = (tourism_results['total_tax_pv'] +
-                     property_results['total_pv'] +
-                     corporate_results['total_pv'] +
-                     construction_tax_results['total_pv'] +
-                     events_results['total_pv'] +
-                     convention_results['total_pv'] +
-                     infrastructure_results['npv'] +
-                     migration_results['total_pv'])
-    
-    net_public_cost = (public_spending * (1 - private_share)) - construction_tax_results['total_pv']
-    net_fiscal_gain = total_benefits - net_public_cost
+    ))
+    
+    # Totals, BCR and FOVI score from the engine
+    totals_inputs = tuple(inputs.values()) + tuple(getattr(scenario, name) for name in fovi.SUMMARY_INPUTS)
+    totals = reuse_or_compute('totals', totals_inputs, lambda: summarize(scenario, {
+        'tourism': tourism_results,
+        'property': property_results,
+        'corporate': corporate_results,
+        'construction_tax': construction_tax_results,
+        'events': events_results,
+        'convention': convention_results,
+        'infrastructure': infrastructure_results,
+        'migration': migration_results
+    }))
+    total_benefits = totals['total_benefits']
+    net_public_cost = totals['net_public_cost']
+    net_fiscal_gain = totals['net_fiscal_gain']
+    
+    # Year-by-year cash flows; the breakdown charts, payback and export all read from the ledger.
+    # Nominal flows don't depend on the discount rate, so changing it only re-discounts
+    flows = {}
+    for name in ledger_components(scenario):
+        flows[name] = reuse_or_compute(f'flows:{name}', flow_inputs(scenario, name),
+                                       lambda name=name: component_flows(scenario, [name])[name])
+    ledger_inputs = tuple((name, flow_inputs(scenario, name)) for name in flows) + (discount_rate,)
+    ledger = reuse_or_compute('ledger', ledger_inputs, lambda: ledger_from_flows(flows, discount_rate))
+    ledger_pv = component_totals(ledger)
+    payback = payback_year(ledger)
+    st.session_state['rerun_seconds'] = time.perf_counter() - calculation_start
     
     # Calculate Benefit-Cost Ratio (BCR) - PRIMARY VIABILITY METRIC
-    bcr = calculate_bcr(total_benefits, net_public_cost)
+    bcr = totals['bcr']
     viability_status, status_color = get_bcr_status(bcr)
     
     # Component contributions
@@ -930,26 +1508,11 @@ def main():
     events_contribution = events_results['total_pv']
     convention_contribution = convention_results['total_pv']
     
-    # Legacy FOVI calculation (for informational purposes only)
-    tourism_score = normalize_score(tourism_results['total_tax_pv'], 0, 15000)
-    economic_score = normalize_score(economic_results['roi'], 0.5, 2.0)
-    infrastructure_score = normalize_score(infrastructure_results['npv'], 0, 10000)
-    migration_score = normalize_score(migration_results['total_pv'], 0, 5000)
-    
-    if include_comprehensive:
-        total_revenue_benefits = (tourism_results['total_tax_pv'] + 
-                                 property_results['total_pv'] + 
-                                 corporate_results['total_pv'] +
-                                 events_results['total_pv'] +
-                                 convention_results['total_pv'])
-        enhanced_tourism_score = normalize_score(total_revenue_benefits, 0, 20000)
-    else:
-        enhanced_tourism_score = tourism_score
-    
-    fovi_score = (0.3 * enhanced_tourism_score + 
-                  0.3 * economic_score + 
-                  0.25 * infrastructure_score + 
-                  0.15 * migration_score)
+    # Legacy FOVI scores (for informational purposes only)
+    tourism_score = totals['tourism_score']
+    infrastructure_score = totals['infrastructure_score']
+    migration_score = totals['migration_score']
+    fovi_score = totals['fovi_score']
     
     is_viable = bcr >= 1.0
     
@@ -1005,8 +1568,8 @@ def main():
     with col4:
         st.metric(
             "GDP Impact",
-            f"${economic_results['gdp_impact']:,.0f}M",
-            f"{economic_results['jobs_created']:,.0f} jobs"
+            f"${totals['gdp_impact']:,.0f}M",
+            f"{totals['jobs_created']:,.0f} jobs"
         )
         st.markdown(f'<p class="data-source">{gdp_multiplier}x multiplier applied</p>', unsafe_allow_html=True)
     
@@ -1079,16 +1642,7 @@ def main():
         'Share (%)': []
     }
     
-    categories = [
-        ('Core Tourism Revenue', tourism_results['total_tax_pv']),
-        ('Property Tax Growth', property_results['total_pv']),
-        ('Corporate Relocations', corporate_results['total_pv']),
-        ('Construction Tax Offset', construction_tax_results['total_pv']),
-        ('Major Events Pipeline', events_results['total_pv']),
-        ('Convention Business', convention_results['total_pv']),
-        ('Infrastructure NPV', infrastructure_results['npv']),
-        ('Migration Value', migration_results['total_pv'])
-    ]
+    categories = [(LEDGER_LABELS[name], ledger_pv.get(name, 0.0)) for name in fovi.COMPONENTS]
     
     # Only include non-zero categories
     for cat, amt in categories:
@@ -1113,38 +1667,9 @@ def main():
         
         with col1:
             # Horizontal bar chart - better for comparing values
-            fig = go.Figure()
-            
-            # Sort by amount for better readability
-            sorted_idx = sorted(range(len(benefit_data['Amount ($M)'])), 
-                              key=lambda i: benefit_data['Amount ($M)'][i], reverse=True)
-            
-            sorted_categories = [benefit_data['Category'][i] for i in sorted_idx]
-            sorted_amounts = [benefit_data['Amount ($M)'][i] for i in sorted_idx]
-            sorted_shares = [benefit_data['Share (%)'][i] for i in sorted_idx]
-            
-            fig.add_trace(go.Bar(
-                y=sorted_categories,
-                x=sorted_amounts,
-                orientation='h',
-                text=[f"${val:,.0f}M ({share:.1f}%)" for val, share in zip(sorted_amounts, sorted_shares)],
-                textposition='outside',
-                marker=dict(
-                    color=sorted_amounts,
-                    colorscale=[[0, MCKINSEY_COLORS['secondary']], [1, MCKINSEY_COLORS['primary']]],
-                    showscale=False
-                ),
-                hovertemplate='<b>%{y}</b><br>Amount: $%{x:,.0f}M<extra></extra>'
-            ))
-            
-            fig.update_layout(
-                title="Benefit Components (Ranked by Value)",
-                xaxis_title="$ Millions (Present Value)",
-                yaxis_title="",
-                height=400,
-                margin=dict(l=200)
-            )
-            fig = create_mckinsey_chart(fig)
+            chart_args = (tuple(benefit_data['Category']), tuple(benefit_data['Amount ($M)']),
+                          tuple(benefit_data['Share (%)']))
+            fig = reuse_or_compute('benefit_chart', chart_args, lambda: build_benefit_components_chart(*chart_args))
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
@@ -1165,70 +1690,43 @@ def main():
     col1, col2 = st.columns([1, 1])
     
     with col1:
-        cost_data = {
-            'Component': ['Gross Public Investment', 'Private Investment Share', 'Construction Tax Credit', 'Net Public Cost'],
-            'Amount ($M)': [
-                public_spending * (1 - private_share),
-                -public_spending * private_share,
-                -construction_tax_results['total_pv'],
-                net_public_cost
-            ],
-            'Type': ['cost', 'offset', 'offset', 'net']
-        }
-        
-        cost_df = pd.DataFrame(cost_data)
-        
-        fig = go.Figure(go.Waterfall(
-            name="Costs",
-            orientation="v",
-            measure=["relative", "relative", "relative", "total"],
-            x=cost_df['Component'],
-            y=cost_df['Amount ($M)'],
-            text=[f"${abs(val):,.0f}M" for val in cost_df['Amount ($M)']],
-            textposition="outside",
-            connector={"line": {"color": MCKINSEY_COLORS['light_gray']}},
-            decreasing={"marker": {"color": MCKINSEY_COLORS['success']}},
-            increasing={"marker": {"color": MCKINSEY_COLORS['accent']}},
-            totals={"marker": {"color": MCKINSEY_COLORS['primary']}}
-        ))
-        
-        fig.update_layout(
-            title="Cost Waterfall: From Gross to Net",
-            yaxis_title="$ Millions (Present Value)",
-            height=400
-        )
-        fig = create_mckinsey_chart(fig)
+        chart_args = (-ledger_pv['public_investment'], -ledger_pv['private_investment'],
+                      -ledger_pv.get('construction_tax_credit', 0.0), net_public_cost)
+        fig = reuse_or_compute('waterfall_chart', chart_args, lambda: build_cost_waterfall_chart(*chart_args))
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Net position chart
-        net_data = pd.DataFrame({
-            'Category': ['Total Benefits', 'Net Public Cost', 'Net Fiscal Gain'],
-            'Amount': [total_benefits, net_public_cost, net_fiscal_gain],
-            'Color': [MCKINSEY_COLORS['success'], MCKINSEY_COLORS['accent'], 
-                     MCKINSEY_COLORS['success'] if net_fiscal_gain > 0 else MCKINSEY_COLORS['accent']]
-        })
-        
-        fig = go.Figure(data=[
-            go.Bar(
-                x=net_data['Category'],
-                y=net_data['Amount'],
-                text=[f"${val:,.0f}M" for val in net_data['Amount']],
-                textposition='outside',
-                marker=dict(color=net_data['Color']),
-                hovertemplate='<b>%{x}</b><br>$%{y:,.0f}M<extra></extra>'
-            )
-        ])
-        
-        fig.update_layout(
-            title="Net Fiscal Position",
-            yaxis_title="$ Millions (Present Value)",
-            height=400,
-            showlegend=False
-        )
-        fig = create_mckinsey_chart(fig)
+        chart_args = (total_benefits, net_public_cost, net_fiscal_gain)
+        fig = reuse_or_compute('net_position_chart', chart_args, lambda: build_net_position_chart(*chart_args))
         st.plotly_chart(fig, use_container_width=True)
     
+    # Cash Flow Timeline
+    st.markdown("### Cash Flow Timeline")
+    
+    def cash_flow_chart():
+        years, components, amounts = annual_matrix(ledger)
+        _, cumulative = cumulative_position(ledger)
+        return build_cash_flow_chart(
+            tuple(years.tolist()),
+            tuple(LEDGER_LABELS[name] for name in components),
+            tuple(tuple(row) for row in amounts.tolist()),
+            tuple(cumulative.tolist()),
+            payback
+        )
+    
+    fig = reuse_or_compute('cash_flow_chart', ledger_inputs, cash_flow_chart)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    ledger_csv = reuse_or_compute('ledger_csv', ledger_inputs, lambda: pd.DataFrame(
+        ledger, columns=LEDGER_COLUMNS).to_csv(index=False).encode('utf-8'))
+    st.download_button(
+        "Download Cash-flow Ledger (CSV)",
+        ledger_csv,
+        file_name="fovi_cash_flow_ledger.csv",
+        mime="text/csv"
+    )
+    
     # Financial Summary Table
     st.markdown('<div class="section-header">Executive Financial Summary</div>', unsafe_allow_html=True)
     
@@ -1252,19 +1750,19 @@ def main():
             '📊 BENEFIT-COST RATIO (BCR)',
             'Net Fiscal Gain',
             'Internal Rate of Return',
-            'Payback Period (Est.)'
+            'Payback Year (Cumulative PV)'
         ],
         'Amount': [
             f"${total_benefits:,.0f}M",
-            f"${public_spending * (1 - private_share):,.0f}M",
-            f"${public_spending * private_share:,.0f}M",
-            f"${construction_tax_results['total_pv']:,.0f}M",
+            f"${-ledger_pv['public_investment']:,.0f}M",
+            f"${ledger_pv['private_investment']:,.0f}M",
+            f"${ledger_pv.get('construction_tax_credit', 0.0):,.0f}M",
             f"${net_public_cost:,.0f}M",
             "",
             f"{bcr:.2f}",
             f"${net_fiscal_gain:,.0f}M",
             f"{((bcr ** (1/20)) - 1) * 100:.1f}%" if bcr > 0 else "N/A",
-            f"{20 / bcr:.1f} years" if bcr > 0 else "Never"
+            f"{payback} ({payback - current_year} years)" if payback is not None else "Not reached"
         ],
         'Status': [
             "✓" if total_benefits > 0 else "",
@@ -1276,7 +1774,7 @@ def main():
             viability_status,
             "✓ Positive" if net_fiscal_gain > 0 else "✗ Negative",
             "✓ Strong" if bcr > 1.5 else ("✓ Moderate" if bcr > 1.2 else "⚠ Weak"),
-            "✓ Excellent" if bcr > 2.0 else ("✓ Good" if bcr > 1.5 else "⚠ Extended")
+            "⚠ Beyond horizon" if payback is None else ("✓ By Games + 10" if payback <= olympic_year + 10 else "⚠ Extended")
         ]
     })
     
@@ -1507,6 +2005,26 @@ def main():
         
         st.dataframe(comparison_data, use_container_width=True, hide_index=True)
     
+    # Break-even Analysis
+    if break_even_enabled:
+        render_break_even(scenario.to_dict())
+    
+    # Parameter Sweep
+    if sweep_enabled:
+        render_parameter_sweep(scenario.to_dict())
+    
+    # Spending Optimizer
+    if optimizer_enabled:
+        render_optimizer(scenario.to_dict())
+    
+    # Sensitivity Analysis
+    if sensitivity_enabled:
+        render_sensitivity(scenario.to_dict())
+    
+    # Monte Carlo Risk Analysis
+    if monte_carlo_enabled:
+        render_monte_carlo(scenario.to_dict())
+    
     # Data Sources
     st.markdown("---")
     st.markdown('<div class="section-header">Data Sources & Validation</div>', unsafe_allow_html=True)
@@ -1539,6 +2057,8 @@ def main():
     
     st.markdown('<p class="data-source" style="text-align: center; margin-top: 2rem;">Analysis framework developed using FDOT-validated multipliers and historical Olympic economic outcomes</p>', 
                 unsafe_allow_html=True)
+    
+    render_cache_debug_panel()
 
 if __name__ == "__main__":
     main()
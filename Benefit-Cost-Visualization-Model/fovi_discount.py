@@ -0,0 +1,95 @@
+"""
+FOVI Discounting
+Closed-form present values of constant, geometrically growing/decaying and linearly
+increasing cash-flow series - O(1) in the horizon. Every function accepts Python
+numbers (evaluated with math) or NumPy arrays with one element per scenario.
+Complex arrays pass through unchanged, so fovi_gradients can differentiate them
+"""
+
+import math
+
+# Below this |periods * log_ratio| the arithmetic-geometric closed form loses digits
+# to cancellation, so a Taylor expansion is used instead
+_SERIES_THRESHOLD = 1e-4
+
+
+def _is_scalar(*values):
+    return all(isinstance(v, (int, float)) for v in values)
+
+
+def _as_array(value):
+    """Float array (complex values are kept for complex-step derivatives)"""
+    import numpy as np
+    value = np.asarray(value)
+    return value if value.dtype.kind == 'c' else value.astype(float)
+
+
+def geometric_sum(log_ratio, periods):
+    """
+    Sum of exp(log_ratio * k) for k = 0..periods-1
+    Evaluated as expm1(periods * L) / expm1(L), which stays accurate as L -> 0
+    """
+    if _is_scalar(log_ratio, periods):
+        if log_ratio == 0:
+            return float(periods)
+        return math.expm1(periods * log_ratio) / math.expm1(log_ratio)
+
+    import numpy as np
+    log_ratio = _as_array(log_ratio)
+    periods = _as_array(periods)
+    safe = np.where(log_ratio == 0, 1.0, log_ratio)
+    return np.where(log_ratio == 0, periods, np.expm1(periods * safe) / np.expm1(safe))
+
+
+def arithmetic_geometric_sum(log_ratio, periods):
+    """
+    Sum of k * exp(log_ratio * k) for k = 0..periods-1
+    Closed form is the derivative of geometric_sum in L; near L = 0 a three-term
+    Taylor expansion in L replaces it
+    """
+    n, L = periods, log_ratio
+    scalar = _is_scalar(L, n)
+    if not scalar:
+        import numpy as np
+        n = _as_array(n)
+        L = _as_array(L)
+
+    # Taylor: sum k + L * sum k^2 + L^2 / 2 * sum k^3
+    sum_k = n * (n - 1) / 2
+    sum_k2 = (n - 1) * n * (2 * n - 1) / 6
+    series = sum_k + L * sum_k2 + L * L / 2 * sum_k * sum_k
+
+    if scalar:
+        if abs(n * L) < _SERIES_THRESHOLD:
+            return series
+        em1 = math.expm1(L)
+        return (n * math.exp(n * L) * em1 - math.expm1(n * L) * math.exp(L)) / (em1 * em1)
+
+    small = np.abs(n * L) < _SERIES_THRESHOLD
+    safe = np.where(small, 1.0, L)
+    em1 = np.expm1(safe)
+    closed = (n * np.exp(n * safe) * em1 - np.expm1(n * safe) * np.exp(safe)) / (em1 * em1)
+    return np.where(small, series, closed)
+
+
+def _log1p(value):
+    if _is_scalar(value):
+        return math.log1p(value)
+    import numpy as np
+    return np.log1p(value)
+
+
+def annuity_pv(payment, discount_rate, start, periods, log_growth=0.0):
+    """
+    PV of payment * exp(log_growth * k) received at year start + k, k = 0..periods-1
+    log_growth = log(1 + g) gives a growing annuity; negative values a decaying one
+    """
+    log_ratio = log_growth - _log1p(discount_rate)
+    return payment / (1 + discount_rate) ** start * geometric_sum(log_ratio, periods)
+
+
+def linear_annuity_pv(payment, step, discount_rate, start, periods):
+    """PV of payment + step * k received at year start + k, k = 0..periods-1"""
+    log_ratio = -_log1p(discount_rate)
+    return (payment * geometric_sum(log_ratio, periods) +
+            step * arithmetic_geometric_sum(log_ratio, periods)) / (1 + discount_rate) ** start
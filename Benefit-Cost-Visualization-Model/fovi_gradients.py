@@ -0,0 +1,87 @@
+"""
+FOVI Gradients
+Partial derivatives of total_benefits, net_public_cost, net_fiscal_gain and bcr with
+respect to every sidebar parameter, for a batch of scenarios in one evaluate_batch call.
+Continuous parameters are differentiated in forward mode by the complex step: each gets
+an imaginary perturbation ih in its own row, and Im f(x + ih) / h is the derivative,
+exact to rounding (the imaginary part plays the role of a dual number's epsilon and no
+difference of nearby values is ever taken). Stepped parameters (the year counts) only
+exist on their slider grid, so they get the change per unit across one slider step
+"""
+
+import numpy as np
+
+from fovi import CURRENT_YEAR, PARAMETERS, default_parameters
+from fovi_batch import evaluate_batch
+
+GRADIENT_OUTPUTS = ['total_benefits', 'net_public_cost', 'net_fiscal_gain', 'bcr']
+
+# Imaginary step; any tiny value works since nothing is subtracted
+COMPLEX_STEP = 1e-20
+
+
+def gradients(params, names=None, outputs=GRADIENT_OUTPUTS):
+    """
+    Values and partial derivatives of the outputs
+    params maps Scenario field names to scalars or arrays, as in evaluate_batch. Returns
+    {'values': {output: array}, 'gradients': {output: {name: array}}} with derivatives in
+    sidebar units (per $M of public spending, per 1.0 of a percentage, per year, ...)
+    """
+    p = default_parameters()
+    p.update(params)
+    names = list(names or PARAMETERS)
+    continuous = [name for name in names if not PARAMETERS[name][3]]
+    stepped = [name for name in names if PARAMETERS[name][3]]
+    shape = np.broadcast_shapes(*(np.shape(p[name]) for name in list(PARAMETERS) + ['analysis_mode']))
+
+    # Row 0 is the scenario itself, then one row per continuous and per stepped parameter
+    rows = 1 + len(continuous) + len(stepped)
+    batch = {name: np.broadcast_to(np.asarray(p[name], dtype=float), (rows,) + shape).astype(complex)
+             for name in PARAMETERS}
+    batch['analysis_mode'] = np.broadcast_to(np.asarray(p['analysis_mode']), (rows,) + shape)
+
+    for row, name in enumerate(continuous, start=1):
+        batch[name][row] += 1j * COMPLEX_STEP
+
+    # Stepped parameters move one step up, or down when already at the slider maximum
+    deltas = {}
+    for row, name in enumerate(stepped, start=1 + len(continuous)):
+        _, _, max_val, step = PARAMETERS[name]
+        current = batch[name][0].real
+        deltas[name] = np.where(current + step <= max_val, step, -step)
+        batch[name][row] += deltas[name]
+
+    results = evaluate_batch(batch)
+    values = {output: np.broadcast_to(results[output], (rows,) + shape) for output in outputs}
+    grads = {}
+    for output, value in values.items():
+        grads[output] = {name: value[row].imag / COMPLEX_STEP for row, name in enumerate(continuous, start=1)}
+        for row, name in enumerate(stepped, start=1 + len(continuous)):
+            grads[output][name] = (value[row].real - value[0].real) / deltas[name]
+    return {
+        'values': {output: value[0].real for output, value in values.items()},
+        'gradients': {output: {name: grads[output][name] for name in names} for output in outputs}
+    }
+
+
+def elasticity_base(name, value):
+    """
+    Parameter value that elasticities are relative to
+    The Games year is measured as lead time from CURRENT_YEAR - 1% of a calendar year means nothing
+    """
+    value = np.asarray(value, dtype=float)
+    return value - CURRENT_YEAR if name == 'olympic_year' else value
+
+
+def elasticities(params, output='bcr', names=None):
+    """
+    {name: (dy/dx) * x / y} for one output - the % change in the output per 1% change
+    in each parameter; NaN where the output is zero
+    """
+    p = default_parameters()
+    p.update(params)
+    result = gradients(p, names, [output])
+    value = result['values'][output]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {name: np.where(value != 0, gradient * elasticity_base(name, p[name]) / value, np.nan)
+                for name, gradient in result['gradients'][output].items()}
@@ -0,0 +1,220 @@
+"""
+FOVI Cash-flow Ledger
+Year-by-year cash flows of every benefit and cost component of a scenario, built in
+one pass over the same formulas as the fovi calculators. The ledger is columnar -
+parallel NumPy arrays with one row per component and year - with nominal and present
+values, so charts, totals, cumulative payback and exports all read the same numbers.
+Benefit PVs sum to the calculators' component values; the cost rows sum to minus the
+net public cost, so the whole PV column sums to the net fiscal gain
+"""
+
+import csv
+import math
+
+import numpy as np
+
+from fovi import (BENEFIT_YEARS, COMPONENT_INPUTS, COMPONENTS, COMPREHENSIVE_COMPONENTS,
+                  CONSTRUCTION_SALES_TAX_RATE, CORPORATE_CONSTRUCTION_TAX, CURRENT_YEAR, MEDIAN_HOME_VALUE,
+                  PROPERTY_TAX_RATE, TIMELINE_PARAMETERS, TOTAL_PROPERTIES, timeline)
+
+# Benefit components are fovi.COMPONENTS; cost components are booked as negative flows
+COST_COMPONENTS = ['public_investment', 'private_investment', 'construction_tax_credit']
+LEDGER_COLUMNS = ['year', 'offset', 'component', 'kind', 'nominal', 'pv']
+
+
+# Nominal flows don't depend on the discount rate, only their present values do
+FLOW_INPUTS = {name: [field for field in inputs if field != 'discount_rate']
+               for name, inputs in COMPONENT_INPUTS.items()}
+FLOW_INPUTS.update({
+    'public_investment': ['public_spending'],
+    'private_investment': ['public_spending', 'private_share'],
+    'construction_tax_credit': FLOW_INPUTS['construction_tax'],
+})
+
+
+def _flows(offset, nominal):
+    return np.asarray(offset, dtype=int), np.asarray(nominal, dtype=float)
+
+
+def _tourism(scenario, games, inflation_rate, tourism_growth_rate):
+    # Games-year visitor spending, then legacy visitors decaying by exp(-0.2) a year
+    future_baseline = scenario.baseline_visitors * 1_000_000 * (1 + tourism_growth_rate) ** games
+    future_spend = scenario.spend_per_visitor * (1 + inflation_rate) ** games
+    net_visitors = future_baseline * scenario.uplift_pct * (1 - scenario.crowd_out_pct)
+    legacy = np.arange(1, scenario.legacy_years + 1)
+    legacy_tax = (net_visitors * scenario.legacy_uplift * np.exp(-0.2 * legacy) * future_spend *
+                  (1 + inflation_rate) ** legacy * scenario.tax_rate) / 1_000_000
+    return _flows(np.r_[games, games + legacy],
+                  np.r_[net_visitors * future_spend * scenario.tax_rate / 1_000_000, legacy_tax])
+
+
+def _property(scenario, games, *_):
+    property_tax = (TOTAL_PROPERTIES * scenario.affected_properties_pct * MEDIAN_HOME_VALUE *
+                    scenario.property_appreciation * PROPERTY_TAX_RATE) / 1_000_000
+    return _flows(games + np.arange(BENEFIT_YEARS), np.full(BENEFIT_YEARS, property_tax))
+
+
+def _corporate(scenario, games, *_):
+    # One-time construction tax in the Games year, then ongoing corporate tax
+    corporate_tax = scenario.num_companies * scenario.avg_corp_tax * 1000 / 1_000_000
+    return _flows(np.r_[games, games + 1 + np.arange(BENEFIT_YEARS)],
+                  np.r_[CORPORATE_CONSTRUCTION_TAX, np.full(BENEFIT_YEARS, corporate_tax)])
+
+
+def _construction_tax(scenario, games, *_):
+    return _flows(max(0, games - 6) + np.arange(6),
+                  np.full(6, scenario.public_spending / 6 * CONSTRUCTION_SALES_TAX_RATE))
+
+
+def _events(scenario, games, *_):
+    return _flows(games + 1 + np.arange(BENEFIT_YEARS),
+                  np.full(BENEFIT_YEARS, scenario.events_per_year * scenario.avg_event_tax))
+
+
+def _convention(scenario, games, *_):
+    return _flows(games + 1 + np.arange(BENEFIT_YEARS),
+                  np.full(BENEFIT_YEARS, scenario.convention_baseline * scenario.convention_increase *
+                          scenario.tax_rate))
+
+
+def _infrastructure(scenario, games, *_):
+    # Utilization ramps 0.3 + 0.035 * year to 1.0 by year 20; costs 30% / 10% / 2% of incremental costs
+    years = np.arange(scenario.infrastructure_years + 1)
+    annual_benefits = scenario.transit_benefits + scenario.resilience_benefits
+    utilization = np.where(years < 20, 0.3 + 0.035 * years, 1.0)
+    cost_share = np.select([years < 3, years < 6], [0.3, 0.1], default=0.02)
+    return _flows(games + years, annual_benefits * utilization - scenario.incremental_costs * cost_share)
+
+
+def _migration(scenario, games, *_):
+    # Cumulative migrants grow linearly
+    years = np.arange(scenario.migration_years)
+    contribution = scenario.net_migrants_annual * 1.05 * scenario.fiscal_contribution / 1_000_000
+    return _flows(games + 1 + years, contribution * (1 + years))
+
+
+# Costs as the model counts them: public spending up front, less the private share
+# and the construction sales tax it generates
+def _public_investment(scenario, *_):
+    return _flows([0], [-scenario.public_spending])
+
+
+def _private_investment(scenario, *_):
+    return _flows([0], [scenario.public_spending * scenario.private_share])
+
+
+_FLOWS = {
+    'tourism': _tourism,
+    'property': _property,
+    'corporate': _corporate,
+    'construction_tax': _construction_tax,
+    'events': _events,
+    'convention': _convention,
+    'infrastructure': _infrastructure,
+    'migration': _migration,
+    'public_investment': _public_investment,
+    'private_investment': _private_investment,
+    'construction_tax_credit': _construction_tax,
+}
+
+
+def ledger_components(scenario):
+    """Benefit and cost components with cash flows in the scenario's analysis mode"""
+    excluded = set() if scenario.include_comprehensive else set(COMPREHENSIVE_COMPONENTS) | {'construction_tax_credit'}
+    return [name for name in COMPONENTS + COST_COMPONENTS if name not in excluded]
+
+
+def flow_inputs(scenario, name):
+    """Everything one component's nominal flows depend on, as a tuple of values (see fovi.component_inputs)"""
+    effective = dict(zip(TIMELINE_PARAMETERS, timeline(scenario)))
+    return tuple(effective.get(field, getattr(scenario, field)) for field in FLOW_INPUTS[name])
+
+
+def component_flows(scenario, names=None):
+    """{component: (offsets, nominal amounts)} in $M, offsets in years from CURRENT_YEAR"""
+    olympic_year, inflation_rate, tourism_growth_rate = timeline(scenario)
+    games = olympic_year - CURRENT_YEAR
+    return {name: _FLOWS[name](scenario, games, inflation_rate, tourism_growth_rate)
+            for name in (names or ledger_components(scenario))}
+
+
+def ledger_from_flows(flows, discount_rate):
+    """
+    Columnar ledger {column: array} with LEDGER_COLUMNS, sorted by year then component
+    kind is 'benefit' or 'cost'; pv is nominal discounted to CURRENT_YEAR at discount_rate
+    """
+    order = [name for name in COMPONENTS + COST_COMPONENTS if name in flows]
+    offset = np.concatenate([flows[name][0] for name in order])
+    nominal = np.concatenate([flows[name][1] for name in order])
+    component = np.concatenate([np.full(len(flows[name][0]), name) for name in order])
+    kind = np.where(np.isin(component, COST_COMPONENTS), 'cost', 'benefit')
+    rank = np.concatenate([np.full(len(flows[name][0]), i) for i, name in enumerate(order)])
+
+    rows = np.lexsort((rank, offset))
+    offset, nominal, component, kind = offset[rows], nominal[rows], component[rows], kind[rows]
+    return {
+        'year': CURRENT_YEAR + offset,
+        'offset': offset,
+        'component': component,
+        'kind': kind,
+        'nominal': nominal,
+        'pv': nominal / (1 + discount_rate) ** offset
+    }
+
+
+def cash_flow_ledger(scenario):
+    """Ledger of every component with cash flows in the scenario (see ledger_from_flows)"""
+    return ledger_from_flows(component_flows(scenario), scenario.discount_rate)
+
+
+def component_totals(ledger, column='pv'):
+    """{component: sum of the column} in ledger order"""
+    totals = {}
+    for name, value in zip(ledger['component'].tolist(), ledger[column].tolist()):
+        totals[name] = totals.get(name, 0.0) + value
+    return totals
+
+
+def annual_matrix(ledger, column='pv', kind=None):
+    """(years, components, matrix) with matrix[i, j] the column total of component i in year j"""
+    rows = np.ones(len(ledger['year']), dtype=bool) if kind is None else ledger['kind'] == kind
+    years = np.unique(ledger['year'])
+    components = list(dict.fromkeys(ledger['component'][rows].tolist()))
+    matrix = np.zeros((len(components), len(years)))
+    index = {name: i for i, name in enumerate(components)}
+    np.add.at(matrix, ([index[name] for name in ledger['component'][rows]],
+                       np.searchsorted(years, ledger['year'][rows])), ledger[column][rows])
+    return years, components, matrix
+
+
+def cumulative_position(ledger, column='pv'):
+    """(years, cumulative net position) - running sum of benefits and costs"""
+    years, _, matrix = annual_matrix(ledger, column)
+    return years, np.cumsum(matrix.sum(axis=0))
+
+
+def payback_year(ledger, column='pv'):
+    """First year from which the cumulative net position stays at or above zero (None if never)"""
+    years, cumulative = cumulative_position(ledger, column)
+    below = np.flatnonzero(cumulative < 0)
+    if not len(below):
+        return int(years[0])
+    if below[-1] == len(years) - 1:
+        return None
+    return int(years[below[-1] + 1])
+
+
+def write_ledger(ledger, path):
+    """Write the ledger as CSV, one row per component and year"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(LEDGER_COLUMNS)
+        writer.writerows(zip(*(ledger[column].tolist() for column in LEDGER_COLUMNS)))
+
+
+def check_ledger(ledger, result, rel_tol=1e-9):
+    """True if the ledger's PV totals match fovi.evaluate() component values and net fiscal gain"""
+    totals = component_totals(ledger)
+    pairs = [(totals.get(name, 0.0), result[name]) for name in COMPONENTS]
+    pairs.append((sum(totals.values()), result['net_fiscal_gain']))
+    return all(math.isclose(a, b, rel_tol=rel_tol, abs_tol=1e-6) for a, b in pairs)
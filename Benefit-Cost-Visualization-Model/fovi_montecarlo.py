@@ -0,0 +1,126 @@
+"""
+FOVI Monte Carlo Simulation
+Streams random parameter draws through the vectorized pipeline in fixed-size chunks
+and accumulates BCR statistics without keeping the individual draws in memory
+"""
+
+import numpy as np
+
+from fovi import PARAMETERS
+from fovi_batch import evaluate_batch
+
+DISTRIBUTIONS = ["Triangular", "Uniform", "Normal"]
+PERCENTILES = [5, 10, 25, 50, 75, 90, 95]
+
+# Fixed BCR histogram - percentiles are read off it to keep memory bounded
+BCR_HISTOGRAM_EDGES = np.linspace(0.0, 5.0, 2001)
+
+
+def sample_parameter(rng, name, distribution, size):
+    """
+    Draw `size` values for one parameter
+    distribution is ('Triangular', low, mode, high), ('Uniform', low, high)
+    or ('Normal', mean, std); draws are clipped to the sidebar range and
+    integer parameters are snapped to their slider step
+    """
+    kind = distribution[0]
+    if kind == "Triangular":
+        low, mode, high = distribution[1:]
+        if high > low:
+            values = rng.triangular(low, min(max(mode, low), high), high, size)
+        else:
+            values = np.full(size, float(low))
+    elif kind == "Uniform":
+        low, high = distribution[1:]
+        values = rng.uniform(low, high, size)
+    elif kind == "Normal":
+        mean, std = distribution[1:]
+        values = rng.normal(mean, std, size)
+    else:
+        raise ValueError(f"Unknown distribution '{kind}' for {name}")
+
+    _, min_val, max_val, step = PARAMETERS[name]
+    values = np.clip(values, min_val, max_val)
+    if step:
+        values = min_val + np.round((values - min_val) / step) * step
+    return values
+
+
+def _histogram_percentile(counts, edges, below, above, q, lowest, highest):
+    """Interpolate the q-th percentile from histogram counts plus out-of-range tallies"""
+    total = counts.sum() + below + above
+    target = total * q / 100
+    if target <= below:
+        return lowest
+    if target > total - above:
+        return highest
+    cumulative = below + np.cumsum(counts)
+    idx = int(np.searchsorted(cumulative, target))
+    previous = cumulative[idx - 1] if idx > 0 else below
+    fraction = (target - previous) / counts[idx] if counts[idx] else 0.0
+    return edges[idx] + fraction * (edges[idx + 1] - edges[idx])
+
+
+def run_monte_carlo(baseline, distributions, n_draws=1_000_000, seed=None,
+                    chunk_size=100_000, edges=BCR_HISTOGRAM_EDGES, progress=None):
+    """
+    Monte Carlo BCR simulation
+    baseline holds point estimates for every parameter; distributions maps the
+    parameters to randomize onto distribution tuples (see sample_parameter).
+    Results are reproducible for a given seed and chunk_size. progress, if given,
+    is called with the fraction of draws completed after each chunk.
+    """
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(len(edges) - 1, dtype=np.int64)
+    below = above = 0
+    viable = surplus = 0
+    lowest, highest = np.inf, -np.inf
+    # Running mean / sum of squared deviations merged chunk by chunk
+    drawn, mean, m2 = 0, 0.0, 0.0
+    gain_total = 0.0
+
+    while drawn < n_draws:
+        size = min(chunk_size, n_draws - drawn)
+        params = dict(baseline)
+        for name, distribution in distributions.items():
+            params[name] = sample_parameter(rng, name, distribution, size)
+        results = evaluate_batch(params)
+        bcr = np.broadcast_to(results['bcr'], (size,))
+        net_fiscal_gain = np.broadcast_to(results['net_fiscal_gain'], (size,))
+
+        counts += np.histogram(bcr, bins=edges)[0]
+        below += int((bcr < edges[0]).sum())
+        above += int((bcr > edges[-1]).sum())
+        viable += int((bcr >= 1.0).sum())
+        surplus += int((net_fiscal_gain > 0).sum())
+        lowest = min(lowest, float(bcr.min()))
+        highest = max(highest, float(bcr.max()))
+        gain_total += float(net_fiscal_gain.sum())
+
+        chunk_mean = float(bcr.mean())
+        chunk_m2 = float(((bcr - chunk_mean) ** 2).sum())
+        delta = chunk_mean - mean
+        combined = drawn + size
+        mean += delta * size / combined
+        m2 += chunk_m2 + delta ** 2 * drawn * size / combined
+        drawn = combined
+
+        if progress is not None:
+            progress(drawn / n_draws)
+
+    return {
+        'draws': drawn,
+        'p_viable': viable / drawn,
+        'p_surplus': surplus / drawn,
+        'mean_bcr': mean,
+        'std_bcr': (m2 / (drawn - 1)) ** 0.5 if drawn > 1 else 0.0,
+        'min_bcr': lowest,
+        'max_bcr': highest,
+        'mean_net_fiscal_gain': gain_total / drawn,
+        'percentiles': {q: float(_histogram_percentile(counts, edges, below, above, q, lowest, highest))
+                        for q in PERCENTILES},
+        'histogram': counts,
+        'edges': edges,
+        'below_range': below,
+        'above_range': above
+    }
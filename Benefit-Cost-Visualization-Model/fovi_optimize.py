@@ -0,0 +1,240 @@
+"""
+FOVI Optimizer
+Best public spending / private share / Games year combination for an objective
+(net_fiscal_gain or bcr) subject to constraints such as a net public cost cap or a
+minimum number of jobs. All other parameters stay at their baseline values.
+The decision box is evaluated as one grid through evaluate_batch; its upper envelope
+of objective against net public cost (the frontier: best point per cost bin) is
+cached per constraint set, so moving the cost cap is a lookup. The best grid point is then refined on shrinking
+local grids, and exact gradients at the optimum give the shadow price of every
+binding constraint
+"""
+
+import functools
+import time
+
+import numpy as np
+
+from fovi import PARAMETERS, TIMELINE_PARAMETERS, default_parameters
+from fovi_batch import evaluate_batch
+from fovi_gradients import gradients
+
+OBJECTIVES = ['net_fiscal_gain', 'bcr']
+
+# Constraint name: (evaluate_batch output, sense)
+CONSTRAINTS = {
+    'max_net_public_cost': ('net_public_cost', '<='),
+    'min_jobs': ('jobs_created', '>='),
+    'min_bcr': ('bcr', '>='),
+    'min_net_fiscal_gain': ('net_fiscal_gain', '>='),
+}
+COST_CAP = 'max_net_public_cost'
+
+DEFAULT_VARIABLES = ['public_spending', 'private_share', 'olympic_year']
+DEFAULT_RESOLUTION = 101
+FRONTIER_BINS = 200
+REFINE_ROUNDS = 6
+REFINE_POINTS = 11
+
+# A constraint within this share of its bound counts as binding
+_ACTIVE_TOLERANCE = 1e-3
+
+
+def decision_variables(analysis_mode, variables=None):
+    """Variables to optimize, without timeline parameters in modes that ignore them"""
+    variables = list(variables or DEFAULT_VARIABLES)
+    unknown = [name for name in variables if name not in PARAMETERS]
+    if unknown:
+        raise ValueError(f"Unknown parameter(s): {unknown}")
+    if analysis_mode != "Full Economic Impact":
+        variables = [name for name in variables if name not in TIMELINE_PARAMETERS]
+    return variables
+
+
+def _check(objective, constraints):
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}' (expected one of {', '.join(OBJECTIVES)})")
+    unknown = set(constraints) - set(CONSTRAINTS)
+    if unknown:
+        raise ValueError(f"Unknown constraint(s): {sorted(unknown)} (expected {', '.join(CONSTRAINTS)})")
+
+
+def grid_values(name, resolution=DEFAULT_RESOLUTION):
+    """Candidate values of one variable: every slider step, or `resolution` points across the range"""
+    _, min_val, max_val, step = PARAMETERS[name]
+    if step:
+        return np.arange(min_val, max_val + step / 2, step, dtype=float)
+    return np.linspace(min_val, max_val, resolution)
+
+
+def feasible(results, constraints):
+    """Boolean mask of the evaluated scenarios that meet every constraint"""
+    ok = np.ones(np.shape(results['bcr']), dtype=bool)
+    for name, bound in constraints.items():
+        output, sense = CONSTRAINTS[name]
+        ok &= results[output] <= bound if sense == '<=' else results[output] >= bound
+    return ok
+
+
+def _evaluate(baseline, values):
+    params = dict(baseline)
+    params.update(values)
+    return evaluate_batch(params)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_frontier(baseline_items, objective, constraint_items, variables, resolution, bins):
+    baseline = dict(baseline_items)
+    axes = [grid_values(name, resolution) for name in variables]
+    mesh = [axis.ravel() for axis in np.meshgrid(*axes, indexing='ij')]
+    values = dict(zip(variables, mesh))
+    results = _evaluate(baseline, values)
+
+    cost = np.broadcast_to(results['net_public_cost'], mesh[0].shape)
+    score = np.broadcast_to(results[objective], mesh[0].shape)
+    ok = feasible({name: np.broadcast_to(value, mesh[0].shape) for name, value in results.items()},
+                  dict(constraint_items))
+
+    # Best feasible point in each net public cost bin
+    index = np.flatnonzero(ok)
+    if len(index):
+        edges = np.linspace(cost[index].min(), cost[index].max(), bins + 1)
+        bin_of = np.clip(np.searchsorted(edges, cost[index], side='right') - 1, 0, bins - 1)
+        order = np.lexsort((-score[index], bin_of))
+        first = np.r_[True, bin_of[order][1:] != bin_of[order][:-1]]
+        index = index[order[first]]
+    frontier = {
+        'net_public_cost': cost[index],
+        'objective': score[index],
+        'values': {name: value[index] for name, value in values.items()},
+        'evaluations': mesh[0].size
+    }
+    for array in [frontier['net_public_cost'], frontier['objective'], *frontier['values'].values()]:
+        array.setflags(write=False)
+    return frontier
+
+
+def frontier(baseline, objective='net_fiscal_gain', constraints=None, variables=None,
+             resolution=DEFAULT_RESOLUTION, bins=FRONTIER_BINS):
+    """
+    Best objective reachable at each net public cost over the decision grid
+    The feasible grid points are split into `bins` net public cost bins and the best
+    point of each is kept. Constraints other than the cost cap filter the grid; the cap
+    is applied by optimize() as a lookup. Returns {'net_public_cost' (ascending),
+    'objective', 'values': {variable: array}, 'evaluations'}; cached per baseline and
+    constraint set
+    """
+    constraints = {name: float(bound) for name, bound in (constraints or {}).items() if name != COST_CAP}
+    _check(objective, constraints)
+    p = default_parameters()
+    p.update(baseline)
+    variables = tuple(decision_variables(p['analysis_mode'], variables))
+    baseline_items = tuple(sorted((name, value) for name, value in p.items() if name not in variables))
+    return _cached_frontier(baseline_items, objective, tuple(sorted(constraints.items())), variables,
+                            resolution, bins)
+
+
+def _refine(baseline, objective, constraints, start, variables, resolution, rounds, points):
+    """Zoom a local grid around the best point; stepped variables stay at their grid value"""
+    continuous = [name for name in variables if not PARAMETERS[name][3]]
+    best = dict(start)
+    params = dict(baseline)
+    params.update(best)
+    best_score = float(np.asarray(evaluate_batch(params)[objective]))
+    evaluations = 1
+    if not continuous:
+        return best, best_score, evaluations
+
+    widths = {name: (PARAMETERS[name][2] - PARAMETERS[name][1]) / (resolution - 1) for name in continuous}
+    for _ in range(rounds):
+        axes = []
+        for name in continuous:
+            _, min_val, max_val, _ = PARAMETERS[name]
+            axes.append(np.clip(np.linspace(best[name] - widths[name], best[name] + widths[name], points),
+                                min_val, max_val))
+        mesh = [axis.ravel() for axis in np.meshgrid(*axes, indexing='ij')]
+        values = dict(zip(continuous, mesh))
+        values.update({name: best[name] for name in variables if name not in continuous})
+        results = _evaluate(baseline, values)
+        results = {name: np.broadcast_to(value, mesh[0].shape) for name, value in results.items()}
+        evaluations += mesh[0].size
+
+        score = np.where(feasible(results, constraints), results[objective], -np.inf)
+        i = int(np.argmax(score))
+        if score[i] > best_score:
+            best_score = float(score[i])
+            best.update({name: float(values[name][i]) for name in continuous})
+        widths = {name: width * 2 / (points - 1) for name, width in widths.items()}
+    return best, best_score, evaluations
+
+
+def shadow_prices(baseline, objective, constraints, optimum, variables):
+    """
+    Change in the optimal objective per unit increase of each binding constraint's bound
+    From the exact gradients at the optimum: grad f = sum of lambda_i * grad g_i over the
+    binding constraints, solved by least squares over the continuous variables not at a bound
+    """
+    params = dict(baseline)
+    params.update(optimum)
+    outputs = sorted({objective} | {CONSTRAINTS[name][0] for name in constraints})
+    local = gradients(params, variables, outputs)
+
+    active = []
+    for name, bound in constraints.items():
+        value = float(local['values'][CONSTRAINTS[name][0]])
+        if abs(value - bound) <= _ACTIVE_TOLERANCE * max(abs(bound), 1.0):
+            active.append(name)
+
+    free = [name for name in variables if not PARAMETERS[name][3]
+            and PARAMETERS[name][1] < optimum[name] < PARAMETERS[name][2]]
+    prices = {name: 0.0 for name in constraints}
+    if active and free:
+        g = np.array([[float(local['gradients'][CONSTRAINTS[name][0]][v]) for v in free] for name in active])
+        f = np.array([float(local['gradients'][objective][v]) for v in free])
+        prices.update(zip(active, np.linalg.lstsq(g.T, f, rcond=None)[0].tolist()))
+    return {
+        'active': active,
+        'shadow_prices': prices,
+        'gradient': {name: float(local['gradients'][objective][name]) for name in variables}
+    }
+
+
+def optimize(baseline, objective='net_fiscal_gain', constraints=None, variables=None,
+             resolution=DEFAULT_RESOLUTION, refine_rounds=REFINE_ROUNDS, refine_points=REFINE_POINTS):
+    """
+    Maximize the objective over the decision variables subject to the constraints
+    constraints maps names in CONSTRAINTS to bounds, e.g. {'max_net_public_cost': 6000,
+    'min_jobs': 100_000}. Returns {'feasible', 'values', 'objective', 'results',
+    'active', 'shadow_prices', 'gradient', 'evaluations', 'seconds'}; when nothing is
+    feasible only 'feasible' (False), 'evaluations' and 'seconds' are set
+    """
+    start_time = time.perf_counter()
+    constraints = {name: float(bound) for name, bound in (constraints or {}).items()}
+    _check(objective, constraints)
+    p = default_parameters()
+    p.update(baseline)
+    variables = decision_variables(p['analysis_mode'], variables)
+
+    front = frontier(p, objective, constraints, variables, resolution)
+    cap = constraints.get(COST_CAP, np.inf)
+    within = np.flatnonzero(front['net_public_cost'] <= cap)
+    if not len(within):
+        return {'feasible': False, 'evaluations': front['evaluations'],
+                'seconds': time.perf_counter() - start_time}
+
+    i = within[np.argmax(front['objective'][within])]
+    start = {name: float(front['values'][name][i]) for name in variables}
+    optimum, score, evaluations = _refine(p, objective, constraints, start, variables, resolution,
+                                          refine_rounds, refine_points)
+    params = dict(p)
+    params.update(optimum)
+    results = {name: float(np.asarray(value)) for name, value in evaluate_batch(params).items()}
+    return {
+        'feasible': True,
+        'values': optimum,
+        'objective': score,
+        'results': results,
+        **shadow_prices(p, objective, constraints, optimum, variables),
+        'evaluations': front['evaluations'] + evaluations,
+        'seconds': time.perf_counter() - start_time
+    }
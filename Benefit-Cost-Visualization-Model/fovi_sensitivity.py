@@ -0,0 +1,158 @@
+"""
+FOVI Global Sensitivity Analysis
+Sobol first/total-order indices (Saltelli sampling on a scrambled Sobol sequence) and
+Morris elementary effects of the BCR and net fiscal gain over the sidebar parameters
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.stats import qmc
+
+from fovi import PARAMETERS, bcr_parameters
+from fovi_batch import evaluate_batch
+
+OUTPUTS = ['bcr', 'net_fiscal_gain']
+
+# Below this many model evaluations a process pool costs more than it saves
+PARALLEL_THRESHOLD = 200_000
+
+# Worker state installed once per process by _init_worker
+_worker = {}
+
+
+def scale_unit_samples(unit, names):
+    """Map unit-hypercube samples (rows x len(names)) onto the sidebar ranges"""
+    params = {}
+    for col, name in enumerate(names):
+        _, min_val, max_val, step = PARAMETERS[name]
+        values = min_val + unit[:, col] * (max_val - min_val)
+        if step:
+            values = min_val + np.round((values - min_val) / step) * step
+        params[name] = values
+    return params
+
+
+def evaluate_unit_samples(baseline, names, unit, outputs=OUTPUTS):
+    """Evaluate unit-hypercube rows with every other parameter held at baseline"""
+    params = dict(baseline)
+    params.update(scale_unit_samples(unit, names))
+    results = evaluate_batch(params)
+    return {out: np.broadcast_to(results[out], (len(unit),)) for out in outputs}
+
+
+def _init_worker(baseline, names, A, B, outputs):
+    _worker.update(baseline=baseline, names=names, A=A, B=B, outputs=outputs)
+
+
+def _evaluate_saltelli_matrix(index):
+    """Evaluate A (index -2), B (index -1) or A with column `index` taken from B"""
+    if index == -2:
+        unit = _worker['A']
+    elif index == -1:
+        unit = _worker['B']
+    else:
+        unit = _worker['A'].copy()
+        unit[:, index] = _worker['B'][:, index]
+    return evaluate_unit_samples(_worker['baseline'], _worker['names'], unit, _worker['outputs'])
+
+
+def sobol_indices(baseline, names=None, base_samples=2**12, outputs=OUTPUTS, seed=None, workers=None):
+    """
+    Sobol first-order (Saltelli 2010) and total-order (Jansen) indices
+    base_samples is rounded up to a power of two; the model is evaluated
+    base_samples * (len(names) + 2) times, one Saltelli matrix per task,
+    across `workers` processes (default: all cores)
+    """
+    names = list(names or bcr_parameters(baseline.get('analysis_mode', "Full Economic Impact")))
+    dims = len(names)
+    m = int(np.ceil(np.log2(base_samples)))
+    AB = qmc.Sobol(d=2 * dims, scramble=True, seed=seed).random_base2(m)
+    A, B = AB[:, :dims], AB[:, dims:]
+
+    tasks = [-2, -1] + list(range(dims))
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(A) * len(tasks) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(baseline, names, A, B, outputs)) as pool:
+            evaluated = list(pool.map(_evaluate_saltelli_matrix, tasks))
+    else:
+        _init_worker(baseline, names, A, B, outputs)
+        evaluated = [_evaluate_saltelli_matrix(index) for index in tasks]
+        _worker.clear()
+
+    f_A, f_B, f_AB = evaluated[0], evaluated[1], evaluated[2:]
+    indices = {}
+    for out in outputs:
+        variance = np.var(np.concatenate([f_A[out], f_B[out]]))
+        first, total = {}, {}
+        for i, name in enumerate(names):
+            if variance > 0:
+                first[name] = float(np.mean(f_B[out] * (f_AB[i][out] - f_A[out])) / variance)
+                total[name] = float(0.5 * np.mean((f_A[out] - f_AB[i][out]) ** 2) / variance)
+            else:
+                first[name] = total[name] = 0.0
+        indices[out] = {'S1': first, 'ST': total}
+    indices['evaluations'] = len(A) * len(tasks)
+    return indices
+
+
+def morris_effects(baseline, names=None, trajectories=50, levels=4, outputs=OUTPUTS, seed=None):
+    """
+    Morris elementary effects on the unit-scaled parameter ranges
+    Returns mu (mean), mu_star (mean absolute) and sigma (std) of the effects per parameter
+    """
+    names = list(names or bcr_parameters(baseline.get('analysis_mode', "Full Economic Impact")))
+    dims = len(names)
+    delta = levels / (2 * (levels - 1))
+    rng = np.random.default_rng(seed)
+
+    # Quasi-random trajectory starts snapped to the lower half of the level grid
+    m = int(np.ceil(np.log2(trajectories)))
+    starts = qmc.Sobol(d=dims, scramble=True, seed=rng).random_base2(m)[:trajectories]
+    lower_levels = levels // 2
+    base = np.floor(starts * lower_levels) / (levels - 1)
+
+    points = np.empty((trajectories, dims + 1, dims))
+    signs = rng.choice([-1.0, 1.0], size=(trajectories, dims))
+    orders = np.argsort(rng.random((trajectories, dims)), axis=1)
+    for t in range(trajectories):
+        x = base[t] + np.where(signs[t] < 0, delta, 0.0)
+        points[t, 0] = x
+        for step, col in enumerate(orders[t]):
+            x = x.copy()
+            x[col] += signs[t, col] * delta
+            points[t, step + 1] = x
+
+    results = evaluate_unit_samples(baseline, names, points.reshape(-1, dims), outputs)
+    effects = {}
+    for out in outputs:
+        y = results[out].reshape(trajectories, dims + 1)
+        elementary = np.empty((trajectories, dims))
+        rows = np.arange(trajectories)[:, None]
+        elementary[rows, orders] = np.diff(y, axis=1) / (signs[rows, orders] * delta)
+        effects[out] = {
+            'mu': dict(zip(names, elementary.mean(axis=0).tolist())),
+            'mu_star': dict(zip(names, np.abs(elementary).mean(axis=0).tolist())),
+            'sigma': dict(zip(names, elementary.std(axis=0, ddof=1).tolist()))
+        }
+    effects['evaluations'] = trajectories * (dims + 1)
+    return effects
+
+
+def tornado_swings(baseline, names=None, output='bcr'):
+    """
+    One-at-a-time swing of `output` with each parameter at its sidebar min and max
+    Returns {name: (value_at_min, value_at_max)} from a single batch evaluation
+    """
+    names = list(names or bcr_parameters(baseline.get('analysis_mode', "Full Economic Impact")))
+    dims = len(names)
+    params = {name: np.full(2 * dims, baseline[name], dtype=float) for name in PARAMETERS}
+    params['analysis_mode'] = baseline.get('analysis_mode', "Full Economic Impact")
+    for i, name in enumerate(names):
+        _, min_val, max_val, _ = PARAMETERS[name]
+        params[name][2 * i] = min_val
+        params[name][2 * i + 1] = max_val
+    values = np.broadcast_to(evaluate_batch(params)[output], (2 * dims,))
+    return {name: (float(values[2 * i]), float(values[2 * i + 1])) for i, name in enumerate(names)}
@@ -0,0 +1,364 @@
+"""
+FOVI Service
+Local JSON HTTP service that evaluates scenarios, so other tools can get BCRs and component
+PVs without driving the dashboard. Standard library asyncio plus NumPy - nothing else:
+- POST /evaluate takes one scenario object, a list of them or {"scenarios": [...]};
+  missing parameters take the dashboard defaults and values off their slider range or step
+  are rejected with 400. GET /evaluate?name=value&... evaluates one
+- concurrent requests are micro-batched: scenarios arriving within BATCH_WINDOW become one
+  vectorized evaluate_batch call
+- results are cached per canonical scenario (defaults filled in, types coerced, keys sorted)
+  and responses carry an ETag; a GET with a matching If-None-Match gets 304 without evaluating
+- GET /stats reports requests, cache hit rate, batch sizes and p50/p99 latency;
+  GET /parameters lists the parameters and their slider ranges
+
+Usage:
+    python fovi_service.py [--host 127.0.0.1] [--port 8765]
+    curl -d '{"public_spending": 12000, "private_share": 0.4}' http://127.0.0.1:8765/evaluate
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import sys
+import time
+from collections import OrderedDict, deque
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+from fovi import ANALYSIS_MODES, COMPONENTS, PARAMETERS, Scenario
+from fovi_batch import evaluate_batch
+
+RESULT_FIELDS = COMPONENTS + ['total_tax_benefits', 'total_benefits', 'net_public_cost', 'net_fiscal_gain',
+                              'bcr', 'roi', 'gdp_impact', 'jobs_created', 'fovi_score']
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+BATCH_WINDOW = 0.002        # seconds to collect more scenarios after the first one arrives
+MAX_BATCH = 4096            # scenarios per evaluate_batch call
+CACHE_ENTRIES = 100_000
+MAX_SCENARIOS = 10_000      # per request
+MAX_BODY = 16 * 1024 * 1024
+LATENCY_WINDOW = 10_000     # most recent /evaluate requests kept for the percentiles
+
+STATUS_TEXT = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 413: 'Payload Too Large'}
+
+
+def parameter_value(name, value):
+    """
+    One parameter as a float, checked against its slider range (and step for stepped parameters)
+    Query-string values arrive as text, JSON values as numbers
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"{name} must be a number")
+    try:
+        number = float(value)
+    except (ValueError, OverflowError):
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+    _, min_val, max_val, step = PARAMETERS[name]
+    if not math.isfinite(number) or not min_val <= number <= max_val:
+        raise ValueError(f"{name} must be between {min_val} and {max_val}, got {value!r}")
+    if step and not math.isclose((number - min_val) / step, round((number - min_val) / step), abs_tol=1e-9):
+        raise ValueError(f"{name} must be {min_val} plus a multiple of {step}, got {value!r}")
+    return number
+
+
+def canonical_scenario(data):
+    """
+    (key, params) for one scenario payload
+    params is the full Scenario dict; key is its canonical JSON, so payloads that differ only
+    in key order, omitted defaults or 12000 vs 12000.0 share one cache entry
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Each scenario must be a JSON object")
+    values = {name: parameter_value(name, value) if name in PARAMETERS else value
+              for name, value in data.items()}
+    try:
+        params = Scenario.from_dict(values).to_dict()
+    except TypeError as error:
+        raise ValueError(f"Invalid scenario: {error}") from None
+    return json.dumps(params, sort_keys=True, separators=(',', ':')), params
+
+
+def entity_tag(keys):
+    """Strong ETag of a response - results are a pure function of the canonical scenarios"""
+    return '"' + hashlib.sha256('\n'.join(keys).encode('utf-8')).hexdigest()[:20] + '"'
+
+
+def evaluate_rows(rows):
+    """
+    Evaluate a list of Scenario dicts in one evaluate_batch call; one result dict per row
+    Non-finite results become None so every response is valid JSON
+    """
+    columns = {name: np.array([row[name] for row in rows], dtype=float) for name in PARAMETERS}
+    columns['analysis_mode'] = np.array([row['analysis_mode'] for row in rows])
+    results = evaluate_batch(columns)
+    values = [[value if math.isfinite(value) else None
+               for value in np.broadcast_to(results[field], (len(rows),)).tolist()]
+              for field in RESULT_FIELDS]
+    return [dict(zip(RESULT_FIELDS, row)) for row in zip(*values)]
+
+
+class ResultCache:
+    """Least-recently-used map from canonical scenario key to result dict"""
+
+    def __init__(self, max_entries=CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return result
+
+    def put(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+class MicroBatcher:
+    """
+    Collects the scenarios of concurrent requests into vectorized evaluate_batch calls
+    One worker task takes everything queued within `window` seconds of the first arrival (up to
+    max_batch); while a batch runs, the next one keeps filling. Identical scenarios in flight
+    share one evaluation
+    """
+
+    def __init__(self, cache, window=BATCH_WINDOW, max_batch=MAX_BATCH):
+        self.cache = cache
+        self.window = window
+        self.max_batch = max_batch
+        self.queue = asyncio.Queue()
+        self.pending = {}
+        self.batches = 0
+        self.evaluated = 0
+        self.largest = 0
+
+    async def evaluate(self, key, params):
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+        future = self.pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.pending[key] = future
+            self.queue.put_nowait((key, params))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self.queue.get()]
+            await asyncio.sleep(self.window)
+            while len(items) < self.max_batch and not self.queue.empty():
+                items.append(self.queue.get_nowait())
+
+            try:
+                results = await loop.run_in_executor(None, evaluate_rows, [params for _, params in items])
+            except Exception as error:
+                for key, _ in items:
+                    self.pending.pop(key).set_exception(error)
+                continue
+
+            self.batches += 1
+            self.evaluated += len(items)
+            self.largest = max(self.largest, len(items))
+            for (key, _), result in zip(items, results):
+                self.cache.put(key, result)
+                self.pending.pop(key).set_result(result)
+
+
+class FoviService:
+    """Request routing, statistics and the HTTP/1.1 connection handler"""
+
+    def __init__(self, window=BATCH_WINDOW, max_batch=MAX_BATCH, cache_entries=CACHE_ENTRIES):
+        self.cache = ResultCache(cache_entries)
+        self.batcher = MicroBatcher(self.cache, window, max_batch)
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.scenarios = 0
+        self.not_modified = 0
+        self.started = time.time()
+
+    def start(self):
+        """Start the batch worker; call from inside the running event loop"""
+        return asyncio.get_running_loop().create_task(self.batcher.run())
+
+    def parse_scenarios(self, method, query, body):
+        """(scenarios, batched) from a GET query string or a POST JSON body"""
+        if method == 'GET':
+            return [dict(parse_qsl(query, strict_parsing=bool(query)))], False
+        try:
+            payload = json.loads(body or b'null')
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Invalid JSON: {error}") from None
+        if isinstance(payload, dict) and 'scenarios' in payload:
+            if set(payload) != {'scenarios'} or not isinstance(payload['scenarios'], list):
+                raise ValueError('Batch payloads must be {"scenarios": [...]}')
+            return payload['scenarios'], True
+        if isinstance(payload, list):
+            return payload, True
+        return [payload], False
+
+    async def evaluate(self, method, query, headers, body):
+        scenarios, batched = self.parse_scenarios(method, query, body)
+        if not scenarios or len(scenarios) > MAX_SCENARIOS:
+            raise ValueError(f"Send between 1 and {MAX_SCENARIOS:,} scenarios per request")
+        canonical = [canonical_scenario(scenario) for scenario in scenarios]
+        tag = entity_tag([key for key, _ in canonical])
+        self.scenarios += len(canonical)
+        if method == 'GET' and tag in headers.get('if-none-match', ''):
+            self.not_modified += 1
+            return 304, None, {'ETag': tag}
+
+        results = await asyncio.gather(*(self.batcher.evaluate(key, params) for key, params in canonical))
+        payload = {'results': list(results)} if batched else {'result': results[0]}
+        return 200, payload, {'ETag': tag}
+
+    def stats(self):
+        latencies = np.array(self.latencies) * 1000
+        lookups = self.cache.hits + self.cache.misses
+        return {
+            'requests': self.requests,
+            'scenarios': self.scenarios,
+            'not_modified': self.not_modified,
+            'cache': {'entries': len(self.cache.entries), 'hits': self.cache.hits, 'misses': self.cache.misses,
+                      'hit_rate': self.cache.hits / lookups if lookups else None},
+            'batches': self.batcher.batches,
+            'mean_batch_size': self.batcher.evaluated / self.batcher.batches if self.batcher.batches else None,
+            'max_batch_size': self.batcher.largest,
+            'latency_ms': {'p50': float(np.percentile(latencies, 50)) if len(latencies) else None,
+                           'p99': float(np.percentile(latencies, 99)) if len(latencies) else None,
+                           'samples': len(latencies)},
+            'uptime_seconds': time.time() - self.started
+        }
+
+    async def route(self, method, target, headers, body):
+        """(status, JSON payload or None, extra headers) for one request"""
+        url = urlsplit(target)
+        if url.path == '/evaluate':
+            if method not in ('GET', 'POST'):
+                return 405, {'error': "Use GET or POST"}, {'Allow': 'GET, POST'}
+            start = time.perf_counter()
+            try:
+                response = await self.evaluate(method, url.query, headers, body)
+            except ValueError as error:
+                return 400, {'error': str(error)}, {}
+            self.latencies.append(time.perf_counter() - start)
+            return response
+
+        routes = {
+            '/health': lambda: {'status': 'ok'},
+            '/stats': self.stats,
+            '/parameters': lambda: {
+                'analysis_modes': ANALYSIS_MODES,
+                'parameters': {name: {'label': label, 'min': min_val, 'max': max_val, 'step': step}
+                               for name, (label, min_val, max_val, step) in PARAMETERS.items()}
+            },
+        }
+        if url.path not in routes:
+            return 404, {'error': f"Unknown path {url.path}"}, {}
+        if method != 'GET':
+            return 405, {'error': "Use GET"}, {'Allow': 'GET'}
+        return 200, routes[url.path](), {}
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection until the client closes it (HTTP/1.1 keep-alive)"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' and (version == 'HTTP/1.1' or connection == 'keep-alive')
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY:
+                    status, payload, extra = 413, {'error': f"Body over {MAX_BODY:,} bytes"}, {}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b''
+                    self.requests += 1
+                    status, payload, extra = await self.route(method.upper(), target, headers, body)
+
+                content = b'' if payload is None else json.dumps(
+                    payload, separators=(',', ':'), allow_nan=False).encode('utf-8')
+                response_headers = {'Content-Type': 'application/json', 'Content-Length': str(len(content)),
+                                    'Cache-Control': 'no-cache', **extra,
+                                    'Connection': 'keep-alive' if keep_alive else 'close'}
+                head = f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n" + ''.join(
+                    f"{name}: {value}\r\n" for name, value in response_headers.items()) + "\r\n"
+                writer.write(head.encode('latin-1') + content)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, window=BATCH_WINDOW, max_batch=MAX_BATCH,
+                cache_entries=CACHE_ENTRIES, ready=None):
+    """Run the service until cancelled; ready, if given, is called with the bound (host, port)"""
+    service = FoviService(window, max_batch, cache_entries)
+    worker = service.start()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    if ready is not None:
+        ready(server.sockets[0].getsockname()[:2])
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        worker.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve FOVI scenario evaluation as a local JSON API")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"interface to bind (default {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"port (default {DEFAULT_PORT})")
+    parser.add_argument('--window-ms', type=float, default=BATCH_WINDOW * 1000,
+                        help=f"micro-batch collection window (default {BATCH_WINDOW * 1000:g} ms)")
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH,
+                        help=f"scenarios per engine call (default {MAX_BATCH:,})")
+    parser.add_argument('--cache-entries', type=int, default=CACHE_ENTRIES,
+                        help=f"cached scenario results (default {CACHE_ENTRIES:,})")
+    args = parser.parse_args(argv)
+
+    def ready(address):
+        print(f"✓ FOVI service on http://{address[0]}:{address[1]} "
+              f"(POST /evaluate, GET /stats, GET /parameters)", file=sys.stderr)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.window_ms / 1000, args.max_batch,
+                          args.cache_entries, ready))
+    except KeyboardInterrupt:
+        pass
+    except OSError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+FOVI Parameter Sweep
+BCR surface over any two sidebar parameters, evaluated in a single vectorized pass
+with every other parameter held at its baseline value
+"""
+
+import numpy as np
+
+from fovi import PARAMETERS
+from fovi_batch import evaluate_batch
+
+DEFAULT_RESOLUTION = 500
+
+
+def sweep_values(name, resolution=DEFAULT_RESOLUTION):
+    """
+    Grid values across the sidebar range of `name`
+    Integer parameters with fewer slider steps than `resolution` use each step once
+    """
+    _, min_val, max_val, step = PARAMETERS[name]
+    values = np.linspace(min_val, max_val, resolution)
+    if step:
+        values = np.unique(min_val + np.round((values - min_val) / step) * step)
+    return values
+
+
+def bcr_grid(baseline, x_name, y_name, resolution=DEFAULT_RESOLUTION):
+    """
+    BCR on the len(y) x len(x) grid of x_name / y_name values
+    Returns x and y values, the BCR surface (rows follow y) and the share of grid
+    points at or above break-even (BCR 1.0)
+    """
+    if x_name == y_name:
+        raise ValueError("Sweep parameters must differ")
+    x = sweep_values(x_name, resolution)
+    y = sweep_values(y_name, resolution)
+
+    # Broadcasting a row against a column evaluates the whole grid without a meshgrid
+    params = dict(baseline)
+    params[x_name] = x[None, :]
+    params[y_name] = y[:, None]
+    bcr = np.broadcast_to(evaluate_batch(params)['bcr'], (len(y), len(x)))
+
+    return {
+        'x': x,
+        'y': y,
+        'bcr': bcr.astype(np.float32),
+        'viable_share': float((bcr >= 1.0).mean())
+    }
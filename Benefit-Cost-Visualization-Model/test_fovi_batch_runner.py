@@ -0,0 +1,65 @@
+"""
+Tests for fovi_batch_runner: blank cells, cell validation and the Parquet output
+Run from this directory: python -m pytest test_fovi_batch_runner.py
+"""
+
+import pandas as pd
+import pytest
+
+from fovi import Scenario, default_parameters, evaluate
+from fovi_batch_runner import evaluate_chunk, run_batch
+
+
+def test_blank_cells_take_the_defaults():
+    frame = pd.DataFrame({'public_spending': [12000, None], 'legacy_years': [7, None],
+                          'analysis_mode': ['Basic Tourism Model', None]})
+    output = evaluate_chunk(frame)
+    defaults = default_parameters()
+    assert output['public_spending'].tolist() == [12000, defaults['public_spending']]
+    assert output['legacy_years'].tolist() == [7, defaults['legacy_years']]
+    assert output['bcr'].iloc[1] == pytest.approx(evaluate(Scenario())['bcr'])
+    assert output['bcr'].notna().all()
+
+
+@pytest.mark.parametrize('column, values, message', [
+    ('public_spending', [12000, 1], "Row 2, column 'public_spending': must be between 5000 and 20000"),
+    ('discount_rate', [0.05, 'abc'], "Row 2, column 'discount_rate': must be a finite number"),
+    ('discount_rate', [float('inf'), 0.05], "Row 1, column 'discount_rate': must be a finite number"),
+    ('legacy_years', [5, 3.5], "Row 2, column 'legacy_years': must be 3 plus a multiple of 1"),
+    ('olympic_year', [2037, 2040], "Row 1, column 'olympic_year': must be 2032 plus a multiple of 2"),
+])
+def test_invalid_cells_name_row_and_column(column, values, message):
+    with pytest.raises(ValueError, match=message):
+        evaluate_chunk(pd.DataFrame({column: values}))
+
+
+@pytest.mark.parametrize('suffix', ['.csv', '.parquet'])
+def test_rows_are_numbered_across_chunks(tmp_path, suffix):
+    frame = pd.DataFrame({'public_spending': [12000.0] * 7 + [25000.0]})
+    path = tmp_path / f'scenarios{suffix}'
+    if suffix == '.csv':
+        frame.to_csv(path, index=False)
+    else:
+        frame.to_parquet(path, index=False)
+    with pytest.raises(ValueError, match="Row 8, column 'public_spending'"):
+        run_batch(path, tmp_path / 'results.parquet', chunk_size=3, workers=1)
+
+
+def test_results_match_the_engine(tmp_path):
+    scenarios = pd.DataFrame({
+        'name': ['low', 'high', 'basic'],
+        'public_spending': [8000, 18000, None],
+        'olympic_year': [2036, 2044, 2040],
+        'analysis_mode': ['Comprehensive Benefits Model', 'Full Economic Impact', 'Basic Tourism Model'],
+    })
+    scenarios.to_csv(tmp_path / 'scenarios.csv', index=False)
+    assert run_batch(tmp_path / 'scenarios.csv', tmp_path / 'results.parquet', chunk_size=2, workers=1) == 3
+
+    results = pd.read_parquet(tmp_path / 'results.parquet')
+    assert results['name'].tolist() == ['low', 'high', 'basic']
+    assert results['olympic_year'].dtype == 'int64'
+    for row in results.itertuples():
+        expected = evaluate(Scenario(public_spending=row.public_spending, olympic_year=row.olympic_year,
+                                     analysis_mode=row.analysis_mode))
+        assert row.net_fiscal_gain == pytest.approx(expected['net_fiscal_gain'], rel=1e-9)
+        assert row.bcr == pytest.approx(expected['bcr'], rel=1e-9)
@@ -0,0 +1,121 @@
+"""
+Property tests for fovi_discount: every closed form against the plain loop it replaces,
+for scalars and arrays, across rates and horizons (rate -> 0 and empty horizons included)
+Run from this directory: python -m pytest test_fovi_discount.py
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from fovi import calculate_comprehensive_tourism
+from fovi_discount import (_SERIES_THRESHOLD, annuity_pv, arithmetic_geometric_sum, geometric_sum,
+                           linear_annuity_pv)
+
+HORIZONS = [0, 1, 2, 3, 10, 20, 30, 60]
+# log ratios from strongly decaying to growing, with values either side of the Taylor threshold
+LOG_RATIOS = [-0.5, -0.2, -0.05, -1e-3, -2e-5, -1e-7, -1e-12, 0.0, 1e-12, 1e-7, 2e-5, 1e-3, 0.05]
+RATES = [0.0, 1e-12, 1e-9, 1e-6, 1e-4, 0.02, 0.05, 0.08, 0.25]
+
+
+def close(value, terms, rel=1e-9):
+    """value matches the sum of terms to rel times the sum of their magnitudes"""
+    return abs(value - math.fsum(terms)) <= rel * math.fsum(abs(term) for term in terms) + 1e-300
+
+
+@pytest.mark.parametrize('periods', HORIZONS)
+@pytest.mark.parametrize('log_ratio', LOG_RATIOS)
+def test_geometric_sum_matches_loop(log_ratio, periods):
+    terms = [math.exp(log_ratio * k) for k in range(periods)]
+    assert close(geometric_sum(log_ratio, periods), terms)
+
+
+@pytest.mark.parametrize('periods', HORIZONS)
+@pytest.mark.parametrize('log_ratio', LOG_RATIOS)
+def test_arithmetic_geometric_sum_matches_loop(log_ratio, periods):
+    terms = [k * math.exp(log_ratio * k) for k in range(periods)]
+    assert close(arithmetic_geometric_sum(log_ratio, periods), terms)
+
+
+@pytest.mark.parametrize('periods', [10, 30, 60])
+@pytest.mark.parametrize('scale', [0.5, 0.99, 1.01, 2.0])
+def test_accurate_on_both_sides_of_the_taylor_threshold(periods, scale):
+    # Just above the threshold the closed form loses a few digits to cancellation (~1e-12)
+    for log_ratio in [scale * _SERIES_THRESHOLD / periods, -scale * _SERIES_THRESHOLD / periods]:
+        terms = [k * math.exp(log_ratio * k) for k in range(periods)]
+        assert close(arithmetic_geometric_sum(log_ratio, periods), terms, rel=1e-10)
+        assert close(arithmetic_geometric_sum(np.array([log_ratio]), np.array([periods]))[0], terms, rel=1e-10)
+
+
+@pytest.mark.parametrize('periods', HORIZONS)
+@pytest.mark.parametrize('discount_rate', RATES)
+def test_annuity_pv_matches_loop(discount_rate, periods):
+    for start in [0, 1, 8, 16]:
+        # Decay plus inflation as the tourism legacy uses it, shrinking, flat and growing payments
+        for log_growth in [-0.2 + math.log1p(0.03), -0.03, 0.0, math.log1p(0.025), 0.07]:
+            terms = [125.0 * math.exp(log_growth * k) / (1 + discount_rate) ** (start + k)
+                     for k in range(periods)]
+            assert close(annuity_pv(125.0, discount_rate, start, periods, log_growth), terms)
+
+
+@pytest.mark.parametrize('periods', HORIZONS)
+@pytest.mark.parametrize('discount_rate', RATES)
+def test_linear_annuity_pv_matches_loop(discount_rate, periods):
+    for start in [0, 1, 9]:
+        for payment, step in [(0.0, 52.5), (300.0, 0.0), (-45.0, 3.5), (1000.0, -12.0)]:
+            terms = [(payment + step * k) / (1 + discount_rate) ** (start + k) for k in range(periods)]
+            assert close(linear_annuity_pv(payment, step, discount_rate, start, periods), terms)
+
+
+def test_random_scenarios_match_loops():
+    rng = np.random.default_rng(2024)
+    for _ in range(2000):
+        # Rates down to 1e-12, so log ratios land on both sides of the Taylor threshold
+        discount_rate = float(10 ** rng.uniform(-12, math.log10(0.1)))
+        log_growth = float(rng.choice([0.0, rng.normal(0, 0.05)]))
+        start, periods = int(rng.integers(0, 25)), int(rng.integers(0, 41))
+        payment, step = float(rng.uniform(-500, 500)), float(rng.uniform(-50, 50))
+        discount = [(1 + discount_rate) ** -(start + k) for k in range(periods)]
+        assert close(annuity_pv(payment, discount_rate, start, periods, log_growth),
+                     [payment * math.exp(log_growth * k) * d for k, d in enumerate(discount)])
+        assert close(linear_annuity_pv(payment, step, discount_rate, start, periods),
+                     [(payment + step * k) * d for k, d in enumerate(discount)])
+
+
+def test_arrays_match_scalars():
+    log_ratio, periods = np.meshgrid(LOG_RATIOS, HORIZONS)
+    log_ratio, periods = log_ratio.ravel(), periods.ravel().astype(float)
+    for function in [geometric_sum, arithmetic_geometric_sum]:
+        expected = [function(float(L), int(n)) for L, n in zip(log_ratio, periods)]
+        np.testing.assert_allclose(function(log_ratio, periods), expected, rtol=1e-12, atol=1e-300)
+
+    rate, periods = np.meshgrid(RATES, HORIZONS)
+    rate, periods = rate.ravel(), periods.ravel().astype(float)
+    np.testing.assert_allclose(annuity_pv(80.0, rate, 4, periods, -0.1),
+                               [annuity_pv(80.0, float(r), 4, int(n), -0.1) for r, n in zip(rate, periods)],
+                               rtol=1e-12)
+    np.testing.assert_allclose(linear_annuity_pv(80.0, 6.0, rate, 4, periods),
+                               [linear_annuity_pv(80.0, 6.0, float(r), 4, int(n)) for r, n in zip(rate, periods)],
+                               rtol=1e-12)
+
+
+@pytest.mark.parametrize('legacy_years', [0, 1, 3, 10])
+@pytest.mark.parametrize('discount_rate', [0.0, 0.02, 0.08])
+def test_tourism_legacy_breakdown_matches_loop(legacy_years, discount_rate):
+    args = dict(baseline_visitors=140_000_000, uplift_pct=0.12, crowd_out_pct=0.3, spend_per_visitor=1200,
+                tax_rate=0.07, legacy_years=legacy_years, legacy_uplift=0.1, discount_rate=discount_rate,
+                olympic_year=2040, current_year=2024, inflation_rate=0.03, tourism_growth_rate=0.025)
+    result = calculate_comprehensive_tourism(**args)
+    years_until_games = 2040 - 2024
+    net_visitors = (140_000_000 * 1.025 ** years_until_games) * 0.12 * (1 - 0.3)
+    future_spend = 1200 * 1.03 ** years_until_games
+
+    assert [row['Year'] for row in result['legacy_breakdown']] == [f'+{year}' for year in range(1, legacy_years + 1)]
+    for year, row in enumerate(result['legacy_breakdown'], start=1):
+        visitors = net_visitors * 0.1 * math.exp(-0.2 * year)
+        tax = visitors * future_spend * 1.03 ** year * 0.07 / 1_000_000
+        assert row['Visitors'] == pytest.approx(visitors, rel=1e-12)
+        assert row['Tax_PV'] == pytest.approx(tax / (1 + discount_rate) ** (years_until_games + year), rel=1e-12)
+    assert math.fsum(row['Tax_PV'] for row in result['legacy_breakdown']) == \
+        pytest.approx(result['legacy_pv'], rel=1e-12, abs=1e-12)
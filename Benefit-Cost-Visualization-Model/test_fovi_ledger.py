@@ -0,0 +1,51 @@
+"""
+Tests that the cash-flow ledger reproduces fovi.evaluate() in every analysis mode
+Run from this directory: python -m pytest test_fovi_ledger.py
+"""
+
+import math
+
+import numpy as np
+
+from fovi import ANALYSIS_MODES, COMPONENTS, evaluate
+from fovi_ledger import (cash_flow_ledger, check_ledger, component_flows, component_totals,
+                         cumulative_position, ledger_components, ledger_from_flows, payback_year)
+
+
+def test_ledger_matches_engine(scenarios):
+    assert {scenario.analysis_mode for scenario in scenarios} == set(ANALYSIS_MODES)
+    for scenario in scenarios:
+        assert check_ledger(cash_flow_ledger(scenario), evaluate(scenario)), scenario.to_dict()
+
+
+def test_check_ledger_catches_a_mismatch(scenarios):
+    scenario = scenarios[0]
+    ledger = cash_flow_ledger(scenario)
+    for name in COMPONENTS + ['net_fiscal_gain']:
+        result = evaluate(scenario)
+        result[name] += max(1e-3, abs(result[name]) * 1e-6)
+        assert not check_ledger(ledger, result), name
+
+
+def test_partial_flows_rebuild_the_same_ledger(scenarios):
+    # Flows recomputed one component at a time (as the dashboard's rerun reuse does) give the same ledger
+    for scenario in scenarios[:20]:
+        flows = {}
+        for name in ledger_components(scenario):
+            flows.update(component_flows(scenario, [name]))
+        full, rebuilt = cash_flow_ledger(scenario), ledger_from_flows(flows, scenario.discount_rate)
+        for column in full:
+            assert np.array_equal(full[column], rebuilt[column]), column
+
+
+def test_payback_year_is_where_the_position_turns_non_negative(scenarios):
+    for scenario in scenarios[:50]:
+        ledger = cash_flow_ledger(scenario)
+        years, cumulative = cumulative_position(ledger)
+        assert math.isclose(cumulative[-1], sum(component_totals(ledger).values()), rel_tol=1e-9, abs_tol=1e-6)
+        year = payback_year(ledger)
+        if year is None:
+            assert cumulative[-1] < 0
+        else:
+            assert (cumulative[years >= year] >= 0).all()
+            assert year == years[0] or cumulative[years < year][-1] < 0
@@ -0,0 +1,91 @@
+"""
+Tests for fovi_service payload validation and the JSON it returns
+Run from this directory: python -m pytest test_fovi_service.py
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from fovi import Scenario, evaluate
+from fovi_service import FoviService, canonical_scenario, evaluate_rows
+
+
+def request(payload, method='POST', target='/evaluate'):
+    """(status, decoded JSON body) of one raw HTTP request against a fresh service"""
+    async def run():
+        service = FoviService()
+        worker = service.start()
+        server = await asyncio.start_server(service.handle_connection, '127.0.0.1', 0)
+        host, port = server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        body = payload.encode('utf-8') if isinstance(payload, str) else json.dumps(payload).encode('utf-8')
+        writer.write(f"{method} {target} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n\r\n".encode('latin-1') + body)
+        response = await reader.read()
+        writer.close()
+        server.close()
+        worker.cancel()
+        return response
+
+    head, _, content = asyncio.run(run()).partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(content) if content else None
+
+
+@pytest.mark.parametrize('payload', [
+    '{"olympic_year": 1e999}',
+    {'discount_rate': -1},
+    {'discount_rate': float('nan')},
+    {'olympic_year': 2037.9},
+    {'olympic_year': 2037},
+    {'legacy_years': 1e12},
+    {'legacy_years': 3.5},
+    {'public_spending': '12k'},
+    {'public_spending': True},
+    {'public_spending': None},
+    {'unknown_parameter': 1},
+    {'analysis_mode': 'Everything'},
+])
+def test_invalid_scenarios_get_400(payload):
+    status, body = request(payload)
+    assert status == 400
+    assert body['error']
+
+
+def test_out_of_range_value_is_named():
+    with pytest.raises(ValueError, match='discount_rate'):
+        canonical_scenario({'discount_rate': -1})
+
+
+def test_query_string_values_are_validated():
+    status, _ = request('', method='GET', target='/evaluate?olympic_year=2037')
+    assert status == 400
+    status, body = request('', method='GET', target='/evaluate?olympic_year=2040')
+    assert status == 200
+    assert body['result']['bcr'] == pytest.approx(evaluate(Scenario(olympic_year=2040))['bcr'])
+
+
+def test_equivalent_payloads_share_a_key():
+    key, params = canonical_scenario({'public_spending': 12000, 'olympic_year': 2040.0})
+    assert key == canonical_scenario({'olympic_year': 2040, 'public_spending': 12000.0})[0]
+    assert params['olympic_year'] == 2040 and isinstance(params['olympic_year'], int)
+
+
+def test_valid_batch_matches_engine():
+    scenarios = [{'public_spending': 12000, 'private_share': 0.4},
+                 {'analysis_mode': 'Basic Tourism Model', 'discount_rate': 0.08}]
+    status, body = request({'scenarios': scenarios})
+    assert status == 200
+    for result, scenario in zip(body['results'], scenarios):
+        assert result['net_fiscal_gain'] == pytest.approx(evaluate(Scenario.from_dict(scenario))['net_fiscal_gain'])
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_non_finite_results_become_null():
+    # Bypasses validation: a -100% discount rate gives non-finite PVs, which must not reach the JSON
+    _, params = canonical_scenario({})
+    params['discount_rate'] = -1.0
+    result = evaluate_rows([params])[0]
+    assert any(value is None for value in result.values())
+    json.dumps(result, allow_nan=False)
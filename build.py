@@ -0,0 +1,319 @@
+"""
+Data Pipeline Build
+Regenerates data/, docs/, deploy/ and dist/ from the population workbook and the generator
+scripts in dependency order. Each step declares its inputs and outputs; a step is
+skipped when the content hashes of its inputs (its script included) and outputs match
+the last successful run, and independent steps run in parallel.
+
+Usage:
+    python build.py                  # build everything that is out of date
+    python build.py geojson          # one step plus whatever it depends on
+    python build.py --force --jobs 4
+    python build.py --dry-run        # show what would run
+    python build.py --list           # show the step graph
+
+Every output has exactly one producer: the viewer's data/Florida_heatmap.geojson comes from
+create_combined_data.py, while the alternative intensity schemes of create_geojson_heatmap.py
+(per-year min/max) and create_growth_rate_geojson.py (growth thresholds) write their own files.
+create_vector_tiles.py is not a step: no page reads its PMTiles archive yet, so it is run by hand.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATE_PATH = os.path.join('data', '.cache', 'build_state.json')
+
+WORKBOOK = os.path.join('data', 'Population Data Low-Medium-High.xlsx')
+POPULATION_CACHE = os.path.join('data', '.cache', 'population_projections.parquet')
+COUNTIES_CSV = os.path.join('data', 'Florida_all_counties_2035_2045.csv')
+SERIES_CSV = os.path.join('data', 'Florida_all_counties_series_2035_2045.csv')
+GTO_CSV = os.path.join('data', 'GTO_population_2035_2045.csv')
+HEATMAP = os.path.join('data', 'Florida_heatmap.geojson')
+HEATMAP_LOW = os.path.join('data', 'Florida_heatmap_low.geojson')
+HEATMAP_HIGH = os.path.join('data', 'Florida_heatmap_high.geojson')
+HEATMAP_MINMAX = os.path.join('data', 'Florida_heatmap_minmax.geojson')
+GROWTH_RATE = os.path.join('data', 'Florida_growth_rate.geojson')
+INFRASTRUCTURE = os.path.join('data', 'Florida_infrastructure.geojson')
+HIGHWAYS = os.path.join('data', 'Florida_highways.geojson')
+# Optional full-resolution road lines read by create_combined_data.py (may not exist)
+ROAD_SOURCE = os.path.join('data', 'roads', 'Florida_roads.geojson')
+FDOT_DASHBOARD = os.path.join('docs', 'fdot_transportation_dashboard.html')
+FDOT_DASHBOARD_TOL = os.path.join('docs', 'fdot_transportation_dashboard_TOL.html')
+
+# Files published by deploy/ (Netlify serves that directory as-is). The deployed TOL
+# dashboard is maintained by hand with mobile styles the generator doesn't emit, so
+# docs/fdot_transportation_dashboard_TOL.html is not copied over it
+DEPLOY_FILES = {
+    'view_heatmap.html': os.path.join('deploy', 'view_heatmap.html'),
+    HEATMAP: os.path.join('deploy', HEATMAP),
+    HEATMAP_LOW: os.path.join('deploy', HEATMAP_LOW),
+    HEATMAP_HIGH: os.path.join('deploy', HEATMAP_HIGH),
+    INFRASTRUCTURE: os.path.join('deploy', INFRASTRUCTURE),
+    HIGHWAYS: os.path.join('deploy', HIGHWAYS),
+    COUNTIES_CSV: os.path.join('deploy', COUNTIES_CSV),
+    GTO_CSV: os.path.join('deploy', GTO_CSV),
+}
+BUNDLE_MANIFEST = os.path.join('dist', 'asset-manifest.json')
+
+
+def deploy_sources():
+    """Everything deploy_bundle.py publishes: the copied files plus what is checked into deploy/"""
+    paths = set(DEPLOY_FILES.values())
+    for directory, _, files in os.walk(os.path.join(ROOT, 'deploy')):
+        paths.update(os.path.relpath(os.path.join(directory, name), ROOT)
+                     for name in files if not name.endswith(('.gz', '.br')))
+    return sorted(paths)
+
+
+# A step runs `script` (which is also one of its inputs) or copies `copy` {source: destination}.
+# Dependencies follow from the paths: a step depends on the step that outputs one of its inputs
+STEPS = [
+    {'name': 'population_cache', 'script': 'population_data.py',
+     'inputs': [WORKBOOK], 'outputs': [POPULATION_CACHE]},
+    {'name': 'counties_csv', 'script': 'prepare_all_counties_heatmap.py',
+     'inputs': [POPULATION_CACHE, 'population_data.py'], 'outputs': [COUNTIES_CSV, SERIES_CSV]},
+    {'name': 'gto_csv', 'script': 'prepare_gto_heatmap.py',
+     'inputs': [POPULATION_CACHE, 'population_data.py'], 'outputs': [GTO_CSV]},
+    {'name': 'geojson', 'script': 'create_combined_data.py',
+     'inputs': [SERIES_CSV, ROAD_SOURCE, 'heatmap_features.py', 'highway_geometry.py', 'spatial_index.py', 'vector_tiles.py'],
+     'outputs': [HEATMAP, HEATMAP_LOW, HEATMAP_HIGH, INFRASTRUCTURE, HIGHWAYS]},
+    {'name': 'heatmap_minmax', 'script': 'create_geojson_heatmap.py',
+     'inputs': [COUNTIES_CSV, 'heatmap_features.py'], 'outputs': [HEATMAP_MINMAX]},
+    {'name': 'growth_rate', 'script': 'create_growth_rate_geojson.py',
+     'inputs': [COUNTIES_CSV, 'heatmap_features.py'], 'outputs': [GROWTH_RATE]},
+    {'name': 'fdot_dashboard', 'script': 'create_fdot_dashboard.py',
+     'inputs': [], 'outputs': [FDOT_DASHBOARD]},
+    {'name': 'fdot_dashboard_tol', 'script': 'create_fdot_dashboard_TOL.py',
+     'inputs': [], 'outputs': [FDOT_DASHBOARD_TOL]},
+    {'name': 'deploy', 'copy': DEPLOY_FILES,
+     'inputs': list(DEPLOY_FILES), 'outputs': list(DEPLOY_FILES.values())},
+    {'name': 'bundle', 'script': 'deploy_bundle.py',
+     'inputs': deploy_sources(), 'outputs': [BUNDLE_MANIFEST, os.path.join('dist', 'netlify.toml')]},
+]
+
+
+def step_inputs(step):
+    return ([step['script']] if 'script' in step else []) + step['inputs']
+
+
+def dependency_graph(steps=STEPS):
+    """{step name: set of step names it depends on}; raises ValueError on clashes or cycles"""
+    producer = {}
+    for step in steps:
+        for path in step['outputs']:
+            if path in producer:
+                raise ValueError(f"{path} is written by both '{producer[path]}' and '{step['name']}'")
+            producer[path] = step['name']
+    graph = {step['name']: {producer[path] for path in step_inputs(step) if path in producer}
+             for step in steps}
+
+    # Depth-first search for cycles
+    visiting, done = set(), set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle through '{name}'")
+        visiting.add(name)
+        for dependency in graph[name]:
+            visit(dependency)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in graph:
+        visit(name)
+    return graph
+
+
+def select_steps(graph, targets):
+    """Names of the requested steps and everything they depend on"""
+    unknown = [name for name in targets if name not in graph]
+    if unknown:
+        raise ValueError(f"Unknown step(s): {', '.join(unknown)} (see --list)")
+    selected, stack = set(), list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in selected:
+            selected.add(name)
+            stack.extend(graph[name])
+    return selected
+
+
+class FileHashes:
+    """SHA-256 of files, re-hashed only when a file's size or mtime changes"""
+
+    def __init__(self, known=None):
+        self.known = dict(known or {})
+
+    def __call__(self, path):
+        try:
+            stat = os.stat(os.path.join(ROOT, path))
+        except FileNotFoundError:
+            return None
+        key = [stat.st_size, stat.st_mtime_ns]
+        entry = self.known.get(path)
+        if entry and entry['stat'] == key:
+            return entry['sha256']
+        digest = hashlib.sha256()
+        with open(os.path.join(ROOT, path), 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        self.known[path] = {'stat': key, 'sha256': digest.hexdigest()}
+        return digest.hexdigest()
+
+
+def snapshot(step, file_hash):
+    return {'inputs': {path: file_hash(path) for path in step_inputs(step)},
+            'outputs': {path: file_hash(path) for path in step['outputs']}}
+
+
+def is_up_to_date(step, record, file_hash):
+    """True if inputs and outputs are exactly as the last successful run left them"""
+    if not record:
+        return False
+    current = snapshot(step, file_hash)
+    return current == record and None not in current['outputs'].values()
+
+
+def run_step(step):
+    """Run one step; returns (ok, seconds, captured output)"""
+    start = time.perf_counter()
+    if 'copy' in step:
+        try:
+            for source, destination in step['copy'].items():
+                os.makedirs(os.path.dirname(os.path.join(ROOT, destination)), exist_ok=True)
+                shutil.copyfile(os.path.join(ROOT, source), os.path.join(ROOT, destination))
+        except OSError as error:
+            return False, time.perf_counter() - start, str(error)
+        log = "\n".join(f"{source} -> {destination}" for source, destination in step['copy'].items())
+        return True, time.perf_counter() - start, log
+
+    env = dict(os.environ, PYTHONIOENCODING='utf-8')
+    completed = subprocess.run([sys.executable, step['script']], cwd=ROOT, env=env,
+                               capture_output=True, text=True, encoding='utf-8')
+    log = (completed.stdout + completed.stderr).strip()
+    ok = completed.returncode == 0
+    missing = [path for path in step['outputs'] if not os.path.exists(os.path.join(ROOT, path))]
+    if ok and missing:
+        ok = False
+        log += f"\nDid not write: {', '.join(missing)}"
+    return ok, time.perf_counter() - start, log
+
+
+def load_state(path=STATE_PATH):
+    try:
+        with open(os.path.join(ROOT, path), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'steps': {}, 'hashes': {}}
+
+
+def save_state(state, path=STATE_PATH):
+    full_path = os.path.join(ROOT, path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+
+
+def run_build(targets=None, jobs=None, force=False, dry_run=False, verbose=False, report=print):
+    """
+    Build the selected steps (all by default) in dependency order
+    A step becomes ready once every step it depends on has finished, and is checked
+    for changes only then, so a rebuilt dependency with identical output does not
+    force downstream work. Returns {name: {'status', 'seconds'}} with status one of
+    built / up to date / failed / blocked / would build
+    """
+    graph = dependency_graph()
+    steps = {step['name']: step for step in STEPS}
+    selected = select_steps(graph, targets or list(graph))
+    pending = {name: graph[name] for name in selected}
+
+    state = load_state()
+    file_hash = FileHashes(state['hashes'])
+    results = {}
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        running = {}
+        while pending or running:
+            ready = [name for name, dependencies in pending.items() if dependencies <= results.keys()]
+            for name in sorted(ready):
+                del pending[name]
+                statuses = {results[dependency]['status'] for dependency in graph[name]}
+                if statuses & {'failed', 'blocked'}:
+                    results[name] = {'status': 'blocked', 'seconds': 0.0}
+                elif not force and 'would build' not in statuses and \
+                        is_up_to_date(steps[name], state['steps'].get(name), file_hash):
+                    results[name] = {'status': 'up to date', 'seconds': 0.0}
+                elif dry_run:
+                    results[name] = {'status': 'would build', 'seconds': 0.0}
+                else:
+                    running[pool.submit(run_step, steps[name])] = name
+                    continue
+                report(f"  · {name:<20} {results[name]['status']}")
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                ok, seconds, log = future.result()
+                results[name] = {'status': 'built' if ok else 'failed', 'seconds': seconds}
+                if ok:
+                    state['steps'][name] = snapshot(steps[name], file_hash)
+                else:
+                    state['steps'].pop(name, None)
+                report(f"  {'✓' if ok else '✗'} {name:<20} {results[name]['status']:<11} {seconds:6.2f}s")
+                if log and (verbose or not ok):
+                    report("      " + log.replace("\n", "\n      "))
+            state['hashes'] = file_hash.known
+            save_state(state)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the data pipeline outputs that are out of date")
+    parser.add_argument('targets', nargs='*', help="steps to build with their dependencies (default: all)")
+    parser.add_argument('--force', action='store_true', help="rebuild even if nothing changed")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="parallel steps (default: all cores)")
+    parser.add_argument('--dry-run', action='store_true', help="report what would run without running it")
+    parser.add_argument('--list', action='store_true', help="show steps, their outputs and dependencies")
+    parser.add_argument('--verbose', '-v', action='store_true', help="show each step's output")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        graph = dependency_graph()
+        for step in STEPS:
+            after = ", ".join(sorted(graph[step['name']])) or "-"
+            print(f"  {step['name']:<20} after: {after}")
+            for path in step['outputs']:
+                print(f"      → {path}")
+        return 0
+
+    start = time.perf_counter()
+    try:
+        results = run_build(args.targets, args.jobs, args.force, args.dry_run, args.verbose)
+    except ValueError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+    counts = {}
+    for result in results.values():
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    failed = counts.get('failed', 0) + counts.get('blocked', 0)
+    step_time = sum(result['seconds'] for result in results.values())
+    summary = ", ".join(f"{count} {status}" for status, count in counts.items())
+    print(f"\n{'✗' if failed else '✓'} {summary} in {time.perf_counter() - start:.2f}s "
+          f"(steps {step_time:.2f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""
+Vector Tile Archive Generator
+Packs the population heatmap (Medium series), infrastructure and highway layers into
+data/Florida_layers.pmtiles - one static file of Mapbox Vector Tiles for zooms 5-11
+that map clients read tile by tile with HTTP range requests.
+"""
+
+import json
+import os
+
+from vector_tiles import MAX_ZOOM, MIN_ZOOM, build_pmtiles
+
+LAYERS = {
+    'population': os.path.join('data', 'Florida_heatmap.geojson'),
+    'infrastructure': os.path.join('data', 'Florida_infrastructure.geojson'),
+    'highways': os.path.join('data', 'Florida_highways.geojson'),
+}
+
+print("=" * 60)
+print("CREATING VECTOR TILE ARCHIVE")
+print("=" * 60)
+
+layers = {}
+for name, path in LAYERS.items():
+    with open(path, encoding='utf-8') as f:
+        layers[name] = json.load(f)
+    print(f"  {name:<15} {len(layers[name]['features']):>5} features  ({path})")
+
+output_path = os.path.join('data', 'Florida_layers.pmtiles')
+tile_count, size = build_pmtiles(output_path, layers, name='Florida Olympic corridor layers')
+
+print(f"\n✓ Created {output_path}: {tile_count} tiles, zooms {MIN_ZOOM}-{MAX_ZOOM}, {size / 1024:.1f} KB")
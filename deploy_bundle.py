@@ -0,0 +1,191 @@
+"""
+Deploy Bundle
+Turns deploy/ into dist/, a cache-friendly copy of the site:
+- only the pages and the files they reference (directly or through a referenced text file)
+  are published, so stray workbooks and superseded data in deploy/ stay private
+- every asset (data files, images) gets a content-hashed name such as
+  data/Florida_heatmap.3f2a9c1d.geojson, and the HTML pages are rewritten to use it
+- text files get precompressed .gz siblings (and .br with the brotli package installed)
+  for servers that serve them directly (nginx gzip_static/brotli_static, Caddy, S3/CloudFront)
+- netlify.toml marks hashed assets immutable for a year and HTML as always revalidated,
+  so a repeat visit downloads nothing but the pages that changed; missing assets get a
+  404 instead of the site's index.html fallback, which would otherwise be cached as immutable
+
+Usage:
+    python deploy_bundle.py           # then publish dist/ (e.g. netlify deploy --dir dist)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SOURCE_DIR = 'deploy'
+OUTPUT_DIR = 'dist'
+MANIFEST = 'asset-manifest.json'
+
+# Pages keep their names (they are the URLs people visit); everything else is hashed
+ENTRY_EXTENSIONS = {'.html'}
+KEEP_NAMES = {'netlify.toml', '_headers', '_redirects', 'robots.txt', 'favicon.ico'}
+COMPRESS_EXTENSIONS = {'.html', '.css', '.js', '.json', '.geojson', '.csv', '.svg', '.txt', '.xml'}
+HASH_LENGTH = 8
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'public, max-age=0, must-revalidate'
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(path, data):
+    """data/a.geojson -> data/a.<hash>.geojson"""
+    stem, extension = os.path.splitext(path)
+    return f"{stem}.{content_hash(data)}{extension}"
+
+
+def source_files(source_dir=SOURCE_DIR):
+    """Site-relative paths (forward slashes) of every file to publish"""
+    paths = []
+    for directory, _, files in os.walk(source_dir):
+        for name in files:
+            if name.endswith(('.gz', '.br')):
+                continue
+            paths.append(os.path.relpath(os.path.join(directory, name), source_dir).replace(os.sep, '/'))
+    return sorted(paths)
+
+
+def _reference_pattern(paths):
+    """Matches 'path', "path", `path` and url(path), optionally prefixed with ./ or /"""
+    alternatives = '|'.join(re.escape(path) for path in sorted(paths, key=len, reverse=True))
+    return re.compile(r'''(?<=["'`(])(\./|/)?(''' + alternatives + r''')(?=["'`)?#])''')
+
+
+def rewrite_references(text, names):
+    """Replace quoted or url() references to assets with their hashed names"""
+    if not names:
+        return text
+    return _reference_pattern(names).sub(lambda match: (match.group(1) or '') + names[match.group(2)], text)
+
+
+def reachable_files(paths, roots, read):
+    """
+    The roots plus every path referenced from them, following references through text files
+    read(path) returns a file's bytes
+    """
+    pattern = _reference_pattern(paths)
+    reached, stack = set(roots), list(roots)
+    while stack:
+        path = stack.pop()
+        if os.path.splitext(path)[1].lower() not in COMPRESS_EXTENSIONS:
+            continue
+        for _, referenced in pattern.findall(read(path).decode('utf-8', errors='replace')):
+            if referenced not in reached:
+                reached.add(referenced)
+                stack.append(referenced)
+    return sorted(reached)
+
+
+def compress(path, data):
+    """Write .gz/.br siblings that are smaller than the file; returns their paths"""
+    written = []
+    candidates = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        candidates.append(('.br', brotli.compress(data, quality=11)))
+    for suffix, compressed in candidates:
+        if len(compressed) < len(data):
+            with open(path + suffix, 'wb') as f:
+                f.write(compressed)
+            written.append(path + suffix)
+    return written
+
+
+def asset_redirects(netlify_toml, asset_dirs):
+    """
+    netlify.toml with 404 rules for the asset directories ahead of its other redirects
+    Redirects match in order, so a missing asset no longer falls through to a catch-all
+    such as /* -> /index.html (200), which the immutable asset headers would pin in caches
+    """
+    blocks = "".join(f'[[redirects]]\n  from = "/{directory}/*"\n  to = "/404.html"\n  status = 404\n\n'
+                     for directory in sorted(asset_dirs))
+    first = re.search(r'^\[\[redirects\]\]', netlify_toml, re.MULTILINE)
+    if first is None:
+        return netlify_toml.rstrip() + "\n\n# Added by deploy_bundle.py\n" + blocks.rstrip() + "\n"
+    return (netlify_toml[:first.start()] + "# Added by deploy_bundle.py: missing assets are 404s\n" +
+            blocks + netlify_toml[first.start():])
+
+
+def cache_headers(netlify_toml, asset_dirs):
+    """netlify.toml with Cache-Control rules appended for pages and hashed assets"""
+    rules = [("/", REVALIDATE), ("/*.html", REVALIDATE)]
+    rules += [(f"/{directory}/*", IMMUTABLE) for directory in sorted(asset_dirs)]
+    blocks = [f'[[headers]]\n  for = "{pattern}"\n  [headers.values]\n    Cache-Control = "{value}"\n'
+              for pattern, value in rules]
+    return netlify_toml.rstrip() + "\n\n# Added by deploy_bundle.py\n" + "\n".join(blocks)
+
+
+def build_bundle(source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR):
+    """
+    Write the bundle; returns {'assets', 'pages', 'skipped', 'bytes', 'gzip_bytes', 'brotli_bytes'}
+    skipped lists the files in source_dir that no page references, which are not published
+    """
+    if os.path.isdir(output_dir):
+        shutil.rmtree(output_dir)
+    available = source_files(source_dir)
+
+    def read(path):
+        with open(os.path.join(source_dir, path), 'rb') as f:
+            return f.read()
+
+    pages = [path for path in available if os.path.splitext(path)[1] in ENTRY_EXTENSIONS]
+    kept = [path for path in available if os.path.basename(path) in KEEP_NAMES and '/' not in path]
+    paths = reachable_files(available, pages + kept, read)
+    names = {path: hashed_name(path, read(path)) for path in paths if path not in pages and path not in kept}
+
+    outputs = {}
+    for path in paths:
+        data = read(path)
+        if path in pages:
+            data = rewrite_references(data.decode('utf-8'), names).encode('utf-8')
+        elif path == 'netlify.toml':
+            asset_dirs = {name.split('/')[0] for name in names if '/' in name}
+            netlify_toml = asset_redirects(data.decode('utf-8'), asset_dirs)
+            data = cache_headers(netlify_toml, asset_dirs).encode('utf-8')
+        outputs[names.get(path, path)] = data
+
+    totals = {'assets': len(names), 'pages': len(pages), 'skipped': sorted(set(available) - set(paths)),
+              'bytes': 0, 'gzip_bytes': 0, 'brotli_bytes': 0}
+    for path, data in outputs.items():
+        destination = os.path.join(output_dir, path)
+        os.makedirs(os.path.dirname(destination) or '.', exist_ok=True)
+        with open(destination, 'wb') as f:
+            f.write(data)
+        totals['bytes'] += len(data)
+        if os.path.splitext(path)[1].lower() in COMPRESS_EXTENSIONS:
+            for sibling in compress(destination, data):
+                key = 'gzip_bytes' if sibling.endswith('.gz') else 'brotli_bytes'
+                totals[key] += os.path.getsize(sibling)
+
+    with open(os.path.join(output_dir, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(names, f, indent=2, sort_keys=True)
+    return totals
+
+
+if __name__ == "__main__":
+    totals = build_bundle()
+    print(f"✓ {OUTPUT_DIR}/: {totals['pages']} pages, {totals['assets']} hashed assets "
+          f"({totals['bytes'] / 1024:.1f} KB)")
+    if totals['skipped']:
+        print(f"  not referenced by any page, not published: {', '.join(totals['skipped'])}")
+    print(f"  gzip siblings: {totals['gzip_bytes'] / 1024:.1f} KB")
+    if brotli is None:
+        print("  brotli not installed - skipped .br siblings (pip install brotli)")
+    else:
+        print(f"  brotli siblings: {totals['brotli_bytes'] / 1024:.1f} KB")
@@ -0,0 +1,195 @@
+"""
+Shared helpers for the county heatmap GeoJSON scripts
+County centroids, the GTO Triangle, vectorized builders that turn a table of
+points into GeoJSON features without iterating DataFrame rows, and a streaming
+compact GeoJSON writer
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Florida county centroids (approximate lat, lon)
+COUNTY_COORDS = {
+    'ALACHUA': [29.6437, -82.3105],
+    'BAKER': [30.3316, -82.2859],
+    'BAY': [30.2086, -85.6602],
+    'BRADFORD': [29.9447, -82.1759],
+    'BREVARD': [28.2639, -80.7214],
+    'BROWARD': [26.1224, -80.3724],
+    'CALHOUN': [30.3971, -85.1974],
+    'CHARLOTTE': [26.8939, -82.0453],
+    'CITRUS': [28.8894, -82.4812],
+    'CLAY': [29.9763, -81.7293],
+    'COLLIER': [26.1420, -81.7089],
+    'COLUMBIA': [30.1898, -82.6393],
+    'DESOTO': [27.1645, -81.8109],
+    'DIXIE': [29.5935, -83.0779],
+    'DUVAL': [30.3322, -81.6557],
+    'ESCAMBIA': [30.4213, -87.2169],
+    'FLAGLER': [29.4686, -81.2534],
+    'FRANKLIN': [29.8439, -84.8785],
+    'GADSDEN': [30.5883, -84.6422],
+    'GILCHRIST': [29.6994, -82.8084],
+    'GLADES': [26.9531, -81.1359],
+    'GULF': [29.9885, -85.2799],
+    'HAMILTON': [30.5235, -82.9540],
+    'HARDEE': [27.4900, -81.8209],
+    'HENDRY': [26.5531, -81.1359],
+    'HERNANDO': [28.5353, -82.4759],
+    'HIGHLANDS': [27.3164, -81.3431],
+    'HILLSBOROUGH': [27.9947, -82.4596],
+    'HOLMES': [30.8547, -85.8352],
+    'INDIAN RIVER': [27.6648, -80.5706],
+    'JACKSON': [30.7816, -85.2299],
+    'JEFFERSON': [30.5469, -83.8679],
+    'LAFAYETTE': [29.9841, -83.2279],
+    'LAKE': [28.7606, -81.6348],
+    'LEE': [26.5629, -81.8723],
+    'LEON': [30.4583, -84.2807],
+    'LEVY': [29.3025, -82.7579],
+    'LIBERTY': [30.2391, -84.8785],
+    'MADISON': [30.4691, -83.4129],
+    'MANATEE': [27.4989, -82.3264],
+    'MARION': [29.1944, -82.1401],
+    'MARTIN': [27.1017, -80.3977],
+    'MIAMI-DADE': [25.6171, -80.6437],
+    'MONROE': [24.7543, -81.1359],
+    'NASSAU': [30.6102, -81.7848],
+    'OKALOOSA': [30.6326, -86.5764],
+    'OKEECHOBEE': [27.2439, -80.8298],
+    'ORANGE': [28.5421, -81.3723],
+    'OSCEOLA': [28.2174, -81.3888],
+    'PALM BEACH': [26.7056, -80.2683],
+    'PASCO': [28.2978, -82.4359],
+    'PINELLAS': [27.9119, -82.7623],
+    'POLK': [28.0295, -81.7714],
+    'PUTNAM': [29.6486, -81.6637],
+    'SANTA ROSA': [30.6535, -86.9877],
+    'SARASOTA': [27.2770, -82.5242],
+    'SEMINOLE': [28.7239, -81.2373],
+    'ST. JOHNS': [29.9002, -81.3628],
+    'ST. LUCIE': [27.4467, -80.3256],
+    'SUMTER': [28.6783, -82.0859],
+    'SUWANNEE': [30.1869, -82.9540],
+    'TAYLOR': [30.0688, -83.5879],
+    'UNION': [30.0597, -82.4359],
+    'VOLUSIA': [29.0280, -81.0998],
+    'WAKULLA': [30.1419, -84.3985],
+    'WALTON': [30.6269, -86.1077],
+    'WASHINGTON': [30.6102, -85.6502]
+}
+
+# GTO Triangle counties
+GTO_COUNTIES = {'ALACHUA', 'ORANGE', 'HILLSBOROUGH', 'OSCEOLA', 'POLK'}
+
+# BEBR projection series; Medium is the default heatmap, the others are loaded on demand
+HEATMAP_SERIES = ['Low', 'Medium', 'High']
+
+
+def heatmap_path(series='Medium'):
+    """Heatmap GeoJSON for a projection series (Medium keeps the unsuffixed name)"""
+    suffix = '' if series == 'Medium' else f'_{series.lower()}'
+    return os.path.join('data', f'Florida_heatmap{suffix}.geojson')
+
+
+def coordinates_frame(coords=COUNTY_COORDS):
+    """Centroid table with county, lat and lon columns"""
+    names = list(coords)
+    lat_lon = np.array([coords[name] for name in names], dtype=float).reshape(-1, 2)
+    return pd.DataFrame({'county': names, 'lat': lat_lon[:, 0], 'lon': lat_lon[:, 1]})
+
+
+def attach_coordinates(data, coords=COUNTY_COORDS, name_column='County'):
+    """
+    Join centroids onto data by upper-cased name, dropping rows without coordinates
+    Row order of data is preserved
+    """
+    data = data.assign(county=data[name_column].str.upper())
+    return data.merge(coordinates_frame(coords), on='county', how='inner', sort=False)
+
+
+def growth_rate(data, start_year, end_year):
+    """Percent change between two year columns"""
+    start, end = data[str(start_year)], data[str(end_year)]
+    return (end - start) / start * 100
+
+
+def min_max_intensity(values):
+    """Scale each column of values to 0-1 by its own minimum and maximum"""
+    values = np.asarray(values, dtype=float)
+    low, high = values.min(axis=0), values.max(axis=0)
+    return (values - low) / (high - low)
+
+
+def step_intensity(values, thresholds, levels):
+    """
+    Step intensity: levels[i] where thresholds[i-1] <= value < thresholds[i]
+    thresholds ascend and levels has one more entry than thresholds
+    """
+    return np.asarray(levels, dtype=float)[np.digitize(values, thresholds)]
+
+
+def point_features(lon, lat, properties):
+    """
+    Yield GeoJSON Point features from coordinate arrays and {name: values} properties
+    values may be a scalar, one value per point, or a (points, n) array that becomes an
+    n-element list per feature. Each column is converted to Python values once, so the
+    cost per row is a dict build
+    """
+    lon, lat = np.asarray(lon), np.asarray(lat)
+    names = list(properties)
+    columns = []
+    for values in properties.values():
+        values = np.asarray(values)
+        if values.ndim == 0:
+            values = np.broadcast_to(values, lon.shape)
+        columns.append(values.tolist())
+    for x, y, *row in zip(lon.tolist(), lat.tolist(), *columns):
+        yield {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [x, y]
+            },
+            "properties": dict(zip(names, row))
+        }
+
+
+def _round_coordinates(coordinates, precision):
+    if isinstance(coordinates[0], (list, tuple)):
+        return [_round_coordinates(part, precision) for part in coordinates]
+    return [round(value, precision) for value in coordinates]
+
+
+def write_feature_collection(path, features, precision=6, ndjson=False, members=None):
+    """
+    Stream features to a compact GeoJSON FeatureCollection without holding them in memory
+    Coordinates are rounded to `precision` decimals (6 is ~0.1 m) and `members` adds
+    top-level keys (e.g. {"years": [...]}). With ndjson=True one feature is written per
+    line instead (newline-delimited GeoJSON, which has no top-level members).
+    Returns the number of features written
+    """
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        if not ndjson:
+            f.write('{"type":"FeatureCollection",')
+            for key, value in (members or {}).items():
+                f.write(f'{json.dumps(key)}:{json.dumps(value, separators=(",", ":"), ensure_ascii=False)},')
+            f.write('"features":[')
+        for feature in features:
+            geometry = feature.get("geometry")
+            if precision is not None and geometry and geometry.get("coordinates"):
+                feature = dict(feature, geometry=dict(
+                    geometry, coordinates=_round_coordinates(geometry["coordinates"], precision)))
+            text = json.dumps(feature, separators=(',', ':'), ensure_ascii=False)
+            if ndjson:
+                f.write(text + '\n')
+            else:
+                f.write((',' if count else '') + text)
+            count += 1
+        if not ndjson:
+            f.write(']}\n')
+    return count
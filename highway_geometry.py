@@ -0,0 +1,200 @@
+"""
+Highway geometry ingestion
+Reads full-resolution road lines from a local GeoJSON file (or a shapefile, with pyshp
+installed), chains the segments of each route and simplifies them with a vectorized
+Douglas-Peucker pass into one LineString per zoom band, so the browser draws only as
+many vertices as the current zoom can show
+"""
+
+import json
+import os
+
+import numpy as np
+
+from vector_tiles import project
+
+# Zoom bands for highway detail: each level covers its zoom up to the next one
+HIGHWAY_ZOOMS = [7, 9, 11]
+# Maximum deviation from the full-resolution line, in screen pixels (256 px tiles)
+TOLERANCE_PX = 0.75
+
+
+def read_road_lines(path):
+    """
+    [(properties, [[lon, lat], ...]), ...] for every line in a GeoJSON or shapefile
+    MultiLineStrings contribute one entry per part
+    """
+    lines = []
+    if os.path.splitext(path)[1].lower() == '.shp':
+        try:
+            import shapefile
+        except ImportError as error:
+            raise ImportError("Reading shapefiles needs pyshp: pip install pyshp") from error
+        with shapefile.Reader(path) as reader:
+            for record in reader.iterShapeRecords():
+                points, starts = record.shape.points, list(record.shape.parts) + [len(record.shape.points)]
+                properties = record.record.as_dict()
+                lines += [(properties, [list(p[:2]) for p in points[a:b]]) for a, b in zip(starts[:-1], starts[1:])]
+        return lines
+
+    with open(path, encoding='utf-8') as f:
+        collection = json.load(f)
+    for feature in collection['features']:
+        geometry = feature['geometry']
+        if geometry['type'] == 'LineString':
+            parts = [geometry['coordinates']]
+        elif geometry['type'] == 'MultiLineString':
+            parts = geometry['coordinates']
+        else:
+            continue
+        lines += [(feature.get('properties') or {}, [list(p[:2]) for p in part]) for part in parts]
+    return lines
+
+
+def chain_segments(segments, precision=7):
+    """
+    Join segments that share endpoints (either direction) into longer lines
+    Endpoints are compared after rounding to `precision` decimals
+    """
+    def key(point):
+        return round(point[0], precision), round(point[1], precision)
+
+    remaining = {i: list(segment) for i, segment in enumerate(segments) if len(segment) >= 2}
+    by_end = {}
+    for i, segment in remaining.items():
+        by_end.setdefault(key(segment[0]), set()).add(i)
+        by_end.setdefault(key(segment[-1]), set()).add(i)
+
+    def take(point):
+        for i in by_end.get(key(point), ()):
+            if i in remaining:
+                segment = remaining.pop(i)
+                by_end[key(segment[0])].discard(i)
+                by_end[key(segment[-1])].discard(i)
+                return segment
+        return None
+
+    chains = []
+    while remaining:
+        i = next(iter(remaining))
+        line = remaining.pop(i)
+        by_end[key(line[0])].discard(i)
+        by_end[key(line[-1])].discard(i)
+        # Extend forwards, then backwards, while a segment continues the line
+        while (segment := take(line[-1])) is not None:
+            line += (segment if key(segment[0]) == key(line[-1]) else segment[::-1])[1:]
+        while (segment := take(line[0])) is not None:
+            line = (segment if key(segment[-1]) == key(line[0]) else segment[::-1])[:-1] + line
+        chains.append(line)
+    return chains
+
+
+def _segment_distance(points, starts, ends):
+    """Distance from each point to the segment between the matching start and end"""
+    direction = ends - starts
+    length2 = np.einsum('ij,ij->i', direction, direction)
+    t = np.einsum('ij,ij->i', points - starts, direction) / np.where(length2 == 0, 1.0, length2)
+    nearest = starts + np.clip(t, 0.0, 1.0)[:, None] * direction
+    return np.hypot(*(points - nearest).T)
+
+
+def douglas_peucker_importance(points, min_tolerance=0.0):
+    """
+    Tolerance at which Douglas-Peucker would drop each vertex
+    simplify(points, t) keeps exactly the vertices with importance > t, so one pass
+    serves every tolerance t >= min_tolerance (ranges that cannot reach it are not
+    split further). All open ranges of a recursion depth are split together:
+    distances are computed for every interior point at once and reduced per range
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    importance = np.zeros(n)
+    importance[[0, -1]] = np.inf
+    # Open ranges (start, end) and the importance of the vertex that opened them
+    starts, ends, caps = np.array([0]), np.array([n - 1]), np.array([np.inf])
+
+    while len(starts):
+        interior = ends - starts - 1
+        open_ranges = interior > 0
+        starts, ends, caps, interior = starts[open_ranges], ends[open_ranges], caps[open_ranges], interior[open_ranges]
+        if not len(starts):
+            break
+
+        owner = np.repeat(np.arange(len(starts)), interior)
+        first = np.cumsum(interior) - interior
+        index = starts[owner] + 1 + np.arange(interior.sum()) - first[owner]
+        distance = _segment_distance(points[index], points[starts[owner]], points[ends[owner]])
+
+        # Farthest vertex of each range (first one on ties; candidates are in index order)
+        farthest = np.maximum.reduceat(distance, first)
+        candidates = np.flatnonzero(distance == farthest[owner])
+        candidate_owner = owner[candidates]
+        first_candidate = np.flatnonzero(np.r_[True, candidate_owner[1:] != candidate_owner[:-1]])
+        split = index[candidates[first_candidate]]
+
+        # A vertex cannot outlive the vertex whose range it was found in
+        value = np.minimum(farthest, caps)
+        importance[split] = value
+        above = value > min_tolerance
+        starts, ends, split, value = starts[above], ends[above], split[above], value[above]
+        starts, ends, caps = (np.concatenate([starts, split]), np.concatenate([split, ends]),
+                              np.concatenate([value, value]))
+    return importance
+
+
+def simplify(points, tolerance):
+    """Douglas-Peucker simplification of a polyline; returns the kept vertices"""
+    points = np.asarray(points, dtype=float)
+    if len(points) <= 2:
+        return points
+    return points[douglas_peucker_importance(points, tolerance) > tolerance]
+
+
+def zoom_levels(coordinates, zooms=HIGHWAY_ZOOMS, tolerance_px=TOLERANCE_PX):
+    """
+    [(min_zoom, max_zoom, coordinates), ...] simplified for each zoom band
+    Importance is measured once in zoom-0 pixels and scaled by 2**zoom per band.
+    min_zoom of the first band and max_zoom of the last are None (unbounded), and
+    neighbouring bands that keep the same vertices are merged
+    """
+    coordinates = np.asarray(coordinates, dtype=float)
+    x, y = project(coordinates[:, 0], coordinates[:, 1], 0)
+    importance = douglas_peucker_importance(np.column_stack([x, y]) * 256, tolerance_px / 2.0 ** max(zooms))
+
+    levels = []
+    for i, zoom in enumerate(zooms):
+        keep = importance * 2.0 ** zoom > tolerance_px
+        min_zoom = zoom if i else None
+        max_zoom = zooms[i + 1] - 1 if i + 1 < len(zooms) else None
+        if levels and np.array_equal(levels[-1][2], keep):
+            levels[-1] = (levels[-1][0], max_zoom, keep)
+        else:
+            levels.append((min_zoom, max_zoom, keep))
+    return [(min_zoom, max_zoom, coordinates[keep]) for min_zoom, max_zoom, keep in levels]
+
+
+def highway_level_features(routes, lines_by_route, zooms=HIGHWAY_ZOOMS, precision=5):
+    """
+    LineString features for every route, line and zoom band
+    routes is {highway_id: {'name', 'description', 'gto'}}; lines_by_route maps each
+    highway_id to its lines. Bands carry min_zoom/max_zoom properties when bounded
+    """
+    for highway_id, route in routes.items():
+        for line in chain_segments(lines_by_route.get(highway_id, [])):
+            for min_zoom, max_zoom, coordinates in zoom_levels(line, zooms):
+                properties = {
+                    "name": route["name"],
+                    "highway_id": highway_id,
+                    "description": route["description"],
+                    "is_gto": route["gto"],
+                    "type": "highway"
+                }
+                if min_zoom is not None:
+                    properties["min_zoom"] = min_zoom
+                if max_zoom is not None:
+                    properties["max_zoom"] = max_zoom
+                yield {
+                    "type": "Feature",
+                    "geometry": {"type": "LineString", "coordinates": np.round(coordinates, precision).tolist()},
+                    "properties": properties
+                }
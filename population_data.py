@@ -0,0 +1,108 @@
+"""
+Cached access to the BEBR population projections workbook
+The workbook is parsed once and stored as Parquet (every county, Low/Medium/High
+series and year). The cache records the SHA-256 of the workbook it was built from
+and is rebuilt only when the workbook's content changes, so the heatmap scripts
+read the projections in milliseconds instead of re-parsing the xlsx
+"""
+
+import hashlib
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+WORKBOOK_PATH = os.path.join('data', 'Population Data Low-Medium-High.xlsx')
+CACHE_PATH = os.path.join('data', '.cache', 'population_projections.parquet')
+
+SERIES = ['Low', 'Medium', 'High']
+
+# Parquet schema metadata key holding the hash of the source workbook; bump
+# CACHE_VERSION when read_workbook() changes so existing caches are rebuilt
+_HASH_KEY = b'source_sha256'
+CACHE_VERSION = 2
+
+
+def file_sha256(path):
+    """Hex SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_workbook(path=WORKBOOK_PATH):
+    """
+    Parse the workbook into one row per county and series
+    County names are forward-filled over the series rows; year columns are integers (citation notes such as "434,700 [cite: 535]" are stripped)
+    """
+    df = pd.read_excel(path)
+    df['County'] = df['County'].ffill().str.strip()
+    df['Series'] = df['Series'].str.strip()
+
+    years = [column for column in df.columns if str(column).strip().isdigit()]
+    for column in years:
+        if df[column].dtype == object or pd.api.types.is_string_dtype(df[column]):
+            df[column] = (df[column].astype(str)
+                          .str.replace(r'\[.*?\]', '', regex=True)
+                          .str.replace(',', '')
+                          .str.strip())
+        df[column] = pd.to_numeric(df[column]).astype('int64')
+    df = df.rename(columns={column: int(str(column).strip()) for column in years})
+    return df[['County', 'Series'] + sorted(int(str(column).strip()) for column in years)]
+
+
+def _cache_key(path):
+    return f"v{CACHE_VERSION}-{file_sha256(path)}"
+
+
+def _cached_key(cache_path):
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    value = metadata.get(_HASH_KEY)
+    return value.decode() if value else None
+
+
+def build_cache(path=WORKBOOK_PATH, cache_path=CACHE_PATH, cache_key=None):
+    """Convert the workbook to Parquet, tagged with the workbook hash; returns the frame"""
+    df = read_workbook(path)
+    table = pa.Table.from_pandas(df.rename(columns=str), preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_HASH_KEY] = (cache_key or _cache_key(path)).encode()
+
+    # Write to a temporary file first so an interrupted build never leaves a bad cache
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    pq.write_table(table.replace_schema_metadata(metadata), temp_path)
+    os.replace(temp_path, cache_path)
+    return df
+
+
+def load_population(series=None, path=WORKBOOK_PATH, cache_path=CACHE_PATH):
+    """
+    Population projections for every county, optionally filtered to one series
+    Columns: County, Series and one integer column per projection year. Reads the
+    Parquet cache when it matches the workbook's current content and rebuilds it otherwise
+    """
+    cache_key = _cache_key(path)
+    if _cached_key(cache_path) == cache_key:
+        df = pd.read_parquet(cache_path)
+        df = df.rename(columns={column: int(column) for column in df.columns if column.isdigit()})
+    else:
+        df = build_cache(path, cache_path, cache_key)
+
+    if series is not None:
+        if series not in SERIES:
+            raise ValueError(f"Unknown series '{series}' (expected one of {', '.join(SERIES)})")
+        df = df[df['Series'] == series].reset_index(drop=True)
+    return df
+
+
+if __name__ == "__main__":
+    df = load_population()
+    print(f"✓ {len(df)} rows ({df['County'].nunique()} counties x {df['Series'].nunique()} series) "
+          f"cached in {CACHE_PATH}")
@@ -1,16 +1,9 @@
-import pandas as pd
-import json
 import os
 
-# Use relative paths from current working directory
-file_path = os.path.join('data', 'Population Data Low-Medium-High.xlsx')
-df = pd.read_excel(file_path)
+from population_data import load_population
 
-# Fill NaN counties with the previous county value (forward fill)
-df['County'] = df['County'].fillna(method='ffill')
-
-# Filter to Medium series (most realistic projection) for ALL counties
-all_counties_data = df[df['Series'] == 'Medium'].copy()
+# Medium series (most realistic projection) for ALL counties, from the Parquet cache of the workbook
+all_counties_data = load_population('Medium')
 
 # Extract only 2035, 2040, 2045 columns (as integers)
 years_cols = [2035, 2040, 2045]
@@ -23,4 +16,10 @@ print(counties_filtered.head(10))
 # Save as CSV for reference
 output_path = os.path.join('data', 'Florida_all_counties_2035_2045.csv')
 counties_filtered.to_csv(output_path, index=False)
-print(f"\n✓ CSV saved: {output_path}")
\ No newline at end of file
+print(f"\n✓ CSV saved: {output_path}")
+
+# Every series (Low/Medium/High) for the per-series heatmaps
+all_series = load_population()[['County', 'Series'] + years_cols]
+series_path = os.path.join('data', 'Florida_all_counties_series_2035_2045.csv')
+all_series.to_csv(series_path, index=False)
+print(f"✓ CSV saved: {series_path} ({', '.join(all_series['Series'].unique())})")
\ No newline at end of file
@@ -1,13 +1,9 @@
-import pandas as pd
-import json
 import os
 
-# Use relative paths from current working directory
-file_path = os.path.join('data', 'Population Data Low-Medium-High.xlsx')
-df = pd.read_excel(file_path)
+from population_data import load_population
 
-# Fill NaN counties with the previous county value (forward fill)
-df['County'] = df['County'].fillna(method='ffill')
+# Projections for every county and series, read from the Parquet cache of the workbook
+df = load_population()
 
 # Print columns to verify
 print("Available columns:")
@@ -19,11 +15,11 @@ print(df.head(10))
 gto_counties = ['ALACHUA', 'ORANGE', 'HILLSBOROUGH', 'OSCEOLA', 'POLK']
 
 # Filter to GTO counties and Medium series (most realistic projection)
-gto_data = df[(df['County'].str.upper().isin(gto_counties)) & (df['Series'] == 'Medium')].copy()
+gto_data = df[df['County'].isin(gto_counties) & (df['Series'] == 'Medium')].copy()
 
 # Extract only 2035, 2040, 2045 columns (as integers, not strings)
 years_cols = [2035, 2040, 2045]
-gto_filtered = gto_data[['County'] + years_cols]
+gto_filtered = gto_data[['County'] + years_cols].copy()
 
 print("\nGTO Population Data (2035-2045):")
 print(gto_filtered)
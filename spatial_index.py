@@ -0,0 +1,146 @@
+"""
+Spatial index for map points and highway lines
+Locations are stored as unit vectors on the sphere in a KD-tree, so chord distance
+orders points exactly like great-circle distance and nearest / within-radius
+queries are exact in kilometres. Lines are indexed by segment midpoints and refined
+with the exact distance to each candidate great-circle arc, which answers
+"within the corridor buffer" without testing every segment
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_MILE = 1.609344
+
+
+def unit_vectors(lon, lat):
+    """(n, 3) unit vectors for longitudes/latitudes in degrees"""
+    lon, lat = np.radians(np.asarray(lon, dtype=float)), np.radians(np.asarray(lat, dtype=float))
+    return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1).reshape(-1, 3)
+
+
+def _chord(distance_km):
+    """Chord length on the unit sphere for a great-circle distance"""
+    return 2.0 * np.sin(np.minimum(np.asarray(distance_km, dtype=float) / EARTH_RADIUS_KM, np.pi) / 2.0)
+
+
+def _arc_km(chord):
+    """Great-circle distance for a chord length on the unit sphere"""
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2.0, 0.0, 1.0))
+
+
+def great_circle_km(lon1, lat1, lon2, lat2):
+    """Haversine distance in km (broadcasts over arrays)"""
+    lon1, lat1, lon2, lat2 = map(np.radians, (lon1, lat1, lon2, lat2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+class PointIndex:
+    """
+    Nearest-neighbour and radius queries over named points (county centroids, venues)
+    Query results are names with distances in km
+    """
+
+    def __init__(self, lon, lat, names):
+        self.names = list(names)
+        self.tree = cKDTree(unit_vectors(lon, lat))
+
+    @classmethod
+    def from_features(cls, features, name_field='name'):
+        """Index GeoJSON Point features by one of their properties"""
+        lon, lat = np.array([f['geometry']['coordinates'][:2] for f in features], dtype=float).T
+        return cls(lon, lat, [f['properties'][name_field] for f in features])
+
+    def nearest(self, lon, lat, k=1):
+        """[(name, km), ...] for the k nearest points, closest first"""
+        chord, index = self.tree.query(unit_vectors(lon, lat)[0], k=min(k, len(self.names)))
+        chord, index = np.atleast_1d(chord), np.atleast_1d(index)
+        return [(self.names[i], float(d)) for i, d in zip(index, _arc_km(chord))]
+
+    def nearest_many(self, lon, lat):
+        """Name and km of the nearest point for every query location"""
+        chord, index = self.tree.query(unit_vectors(lon, lat))
+        return [self.names[i] for i in index], _arc_km(chord)
+
+    def within(self, lon, lat, radius_km):
+        """[(name, km), ...] for every point within radius_km, closest first"""
+        query = unit_vectors(lon, lat)[0]
+        index = self.tree.query_ball_point(query, _chord(radius_km))
+        distance = _arc_km(np.linalg.norm(self.tree.data[index] - query, axis=1))
+        order = np.argsort(distance)
+        return [(self.names[index[i]], float(distance[i])) for i in order]
+
+
+class LineIndex:
+    """
+    Distance from points to a set of polylines (highway routes)
+    Each polyline is split into great-circle segments; a KD-tree over segment
+    midpoints narrows a query to the segments that can be within reach
+    """
+
+    def __init__(self, lines, names=None):
+        starts, ends, owner = [], [], []
+        for i, line in enumerate(lines):
+            points = unit_vectors(*np.asarray(line, dtype=float)[:, :2].T)
+            starts.append(points[:-1])
+            ends.append(points[1:])
+            owner.append(np.full(len(points) - 1, i))
+        self.names = list(names) if names is not None else list(range(len(lines)))
+        self.starts, self.ends, self.owner = np.concatenate(starts), np.concatenate(ends), np.concatenate(owner)
+
+        midpoints = self.starts + self.ends
+        length = np.linalg.norm(midpoints, axis=1, keepdims=True)
+        self.tree = cKDTree(midpoints / np.where(length == 0, 1.0, length))
+        # Farthest any point of a segment can be from its midpoint (chord); pads candidate searches
+        self.reach = float(np.max(np.linalg.norm(self.starts - self.tree.data, axis=1), initial=0.0))
+
+        normal = np.cross(self.starts, self.ends)
+        norm = np.linalg.norm(normal, axis=1, keepdims=True)
+        self.normals = np.where(norm == 0, 0.0, normal / np.where(norm == 0, 1.0, norm))
+
+    def _segment_km(self, points, segments):
+        """Exact great-circle distance from each point to the arc of its matching segment"""
+        a, b, n = self.starts[segments], self.ends[segments], self.normals[segments]
+        offset = np.einsum('ij,ij->i', points, n)
+        foot = points - offset[:, None] * n
+        # The foot of the perpendicular lies on the arc when it is between both ends
+        on_arc = ((np.einsum('ij,ij->i', np.cross(a, foot), n) >= 0)
+                  & (np.einsum('ij,ij->i', np.cross(foot, b), n) >= 0)
+                  & np.any(n != 0, axis=1))
+        to_arc = EARTH_RADIUS_KM * np.arcsin(np.clip(np.abs(offset), 0.0, 1.0))
+        to_ends = _arc_km(np.minimum(np.linalg.norm(points - a, axis=1), np.linalg.norm(points - b, axis=1)))
+        return np.where(on_arc, to_arc, to_ends)
+
+    def _candidates(self, points, chord):
+        """Flattened (query, segment) pairs whose midpoint is within chord + reach"""
+        hits = self.tree.query_ball_point(points, np.asarray(chord) + self.reach)
+        counts = np.fromiter((len(h) for h in hits), dtype=int, count=len(hits))
+        query = np.repeat(np.arange(len(points)), counts)
+        segments = np.fromiter((s for h in hits for s in h), dtype=int, count=counts.sum())
+        return query, segments
+
+    def distance(self, lon, lat):
+        """km from every query location to the closest line, and that line's name"""
+        points = unit_vectors(lon, lat)
+        # The nearest midpoint's segment bounds the answer; only segments whose
+        # midpoint could beat that bound need the exact test
+        _, first = self.tree.query(points)
+        bound = self._segment_km(points, first)
+        query, segments = self._candidates(points, _chord(bound))
+        distance = self._segment_km(points[query], segments)
+
+        best = np.full(len(points), np.inf)
+        np.minimum.at(best, query, distance)
+        nearest = np.empty(len(points), dtype=int)
+        nearest[query[distance == best[query]]] = segments[distance == best[query]]
+        return best, [self.names[i] for i in self.owner[nearest]]
+
+    def within(self, lon, lat, buffer_km):
+        """Boolean mask of the query locations inside the buffer around any line"""
+        points = unit_vectors(lon, lat)
+        query, segments = self._candidates(points, np.full(len(points), _chord(buffer_km)))
+        inside = np.zeros(len(points), dtype=bool)
+        inside[query[self._segment_km(points[query], segments) <= buffer_km]] = True
+        return inside
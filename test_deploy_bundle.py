@@ -0,0 +1,63 @@
+"""
+Tests for deploy_bundle: which files are published and the netlify.toml it writes
+Run from this directory: python -m pytest test_deploy_bundle.py
+"""
+
+import json
+import os
+
+from deploy_bundle import MANIFEST, asset_redirects, build_bundle
+
+NETLIFY_TOML = '''[build]
+  publish = "."
+
+[[redirects]]
+  from = "/*"
+  to = "/index.html"
+  status = 200
+'''
+
+
+def write(root, files):
+    for path, content in files.items():
+        os.makedirs(os.path.dirname(os.path.join(root, path)) or root, exist_ok=True)
+        with open(os.path.join(root, path), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+
+def test_only_referenced_files_are_published(tmp_path):
+    source, output = tmp_path / 'deploy', tmp_path / 'dist'
+    write(source, {
+        'index.html': '<img src="images/logo.png"><script>fetch("data/layer.geojson")</script>',
+        'netlify.toml': NETLIFY_TOML,
+        'data/layer.geojson': '{"icon": "images/marker.png"}',
+        'data/old_layer.geojson': '{}',
+        'data/workbook.xlsx': 'private',
+        'images/logo.png': 'logo',
+        'images/marker.png': 'marker',
+        'images/unused.png': 'unused',
+    })
+    totals = build_bundle(str(source), str(output))
+
+    assert totals['skipped'] == ['data/old_layer.geojson', 'data/workbook.xlsx', 'images/unused.png']
+    with open(output / MANIFEST, encoding='utf-8') as f:
+        names = json.load(f)
+    # Reached through data/layer.geojson, not a page
+    assert set(names) == {'data/layer.geojson', 'images/logo.png', 'images/marker.png'}
+    published = {os.path.relpath(os.path.join(directory, name), output).replace(os.sep, '/')
+                 for directory, _, files in os.walk(output) for name in files}
+    assert not {path for path in published if 'old_layer' in path or 'workbook' in path or 'unused' in path}
+    assert names['data/layer.geojson'] in (output / 'index.html').read_text(encoding='utf-8')
+
+
+def test_asset_redirects_come_before_the_fallback():
+    toml = asset_redirects(NETLIFY_TOML, {'images', 'data'})
+    data, images, fallback = (toml.index(f'from = "{pattern}"') for pattern in ['/data/*', '/images/*', '/*'])
+    assert data < images < fallback
+    assert toml.count('status = 404') == 2
+    assert toml.startswith('[build]')
+
+
+def test_asset_redirects_without_existing_redirects():
+    toml = asset_redirects('[build]\n  publish = "."\n', {'data'})
+    assert toml.index('[build]') < toml.index('from = "/data/*"')
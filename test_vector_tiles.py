@@ -0,0 +1,128 @@
+"""
+Tests for the PMTiles v3 pieces of vector_tiles: tile IDs, directory encoding and header layout
+Run from this directory: python -m pytest test_vector_tiles.py
+"""
+
+import gzip
+import struct
+
+import pytest
+
+from vector_tiles import _HEADER_SIZE, _encode_directory, encode_tile, write_pmtiles, zxy_to_tile_id
+
+HEADER_FORMAT = '<7sBQQQQQQQQQQQBBBBBBiiiiBii'
+HEADER_FIELDS = ['magic', 'version', 'root_offset', 'root_length', 'metadata_offset', 'metadata_length',
+                 'leaves_offset', 'leaves_length', 'data_offset', 'data_length', 'addressed_tiles',
+                 'tile_entries', 'tile_contents', 'clustered', 'internal_compression', 'tile_compression',
+                 'tile_type', 'min_zoom', 'max_zoom', 'min_lon_e7', 'min_lat_e7', 'max_lon_e7',
+                 'max_lat_e7', 'center_zoom', 'center_lon_e7', 'center_lat_e7']
+
+
+def read_varints(data):
+    """Every unsigned varint in data, in order"""
+    values, value, shift = [], 0, 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            values.append(value)
+            value, shift = 0, 0
+    assert shift == 0, 'truncated varint'
+    return values
+
+
+def decode_directory(compressed):
+    """(tile_id, offset, length, run_length) entries of a gzipped PMTiles directory, as the spec reads them"""
+    values = read_varints(gzip.decompress(compressed))
+    count, values = values[0], values[1:]
+    assert len(values) == 4 * count
+    deltas, runs, lengths, offsets = (values[i * count:(i + 1) * count] for i in range(4))
+    entries, tile_id = [], 0
+    for i in range(count):
+        tile_id += deltas[i]
+        offset = entries[-1][1] + entries[-1][2] if offsets[i] == 0 and i > 0 else offsets[i] - 1
+        entries.append((tile_id, offset, lengths[i], runs[i]))
+    return entries
+
+
+def read_header(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    assert struct.calcsize(HEADER_FORMAT) == _HEADER_SIZE
+    return dict(zip(HEADER_FIELDS, struct.unpack_from(HEADER_FORMAT, data))), data
+
+
+@pytest.mark.parametrize('zxy, tile_id', [
+    ((0, 0, 0), 0),
+    ((1, 0, 0), 1), ((1, 0, 1), 2), ((1, 1, 1), 3), ((1, 1, 0), 4),
+    ((2, 0, 0), 5),
+    ((12, 3423, 1763), 19078479),
+])
+def test_tile_ids_match_the_spec(zxy, tile_id):
+    assert zxy_to_tile_id(*zxy) == tile_id
+
+
+@pytest.mark.parametrize('z', range(7))
+def test_tile_ids_fill_each_zoom_exactly(z):
+    first = (4 ** z - 1) // 3
+    ids = {zxy_to_tile_id(z, x, y) for x in range(1 << z) for y in range(1 << z)}
+    assert ids == set(range(first, first + 4 ** z))
+
+
+def test_hilbert_neighbours_are_adjacent_tiles():
+    z = 5
+    position = {zxy_to_tile_id(z, x, y): (x, y) for x in range(1 << z) for y in range(1 << z)}
+    ordered = [position[tile_id] for tile_id in sorted(position)]
+    assert all(abs(x1 - x2) + abs(y1 - y2) == 1 for (x1, y1), (x2, y2) in zip(ordered, ordered[1:]))
+
+
+def test_directory_round_trips():
+    entries = [(0, 0, 10, 1), (1, 10, 20, 1), (5, 30, 7, 3),  # contiguous offsets are stored as 0
+               (300, 100, 200, 1), (70000, 5, 10, 1), (2 ** 40, 300, 1, 1)]
+    assert decode_directory(_encode_directory(entries)) == entries
+
+
+def test_directory_varints_are_columnar():
+    raw = read_varints(gzip.decompress(_encode_directory([(3, 0, 5, 1), (200, 5, 129, 2)])))
+    # count, tile ID deltas, run lengths, lengths, offsets + 1 (0 = follows the previous tile)
+    assert raw == [2, 3, 197, 1, 2, 5, 129, 1, 0]
+
+
+def test_header_layout_and_sections(tmp_path):
+    tiles = {(z, x, y): encode_tile({'points': [(1, [(x * 64 + 10, y * 64 + 20)], {'z': z})]})
+             for z in range(3) for x in range(1 << z) for y in range(1 << z)}
+    # Two identical neighbours at zoom 3 share one stored copy (run length 2)
+    duplicate = encode_tile({'points': [(1, [(1, 1)], {'same': True})]})
+    tiles[(3, 0, 0)] = tiles[(3, 0, 1)] = duplicate
+    bounds = (-87.6, 24.5, -80.0, 31.0)
+    path = tmp_path / 'layers.pmtiles'
+    size = write_pmtiles(path, tiles, {'name': 'test'}, bounds, min_zoom=0, max_zoom=3)
+
+    header, data = read_header(path)
+    assert header['magic'] == b'PMTiles' and header['version'] == 3
+    assert size == len(data) == header['data_offset'] + header['data_length']
+    assert header['root_offset'] == _HEADER_SIZE
+    assert header['metadata_offset'] == header['root_offset'] + header['root_length']
+    assert header['leaves_offset'] == header['metadata_offset'] + header['metadata_length']
+    assert header['data_offset'] == header['leaves_offset'] + header['leaves_length']
+    assert header['leaves_length'] == 0
+    assert (header['addressed_tiles'], header['tile_entries'], header['tile_contents']) == \
+           (len(tiles), len(tiles) - 1, len(tiles) - 1)
+    assert (header['clustered'], header['internal_compression'], header['tile_compression'],
+            header['tile_type']) == (1, 2, 2, 1)
+    assert (header['min_zoom'], header['max_zoom'], header['center_zoom']) == (0, 3, 1)
+    assert [header[f'{name}_e7'] for name in ['min_lon', 'min_lat', 'max_lon', 'max_lat']] == \
+           [round(value * 1e7) for value in bounds]
+
+    metadata = data[header['metadata_offset']:header['metadata_offset'] + header['metadata_length']]
+    assert gzip.decompress(metadata) == b'{"name":"test"}'
+
+    # Every tile is found through the root directory
+    entries = decode_directory(data[header['root_offset']:header['root_offset'] + header['root_length']])
+    by_id = {zxy_to_tile_id(*zxy): tile for zxy, tile in tiles.items()}
+    found = {}
+    for tile_id, offset, length, run_length in entries:
+        start = header['data_offset'] + offset
+        for i in range(run_length):
+            found[tile_id + i] = gzip.decompress(data[start:start + length])
+    assert found == by_id
@@ -0,0 +1,411 @@
+"""
+Vector tiles for the map layers
+Cuts GeoJSON Point/LineString features into Mapbox Vector Tiles (MVT) for a range of
+zooms and packs them into a single PMTiles v3 archive that can be served as a static
+file (clients fetch only the tiles in view with HTTP range requests). Geometry is
+snapped to each zoom's tile grid, so low zooms carry proportionally fewer vertices.
+Only the standard library and NumPy are needed
+"""
+
+import gzip
+import json
+import math
+import struct
+
+import numpy as np
+
+EXTENT = 4096
+# Pixels of neighbouring tile included around each tile, so symbols are not cut at edges
+BUFFER = 64
+
+MIN_ZOOM = 5
+MAX_ZOOM = 11
+
+# Web Mercator latitude limit
+_MAX_LAT = 85.0511287798
+
+# PMTiles enums
+_COMPRESSION_NONE, _COMPRESSION_GZIP = 1, 2
+_TILE_TYPE_MVT = 1
+_HEADER_SIZE = 127
+_ROOT_DIRECTORY_LIMIT = 16384 - _HEADER_SIZE
+
+
+# ----- Protocol buffer encoding -----
+
+_SMALL_VARINTS = [bytes((value,)) for value in range(0x80)]
+
+
+def _varint(value):
+    if value < 0x80:
+        return _SMALL_VARINTS[value]
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def _field(number, wire_type, payload):
+    key = _varint((number << 3) | wire_type)
+    if wire_type == 2:
+        return key + _varint(len(payload)) + payload
+    return key + payload
+
+
+def _packed(number, values):
+    return _field(number, 2, b''.join(_varint(value) for value in values))
+
+
+def _encode_value(value):
+    """MVT Value message"""
+    if isinstance(value, bool):
+        return _field(7, 0, _varint(int(value)))
+    if isinstance(value, int):
+        if value >= 0:
+            return _field(5, 0, _varint(value))
+        return _field(6, 0, _varint(_zigzag(value) & 0xFFFFFFFFFFFFFFFF))
+    if isinstance(value, float):
+        return _field(3, 1, struct.pack('<d', value))
+    return _field(1, 2, str(value).encode('utf-8'))
+
+
+def _encode_geometry(geometry_type, parts):
+    """Command stream for a point set (type 1) or line parts (type 2) in tile coordinates"""
+    commands, cursor_x, cursor_y = [], 0, 0
+
+    def deltas(points):
+        nonlocal cursor_x, cursor_y
+        for x, y in points:
+            commands.append(_zigzag(x - cursor_x))
+            commands.append(_zigzag(y - cursor_y))
+            cursor_x, cursor_y = x, y
+
+    if geometry_type == 1:
+        commands.append(1 | (len(parts) << 3))
+        deltas(parts)
+    else:
+        for part in parts:
+            commands.append(1 | (1 << 3))
+            deltas(part[:1])
+            commands.append(2 | ((len(part) - 1) << 3))
+            deltas(part[1:])
+    return commands
+
+
+def encode_tile(layers):
+    """
+    Encode {layer name: [(geometry_type, parts, properties), ...]} as an MVT tile
+    geometry_type is 1 (points: a list of (x, y)) or 2 (lines: a list of (x, y) lists)
+    """
+    tile = bytearray()
+    for name, features in layers.items():
+        keys, values = {}, {}
+        encoded_features = bytearray()
+        for feature_id, (geometry_type, parts, properties) in enumerate(features, start=1):
+            tags = []
+            for key, value in properties.items():
+                if value is None:
+                    continue
+                tags.append(keys.setdefault(key, len(keys)))
+                tags.append(values.setdefault((type(value).__name__, value), len(values)))
+            body = (_field(1, 0, _varint(feature_id)) + _packed(2, tags) +
+                    _field(3, 0, _varint(geometry_type)) + _packed(4, _encode_geometry(geometry_type, parts)))
+            encoded_features += _field(2, 2, body)
+
+        layer = (_field(15, 0, _varint(2)) + _field(1, 2, name.encode('utf-8')) + bytes(encoded_features) +
+                 b''.join(_field(3, 2, key.encode('utf-8')) for key in keys) +
+                 b''.join(_field(4, 2, _encode_value(value)) for _, value in values) +
+                 _field(5, 0, _varint(EXTENT)))
+        tile += _field(3, 2, layer)
+    return bytes(tile)
+
+
+# ----- Projection and tiling -----
+
+def project(lon, lat, zoom):
+    """Web Mercator position in tile units at zoom (tile x, y = floor of the result)"""
+    lon = np.asarray(lon, dtype=float)
+    lat = np.clip(np.asarray(lat, dtype=float), -_MAX_LAT, _MAX_LAT)
+    scale = 2.0 ** zoom
+    x = (lon + 180.0) / 360.0 * scale
+    y = (1.0 - np.log(np.tan(np.radians(lat)) + 1.0 / np.cos(np.radians(lat))) / math.pi) / 2.0 * scale
+    return x, y
+
+
+def flat_properties(properties, years=None):
+    """
+    MVT values are scalars: a list aligned with `years` becomes name_<year> keys and
+    any other list or object is stored as a JSON string
+    """
+    flat = {}
+    for key, value in properties.items():
+        if isinstance(value, list) and years and len(value) == len(years):
+            flat.update({f"{key}_{year}": item for year, item in zip(years, value)})
+        elif isinstance(value, (list, dict)):
+            flat[key] = json.dumps(value, separators=(',', ':'))
+        else:
+            flat[key] = value
+    return flat
+
+
+def _clip_segment(start, end, low, high):
+    """
+    Liang-Barsky clip of one segment to the square [low, high]
+    Returns (start, end, start_moved, end_moved) or None if the segment is outside
+    """
+    (x0, y0), (x1, y1) = start, end
+    t0, t1 = 0.0, 1.0
+    dx, dy = x1 - x0, y1 - y0
+    for p, q in ((-dx, x0 - low), (dx, high - x0), (-dy, y0 - low), (dy, high - y0)):
+        if p == 0:
+            if q < 0:
+                return None
+        else:
+            t = q / p
+            if p < 0:
+                t0 = max(t0, t)
+            else:
+                t1 = min(t1, t)
+            if t0 > t1:
+                return None
+    clipped_start = (x0 + t0 * dx, y0 + t0 * dy) if t0 > 0 else start
+    clipped_end = (x0 + t1 * dx, y0 + t1 * dy) if t1 < 1 else end
+    return clipped_start, clipped_end, t0 > 0, t1 < 1
+
+
+def _clip_line(points, low, high):
+    """Split a line into the parts inside the square [low, high]"""
+    parts, current = [], []
+    for start, end in zip(points[:-1], points[1:]):
+        clipped = _clip_segment(start, end, low, high)
+        if clipped is None:
+            continue
+        clipped_start, clipped_end, start_moved, end_moved = clipped
+        if start_moved or not current:
+            if current:
+                parts.append(current)
+            current = [clipped_start]
+        current.append(clipped_end)
+        if end_moved:
+            parts.append(current)
+            current = []
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _snap(points):
+    """Round to the tile grid and drop repeated vertices; None if fewer than 2 remain"""
+    snapped = []
+    for x, y in points:
+        vertex = (int(round(x)), int(round(y)))
+        if not snapped or snapped[-1] != vertex:
+            snapped.append(vertex)
+    return snapped if len(snapped) >= 2 else None
+
+
+def _tile_range(low, high, zoom):
+    """Tile indices at zoom covering [low, high] in tile units, widened by the buffer"""
+    margin = BUFFER / EXTENT
+    return range(max(int(math.floor(low - margin)), 0), min(int(math.floor(high + margin)), 2 ** zoom - 1) + 1)
+
+
+def _in_zoom_band(properties, zoom):
+    """Features may limit themselves to a zoom band with min_zoom/max_zoom properties"""
+    return properties.get('min_zoom', -math.inf) <= zoom <= properties.get('max_zoom', math.inf)
+
+
+def tile_features(layers, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM):
+    """
+    Assign features to tiles for every zoom
+    layers is {name: GeoJSON FeatureCollection dict}; a top-level "years" member is
+    used to flatten per-year property lists, and features with min_zoom/max_zoom
+    properties only appear in that band. Returns {(z, x, y): {layer: [features]}}
+    in the form encode_tile() takes
+    """
+    tiles = {}
+
+    def add(zxy, name, feature):
+        tiles.setdefault(zxy, {}).setdefault(name, []).append(feature)
+
+    for name, collection in layers.items():
+        years = collection.get('years')
+        points = [f for f in collection['features'] if f['geometry']['type'] == 'Point']
+        lines = [f for f in collection['features'] if f['geometry']['type'] == 'LineString']
+        point_properties = [flat_properties(f['properties'], years) for f in points]
+        line_properties = [flat_properties(f['properties'], years) for f in lines]
+        point_coords = np.array([f['geometry']['coordinates'][:2] for f in points], dtype=float).reshape(-1, 2)
+
+        for zoom in range(min_zoom, max_zoom + 1):
+            # Points: every tile whose buffered area contains the point
+            x, y = project(point_coords[:, 0], point_coords[:, 1], zoom)
+            for px, py, properties in zip(x.tolist(), y.tolist(), point_properties):
+                if not _in_zoom_band(properties, zoom):
+                    continue
+                for tx in _tile_range(px, px, zoom):
+                    for ty in _tile_range(py, py, zoom):
+                        vertex = (int(round((px - tx) * EXTENT)), int(round((py - ty) * EXTENT)))
+                        add((zoom, tx, ty), name, (1, [vertex], properties))
+
+            # Lines: clip to each tile in the bounding box, then snap to the grid
+            for feature, properties in zip(lines, line_properties):
+                if not _in_zoom_band(properties, zoom):
+                    continue
+                coords = np.asarray(feature['geometry']['coordinates'], dtype=float)[:, :2]
+                lx, ly = project(coords[:, 0], coords[:, 1], zoom)
+                for tx in _tile_range(lx.min(), lx.max(), zoom):
+                    for ty in _tile_range(ly.min(), ly.max(), zoom):
+                        local = list(zip(((lx - tx) * EXTENT).tolist(), ((ly - ty) * EXTENT).tolist()))
+                        parts = [_snap(part) for part in _clip_line(local, -BUFFER, EXTENT + BUFFER)]
+                        parts = [part for part in parts if part]
+                        if parts:
+                            add((zoom, tx, ty), name, (2, parts, properties))
+    return tiles
+
+
+# ----- PMTiles v3 archive -----
+
+def zxy_to_tile_id(z, x, y):
+    """PMTiles tile ID: tiles of lower zooms first, then the Hilbert curve index within z"""
+    tile_id = ((1 << (2 * z)) - 1) // 3
+    for a in range(z - 1, -1, -1):
+        s = 1 << a
+        rx, ry = s & x, s & y
+        tile_id += ((3 * rx) ^ ry) << a
+        if ry == 0:
+            if rx != 0:
+                x, y = s - 1 - x, s - 1 - y
+            x, y = y, x
+    return tile_id
+
+
+def _encode_directory(entries):
+    """entries: (tile_id, offset, length, run_length) sorted by tile_id"""
+    out = bytearray(_varint(len(entries)))
+    previous = 0
+    for tile_id, _, _, _ in entries:
+        out += _varint(tile_id - previous)
+        previous = tile_id
+    for _, _, _, run_length in entries:
+        out += _varint(run_length)
+    for _, _, length, _ in entries:
+        out += _varint(length)
+    for i, (_, offset, _, _) in enumerate(entries):
+        if i > 0 and offset == entries[i - 1][1] + entries[i - 1][2]:
+            out += _varint(0)
+        else:
+            out += _varint(offset + 1)
+    return gzip.compress(bytes(out), mtime=0)
+
+
+def _build_directories(entries, leaf_size=4096):
+    """Root directory bytes and leaf directory bytes; leaves are used when the root would not fit"""
+    root = _encode_directory(entries)
+    if len(root) <= _ROOT_DIRECTORY_LIMIT:
+        return root, b''
+    while True:
+        leaves, root_entries = bytearray(), []
+        for start in range(0, len(entries), leaf_size):
+            chunk = entries[start:start + leaf_size]
+            leaf = _encode_directory(chunk)
+            root_entries.append((chunk[0][0], len(leaves), len(leaf), 0))
+            leaves += leaf
+        root = _encode_directory(root_entries)
+        if len(root) <= _ROOT_DIRECTORY_LIMIT:
+            return root, bytes(leaves)
+        leaf_size *= 2
+
+
+def write_pmtiles(path, tiles, metadata, bounds, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM):
+    """
+    Write {(z, x, y): MVT bytes} to a PMTiles v3 archive
+    Tiles are gzip-compressed and stored in tile ID order; runs of consecutive
+    identical tiles share one copy. bounds is (min_lon, min_lat, max_lon, max_lat).
+    Returns the archive size in bytes
+    """
+    entries, data = [], bytearray()
+    contents = 0
+    for tile_id, tile in sorted((zxy_to_tile_id(*zxy), tile) for zxy, tile in tiles.items()):
+        compressed = gzip.compress(tile, mtime=0)
+        previous = entries[-1] if entries else None
+        if previous and previous[0] + previous[3] == tile_id and \
+                data[previous[1]:previous[1] + previous[2]] == compressed:
+            entries[-1] = previous[:3] + (previous[3] + 1,)
+            continue
+        entries.append((tile_id, len(data), len(compressed), 1))
+        data += compressed
+        contents += 1
+
+    root, leaves = _build_directories(entries)
+    metadata_bytes = gzip.compress(json.dumps(metadata, separators=(',', ':')).encode('utf-8'), mtime=0)
+
+    root_offset = _HEADER_SIZE
+    metadata_offset = root_offset + len(root)
+    leaves_offset = metadata_offset + len(metadata_bytes)
+    data_offset = leaves_offset + len(leaves)
+    min_lon, min_lat, max_lon, max_lat = bounds
+    center_zoom = (min_zoom + max_zoom) // 2
+
+    def e7(value):
+        return int(round(value * 1e7))
+
+    header = b'PMTiles' + struct.pack(
+        '<BQQQQQQQQQQQBBBBBBiiiiBii', 3,
+        root_offset, len(root), metadata_offset, len(metadata_bytes), leaves_offset, len(leaves),
+        data_offset, len(data), len(tiles), len(entries), contents,
+        1, _COMPRESSION_GZIP, _COMPRESSION_GZIP, _TILE_TYPE_MVT, min_zoom, max_zoom,
+        e7(min_lon), e7(min_lat), e7(max_lon), e7(max_lat),
+        center_zoom, e7((min_lon + max_lon) / 2), e7((min_lat + max_lat) / 2))
+
+    with open(path, 'wb') as f:
+        for block in (header, root, metadata_bytes, leaves, data):
+            f.write(block)
+    return data_offset + len(data)
+
+
+def vector_layer_fields(collection):
+    """TileJSON field types of a layer's flattened properties"""
+    fields = {}
+    years = collection.get('years')
+    for feature in collection['features']:
+        for key, value in flat_properties(feature['properties'], years).items():
+            if isinstance(value, bool):
+                fields[key] = 'Boolean'
+            elif isinstance(value, (int, float)):
+                fields[key] = 'Number'
+            else:
+                fields[key] = 'String'
+    return fields
+
+
+def layer_bounds(layers):
+    """(min_lon, min_lat, max_lon, max_lat) over every feature"""
+    coords = [point for collection in layers.values() for feature in collection['features']
+              for point in (feature['geometry']['coordinates'] if feature['geometry']['type'] == 'LineString'
+                            else [feature['geometry']['coordinates']])]
+    coords = np.asarray(coords, dtype=float)[:, :2]
+    return (*coords.min(axis=0).tolist(), *coords.max(axis=0).tolist())
+
+
+def build_pmtiles(path, layers, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM, name='Florida layers'):
+    """Tile {layer name: FeatureCollection} and write the archive; returns (tile count, bytes)"""
+    tiles = {zxy: encode_tile(tile_layers)
+             for zxy, tile_layers in tile_features(layers, min_zoom, max_zoom).items()}
+    metadata = {
+        'name': name,
+        'format': 'pbf',
+        'vector_layers': [{'id': layer, 'fields': vector_layer_fields(collection),
+                           'minzoom': min_zoom, 'maxzoom': max_zoom}
+                          for layer, collection in layers.items()]
+    }
+    size = write_pmtiles(path, tiles, metadata, layer_bounds(layers), min_zoom, max_zoom)
+    return len(tiles), size